@@ -0,0 +1,220 @@
+"""
+Startup benchmarks: wall time and ``-X importtime`` breakdown of CLI commands.
+
+Every command runs in a fresh interpreter with a scratch ``HOME`` and offline backends (see ``stubs.py``). The
+results are written to a JSON report; commands whose median wall time exceeds their budget fail the run.
+
+Usage::
+
+    python benchmarks/startup.py [--repeat 5] [--output startup.json] [--budgets benchmarks/budgets.json]
+                                 [--budget "app list=900"] [--command "context show"]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+from typing import Dict, List, Optional
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARKS_DIR)
+STUBS = os.path.join(BENCHMARKS_DIR, "stubs.py")
+
+COMMANDS = [
+    "--help",
+    "version",
+    "system completion bash",
+    "context show",
+    "app list",
+]
+
+
+def environment(home: str) -> Dict[str, str]:
+    env = os.environ.copy()
+    env["HOME"] = home
+    env["PYTHONPATH"] = os.pathsep.join([ROOT_DIR] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+    # cached bytecode, like an installed CLI
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def execute(command: str, env: Dict[str, str], cwd: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    options = ["-X", "importtime"] if importtime else []
+    return subprocess.run(
+        [sys.executable] + options + [STUBS, "run"] + command.split(),
+        env=env,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+
+def parse_importtime(stderr: str) -> List[dict]:
+    # import time: self [us] | cumulative | imported package
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append(
+            {
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        )
+
+    return modules
+
+
+def summarize_importtime(modules: List[dict], top: int) -> dict:
+    # top-level imports contain all nested ones
+    top_level = [module for module in modules if module["depth"] == 0]
+
+    packages = {}
+    for module in modules:
+        package = module["module"].split(".")[0]
+        packages[package] = round(packages.get(package, 0.0) + module["self_ms"], 3)
+
+    return {
+        "total_ms": round(sum(module["cumulative_ms"] for module in top_level), 3),
+        "modules": len(modules),
+        "packages": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]),
+        "top_self": sorted(modules, key=lambda module: module["self_ms"], reverse=True)[:top],
+        "top_cumulative": sorted(top_level, key=lambda module: module["cumulative_ms"], reverse=True)[:top],
+    }
+
+
+def benchmark(command: str, env: Dict[str, str], cwd: str, repeat: int, top: int) -> dict:
+    # warm-up: bytecode compilation, storage initialization
+    execute(command, env=env, cwd=cwd)
+
+    wall_ms = []
+    for _ in range(repeat):
+        start = perf_counter()
+        process = execute(command, env=env, cwd=cwd)
+        wall_ms.append((perf_counter() - start) * 1000)
+
+        if process.returncode != 0:
+            return {
+                "command": command,
+                "returncode": process.returncode,
+                "error": process.stderr.strip().splitlines()[-20:],
+            }
+
+    process = execute(command, env=env, cwd=cwd, importtime=True)
+    return {
+        "command": command,
+        "returncode": process.returncode,
+        "wall_ms": {
+            "min": round(min(wall_ms), 3),
+            "median": round(statistics.median(wall_ms), 3),
+            "mean": round(statistics.mean(wall_ms), 3),
+            "max": round(max(wall_ms), 3),
+            "runs": [round(value, 3) for value in wall_ms],
+        },
+        "importtime": summarize_importtime(parse_importtime(process.stderr), top=top),
+    }
+
+
+def load_budgets(path: Optional[str], overrides: List[str]) -> Dict[str, float]:
+    budgets = {}
+    if path:
+        with open(path) as f:
+            budgets.update(json.load(f))
+
+    for override in overrides:
+        command, _, value = override.rpartition("=")
+        if not command:
+            raise ValueError(f"Invalid budget (expected 'command=milliseconds'): {override}")
+        budgets[command] = float(value)
+
+    return budgets
+
+
+def check_budgets(results: List[dict], budgets: Dict[str, float], factor: float) -> List[str]:
+    violations = []
+    for result in results:
+        command = result["command"]
+        if result["returncode"] != 0:
+            violations.append(f"{command}: exited with {result['returncode']}")
+            continue
+
+        budget = budgets.get(command, None)
+        if budget is None:
+            continue
+
+        budget = budget * factor
+        result["budget_ms"] = budget
+        if result["wall_ms"]["median"] > budget:
+            violations.append(f"{command}: {result['wall_ms']['median']:.0f} ms (budget: {budget:.0f} ms)")
+
+    return violations
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Startup time benchmarks of the unikube CLI.")
+    parser.add_argument("--command", action="append", help="Command to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="Measured runs per command")
+    parser.add_argument("--top", type=int, default=15, help="Number of modules/packages in the import breakdown")
+    parser.add_argument("--output", default="startup.json", help="Path of the JSON report")
+    parser.add_argument(
+        "--budgets",
+        default=os.path.join(BENCHMARKS_DIR, "budgets.json"),
+        help="JSON file with the median wall time budget per command (milliseconds)",
+    )
+    parser.add_argument("--budget", action="append", default=[], help="Budget override, e.g. 'app list=900'")
+    parser.add_argument(
+        "--budget-factor", type=float, default=1.0, help="Scales all budgets, e.g. for slow CI machines"
+    )
+    args = parser.parse_args(argv)
+
+    commands = args.command or COMMANDS
+    try:
+        budgets = load_budgets(args.budgets, args.budget)
+    except ValueError as e:
+        parser.error(str(e))
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="unikube-benchmark-") as home:
+        env = environment(home)
+        subprocess.run([sys.executable, STUBS, "seed"], env=env, cwd=home, check=True)
+
+        for command in commands:
+            result = benchmark(command, env=env, cwd=home, repeat=args.repeat, top=args.top)
+            results.append(result)
+
+            if result["returncode"] == 0:
+                print(
+                    f"{command:<25} median {result['wall_ms']['median']:8.1f} ms   "
+                    f"imports {result['importtime']['total_ms']:8.1f} ms ({result['importtime']['modules']} modules)"
+                )
+            else:
+                print(f"{command:<25} failed ({result['returncode']})")
+
+    violations = check_budgets(results, budgets, factor=args.budget_factor)
+    report = {
+        "python": sys.version,
+        "platform": sys.platform,
+        "repeat": args.repeat,
+        "results": results,
+        "violations": violations,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for violation in violations:
+        print(f"Budget exceeded: {violation}", file=sys.stderr)
+
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
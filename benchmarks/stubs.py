@@ -0,0 +1,312 @@
+"""
+Offline backends for the startup benchmarks.
+
+The stubs are installed with an import hook: a backend module is patched right after it has been imported by the CLI,
+hence the import graph (and ``-X importtime``) of a benchmarked command is the same as without stubs.
+
+Usage (with ``HOME`` pointing to a scratch directory)::
+
+    python benchmarks/stubs.py seed
+    python benchmarks/stubs.py run app list
+"""
+
+import importlib.abc
+import os
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+BENCHMARK_EMAIL = "benchmark@unikube.io"
+ORGANIZATION_ID = "8b1f3fbc-2f3b-4c6f-9d27-31c2d9b2a101"
+PROJECT_ID = "0d7f1bd4-59c6-4c8e-8b39-5a3cbe2f6a02"
+DECK_ID = "e6c6a8f2-1f0e-4b45-a1f4-1f8f2a7c9d03"
+CLUSTER_NAME = "benchmark"
+K3D_CLUSTER_NAME = "unikube-benchmark"
+
+# GraphQL: response per top-level field (aliases are answered with the data of the aliased field)
+GRAPHQL_FIELDS = {
+    "organization": {"id": ORGANIZATION_ID, "title": "Benchmark Organization"},
+    "project": {"id": PROJECT_ID, "title": "Benchmark Project"},
+    "deck": {
+        "id": DECK_ID,
+        "title": "Benchmark Deck",
+        "environment": [{"namespace": "benchmark"}],
+        "project": {"id": PROJECT_ID},
+    },
+    "allOrganizations": {"results": [{"id": ORGANIZATION_ID, "title": "Benchmark Organization"}]},
+    "allProjects": {"results": [{"id": PROJECT_ID, "title": "Benchmark Project"}]},
+    "allDecks": {"results": [{"id": DECK_ID, "title": "Benchmark Deck"}]},
+}
+
+# subprocess: stdout per command prefix (the docker CLI is only used if the Engine API is not available)
+COMMANDS = {
+    ("docker", "ps"): f"k3d-{K3D_CLUSTER_NAME}-server-0\trancher/k3s\n",
+    ("docker", "version"): "Docker version 20.10.12, build e91ed57\n",
+    ("k3d", "cluster", "list"): f"{K3D_CLUSTER_NAME}   1/1   1/1   true\n",
+    ("k3d", "version"): "k3d version v5.4.1\nk3s version v1.22.7-k3s1 (default)\n",
+    ("kubectl", "version"): "Client Version: v1.22.7\n",
+    ("telepresence", "version"): "Client: v2.5.0 (api v3)\n",
+}
+
+
+def graphql_response(document, variable_values: dict = None) -> dict:
+    from graphql import OperationDefinitionNode
+
+    data = {}
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+
+        for selection in definition.selection_set.selections:
+            key = selection.alias.value if selection.alias else selection.name.value
+            data[key] = GRAPHQL_FIELDS.get(selection.name.value, None)
+
+    return data
+
+
+def patch_graphql_utils(module) -> None:
+    from graphql import ExecutionResult
+
+    def execute(self, document, variable_values=None, *args, **kwargs):
+        return ExecutionResult(data=graphql_response(document, variable_values))
+
+    module.PersistedQueryHTTPTransport.connect = lambda self: None
+    module.PersistedQueryHTTPTransport.close = lambda self: None
+    module.PersistedQueryHTTPTransport.execute = execute
+
+
+def patch_local_system(module) -> None:
+    class KubeAPI:
+        def __init__(self, provider_data, deck=None):
+            self._provider_data = provider_data
+            self._deck = deck
+
+        @property
+        def is_available(self):
+            return True
+
+        def get_pods(self):
+            created = datetime(2022, 1, 1, tzinfo=timezone.utc)
+            items = [
+                SimpleNamespace(
+                    metadata=SimpleNamespace(name=f"app-{index}", creation_timestamp=created),
+                    status=SimpleNamespace(
+                        phase="Running",
+                        container_statuses=[SimpleNamespace(ready=True), SimpleNamespace(ready=index % 2 == 0)],
+                    ),
+                )
+                for index in range(10)
+            ]
+            return SimpleNamespace(items=items)
+
+    module.KubeAPI = KubeAPI
+
+
+def patch_docker_api(module) -> None:
+    import json
+
+    containers = [
+        {
+            "Id": "0123456789ab" * 5 + "0123",
+            "Image": "rancher/k3s",
+            "Names": [f"/k3d-{K3D_CLUSTER_NAME}-server-0"],
+            "State": "running",
+            "Labels": {"k3d.cluster": K3D_CLUSTER_NAME},
+        }
+    ]
+
+    def request(self, method, path, params=None):
+        if path == "/_ping":
+            return 200, b"OK"
+        if path == "/containers/json":
+            return 200, json.dumps(containers).encode("utf-8")
+        if path == "/images/json":
+            return 200, b"[]"
+        return 204, b""
+
+    module.DockerEngineAPI.request = request
+
+
+def patch_subprocess(module) -> None:
+    popen, run = module.Popen, module.run
+
+    def stdout_for(cmd) -> str:
+        if isinstance(cmd, str):
+            cmd = cmd.split()
+
+        for prefix, stdout in COMMANDS.items():
+            if tuple(cmd[: len(prefix)]) == prefix:
+                return stdout
+
+        return None
+
+    class Popen:
+        def __init__(self, cmd, *args, **kwargs):
+            from io import StringIO
+
+            self.args = cmd
+            self.returncode = 0
+            self.stdout = StringIO(stdout_for(cmd) or "")
+            self.stderr = StringIO("")
+
+        def communicate(self, input=None, timeout=None):
+            return self.stdout.read(), ""
+
+        def wait(self, timeout=None):
+            return self.returncode
+
+        def poll(self):
+            return self.returncode
+
+        def terminate(self):
+            pass
+
+        def kill(self):
+            pass
+
+    def popen_stub(cmd, *args, **kwargs):
+        # unknown commands are executed
+        if stdout_for(cmd) is None:
+            return popen(cmd, *args, **kwargs)
+        return Popen(cmd, *args, **kwargs)
+
+    def run_stub(cmd, *args, **kwargs):
+        stdout = stdout_for(cmd)
+        if stdout is None:
+            return run(cmd, *args, **kwargs)
+
+        if not kwargs.get("text", False) and not kwargs.get("encoding", None):
+            stdout = stdout.encode("utf-8")
+        return module.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+    module.Popen = popen_stub
+    module.run = run_stub
+
+
+def patch_requests(module) -> None:
+    def get(url, *args, **kwargs):
+        if "api.github.com" not in url:
+            raise module.ConnectionError(f"The benchmarks are offline: {url}")
+
+        with open(os.path.join(os.path.dirname(__file__), "..", "VERSION")) as f:
+            tag_name = f.read()
+
+        response = module.Response()
+        response.status_code = 200
+        response._content = f'{{"tag_name": "{tag_name}"}}'.encode("utf-8")
+        return response
+
+    module.get = get
+
+
+PATCHES: Dict[str, Callable] = {
+    "subprocess": patch_subprocess,
+    "requests": patch_requests,
+    "unikube.graphql_utils": patch_graphql_utils,
+    "unikube.local.system": patch_local_system,
+    "unikube.local.docker_api": patch_docker_api,
+}
+
+
+class PatchLoader(importlib.abc.Loader):
+    def __init__(self, loader, patch: Callable):
+        self.loader = loader
+        self.patch = patch
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        self.patch(module)
+
+
+class PatchFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, patches: Dict[str, Callable]):
+        self.patches = patches
+
+    def find_spec(self, fullname, path, target=None):
+        patch = self.patches.get(fullname, None)
+        if patch is None:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                spec.loader = PatchLoader(spec.loader, patch)
+                return spec
+
+        return None
+
+
+def install(patches: Dict[str, Callable] = None) -> None:
+    patches = patches or PATCHES
+    for name, patch in patches.items():
+        # already imported (e.g. by the interpreter)
+        if name in sys.modules:
+            patch(sys.modules[name])
+
+    sys.meta_path.insert(0, PatchFinder(patches))
+
+
+def seed() -> None:
+    """
+    Writes the storage of a logged in user with a context and a running cluster for the project.
+    """
+    from time import time
+
+    import jwt
+
+    from unikube.authentication.types import AuthenticationData
+    from unikube.context.types import ContextData
+    from unikube.helpers import RELEASE_CACHE_KEY, get_current_version
+    from unikube.local.providers.k3d.storage import K3dLocalStorage
+    from unikube.local.providers.k3d.types import K3dData
+    from unikube.local.providers.manager import K8sClusterManager
+    from unikube.local.providers.types import K8sProviderData
+    from unikube.storage.cache import LocalStorageCache
+    from unikube.storage.general import LocalStorageGeneral
+    from unikube.storage.types import CacheData, GeneralData, UserData
+    from unikube.storage.user import LocalStorageUser
+
+    # not verified by the (stubbed) API, only its expiration is checked
+    access_token = jwt.encode({"exp": int(time()) + 60 * 60 * 24 * 365, "email": BENCHMARK_EMAIL}, "benchmark")
+
+    LocalStorageGeneral().set(
+        GeneralData(authentication=AuthenticationData(email=BENCHMARK_EMAIL, access_token=access_token))
+    )
+    LocalStorageUser(user_email=BENCHMARK_EMAIL).set(
+        UserData(
+            id=BENCHMARK_EMAIL,
+            context=ContextData(organization_id=ORGANIZATION_ID, project_id=PROJECT_ID, deck_id=DECK_ID),
+        )
+    )
+    K8sClusterManager().set(id=PROJECT_ID, data=K8sProviderData(id=PROJECT_ID, name=CLUSTER_NAME))
+    K3dLocalStorage().set(id=PROJECT_ID, data=K3dData(id=PROJECT_ID, name=K3D_CLUSTER_NAME))
+
+    # fresh release check, no background refresh
+    LocalStorageCache().set(
+        id=RELEASE_CACHE_KEY,
+        data=CacheData(id=RELEASE_CACHE_KEY, data=get_current_version().replace("-", "."), timestamp=time()),
+    )
+
+
+def run(args: List[str]) -> None:
+    install()
+
+    from unikube.commands import cli
+
+    cli(args, prog_name="unikube")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["seed"]:
+        seed()
+    elif sys.argv[1:2] == ["run"]:
+        run(sys.argv[2:])
+    else:
+        sys.exit(f"usage: {sys.argv[0]} seed | run <args>")
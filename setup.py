@@ -28,7 +28,7 @@ setup(
         "tabulate~=0.8.9",
         "pydantic>=1.7.3,<1.10.0",
         "pyyaml>=5.4",
-        "tinydb>=3.15.2,<4.8.0",
+        "tinydb>=4.7.0,<4.8.0",
         "requests>=2.25.1,<2.28.0",
         "pyjwt[crypto]>=2.0.1,<2.4.0",
         "gql>=3.2,<3.3",
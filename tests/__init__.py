@@ -0,0 +1,28 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+
+def temporary_storage(test_case: unittest.TestCase) -> str:
+    """
+    Writes the local storage (and the lock files) of a test case to a temporary directory instead of ~/.unikube, the
+    shared TinyDB handle is reset after the test. Returns the directory.
+    """
+    from unikube import settings
+    from unikube.storage.tinydb import TinyDatabase
+
+    directory = tempfile.TemporaryDirectory()
+    test_case.addCleanup(directory.cleanup)
+
+    patcher = patch.multiple(
+        settings,
+        CLI_CONFIG_FILE=os.path.join(directory.name, "config"),
+        CLI_STORAGE_FILE=os.path.join(directory.name, "config.sqlite3"),
+        TOKEN_REFRESH_LOCK_FILE=os.path.join(directory.name, ".token_refresh.lock"),
+    )
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+    test_case.addCleanup(TinyDatabase.reload)
+
+    return directory.name
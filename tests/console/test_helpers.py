@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from gql.transport.exceptions import TransportQueryError
+
+from unikube.cli.console.helpers import DisplayNameLoader
+from unikube.graphql_utils import GraphQL
+
+ORGANIZATION_ID = "51b1d6b3-8375-4859-94f6-73afc05d7275"
+PROJECT_ID = "8a6b7a9b-66b6-4b10-a7e0-bf6e3dc2ea95"
+
+
+class DisplayNameLoaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ctx = MagicMock()
+        self.loader = DisplayNameLoader()
+
+    def test_batched_query(self):
+        data = {"organization0": {"title": "Acme"}, "project1": {"title": "Shop"}}
+        with patch.object(GraphQL, "query", return_value=data) as query:
+            self.loader.load("organization", ORGANIZATION_ID)
+            self.loader.load("project", PROJECT_ID)
+
+            self.assertEqual(self.loader.get(self.ctx, "organization", ORGANIZATION_ID), "Acme")
+            self.assertEqual(self.loader.get(self.ctx, "project", PROJECT_ID), "Shop")
+            query.assert_called_once()
+            self.assertEqual(query.call_args.kwargs["query_variables"], {"id0": ORGANIZATION_ID, "id1": PROJECT_ID})
+
+    def test_memoized(self):
+        with patch.object(GraphQL, "query", return_value={"deck0": {"title": "Dev"}}) as query:
+            self.assertEqual(self.loader.get(self.ctx, "deck", PROJECT_ID), "Dev")
+            self.assertEqual(self.loader.get(self.ctx, "deck", PROJECT_ID), "Dev")
+            query.assert_called_once()
+
+    def test_primed(self):
+        self.loader.prime("project", PROJECT_ID, "Shop")
+        with patch.object(GraphQL, "query") as query:
+            self.assertEqual(self.loader.get(self.ctx, "project", PROJECT_ID), "Shop")
+            query.assert_not_called()
+
+    def test_partial_result(self):
+        error = TransportQueryError("not found", data={"organization0": None, "project1": {"title": "Shop"}})
+        with patch.object(GraphQL, "query", side_effect=error):
+            self.loader.load("organization", ORGANIZATION_ID)
+            self.assertEqual(self.loader.get(self.ctx, "project", PROJECT_ID), "Shop")
+            self.assertIsNone(self.loader.get(self.ctx, "organization", ORGANIZATION_ID))
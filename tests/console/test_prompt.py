@@ -1,4 +1,4 @@
-from unikube.cli.console.input import (
+from unikube.cli.console.prompt import (
     exclude_by_identifiers,
     filter_by_identifiers,
     get_identifier_or_pass,
@@ -0,0 +1,60 @@
+import unittest
+from time import time
+
+from tests import temporary_storage
+from unikube import settings
+from unikube.storage.index import LocalStorageResolutionIndex
+
+ORGANIZATION_ID = "11111111-1111-4111-8111-111111111111"
+OTHER_ORGANIZATION_ID = "22222222-2222-4222-8222-222222222222"
+
+
+class LocalStorageResolutionIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_storage(self)
+        self.local_storage_index = LocalStorageResolutionIndex(user_email="index@unikube.io")
+
+    def _project(self, id: str, title: str, organization_id: str) -> dict:
+        return {"id": id, "title": title, "organization": {"id": organization_id, "title": "Organization"}}
+
+    def test_lookup(self):
+        self.local_storage_index.update("project", [self._project("1", "My Project", ORGANIZATION_ID)])
+
+        self.assertEqual(self.local_storage_index.lookup("project", "my-project"), "1")
+        self.assertEqual(self.local_storage_index.lookup("project", "My Project"), "1")
+        self.assertIsNone(self.local_storage_index.lookup("project", "other-project"))
+
+    def test_lookup_ambiguous(self):
+        self.local_storage_index.update(
+            "project",
+            [
+                self._project("1", "My Project", ORGANIZATION_ID),
+                self._project("2", "My Project", OTHER_ORGANIZATION_ID),
+            ],
+        )
+
+        self.assertIsNone(self.local_storage_index.lookup("project", "my-project"))
+        self.assertEqual(self.local_storage_index.lookup("project", "my-project", organization_id=ORGANIZATION_ID), "1")
+
+    def test_update_scope(self):
+        self.local_storage_index.update(
+            "project",
+            [self._project("1", "My Project", ORGANIZATION_ID), self._project("2", "Project", OTHER_ORGANIZATION_ID)],
+        )
+
+        # only the projects of the given organization are replaced
+        self.local_storage_index.update(
+            "project", [self._project("3", "Renamed", ORGANIZATION_ID)], organization_id=ORGANIZATION_ID
+        )
+
+        self.assertIsNone(self.local_storage_index.lookup("project", "my-project"))
+        self.assertEqual(self.local_storage_index.lookup("project", "renamed"), "3")
+        self.assertEqual(self.local_storage_index.lookup("project", "project"), "2")
+
+    def test_lookup_outdated(self):
+        self.local_storage_index.update("organization", [{"id": "1", "title": "Organization"}])
+        data = self.local_storage_index.get()
+        data.organization[0].timestamp = time() - settings.CLI_CONTEXT_INDEX_TTL - 1
+        self.local_storage_index.set(data)
+
+        self.assertIsNone(self.local_storage_index.lookup("organization", "organization"))
@@ -0,0 +1,41 @@
+import fcntl
+import os
+import tempfile
+import unittest
+
+from unikube.storage.lock import FileLock
+
+
+class FileLockTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.path = os.path.join(directory.name, "test.lock")
+
+    def _locked(self) -> bool:
+        # lock attempt of another process (separate open file description)
+        with open(self.path, "a") as f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return True
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return False
+
+    def test_lock(self):
+        with FileLock(self.path):
+            self.assertTrue(self._locked())
+
+        self.assertFalse(self._locked())
+
+    def test_reentrant(self):
+        with FileLock(self.path):
+            with FileLock(self.path, timeout=0.1) as lock:
+                self.assertTrue(lock._acquired)
+
+            # still held by the outer lock
+            self.assertTrue(self._locked())
+
+        self.assertFalse(self._locked())
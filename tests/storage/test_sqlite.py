@@ -0,0 +1,79 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from unikube import settings
+from unikube.storage.cache import LocalStorageCache
+from unikube.storage.sqlite import SQLiteDatabase
+from unikube.storage.types import CacheData
+
+
+class SQLiteDatabaseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.path = os.path.join(directory.name, "config.sqlite3")
+        self.path_tinydb = os.path.join(directory.name, "config")
+
+        patcher = patch.multiple(settings, CLI_CONFIG_FILE=self.path_tinydb, CLI_STORAGE_FILE=self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_crud(self):
+        database = SQLiteDatabase(table_name="cache")
+        self.assertIsNone(database.select(id="test"))
+
+        database.update(id="test", data=CacheData(id="test", data={"a": 1}))
+        database.update(id="test", data=CacheData(id="test", data={"a": 2}))
+        self.assertEqual(database.select(id="test")["data"], {"a": 2})
+        self.assertEqual(len(database.all()), 1)
+
+        self.assertTrue(database.delete(id="test"))
+        self.assertFalse(database.delete(id="test"))
+
+    def test_tables(self):
+        SQLiteDatabase(table_name="cache").update(id="test", data=CacheData(id="test"))
+        self.assertIsNone(SQLiteDatabase(table_name="other").select(id="test"))
+
+    def test_wal(self):
+        database = SQLiteDatabase(table_name="cache")
+        self.assertEqual(database.connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_migration(self):
+        with open(self.path_tinydb, "w") as f:
+            json.dump({"cache": {"1": {"id": "test", "data": "migrated", "timestamp": 1.0}}}, f)
+
+        database = SQLiteDatabase(table_name="cache")
+        self.assertEqual(database.select(id="test")["data"], "migrated")
+
+        # only once
+        database.delete(id="test")
+        SQLiteDatabase._migrate(database.connection, path_tinydb=self.path_tinydb)
+        self.assertIsNone(database.select(id="test"))
+
+    def test_local_storage(self):
+        with patch.object(settings, "CLI_STORAGE_BACKEND", "sqlite"):
+            local_storage_cache = LocalStorageCache()
+            local_storage_cache.set(id="test", data=CacheData(id="test", data="sqlite"))
+
+            self.assertIsInstance(local_storage_cache.database, SQLiteDatabase)
+            self.assertEqual(local_storage_cache.get(id="test").data, "sqlite")
+
+        # written to the sqlite storage only
+        connection = sqlite3.connect(self.path)
+        self.assertEqual(connection.execute("SELECT count(*) FROM documents").fetchone()[0], 1)
+        self.assertFalse(os.path.exists(self.path_tinydb) and os.path.getsize(self.path_tinydb))
+
+    def test_transaction(self):
+        database = SQLiteDatabase(table_name="cache")
+
+        with self.assertRaises(ValueError):
+            with SQLiteDatabase.transaction():
+                database.update(id="test", data=CacheData(id="test"))
+                raise ValueError()
+
+        self.assertIsNone(database.select(id="test"))
@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from unikube import settings
+from unikube.storage.lock import FileLock
+from unikube.storage.tinydb import TinyDatabase
+from unikube.storage.types import CacheData
+
+
+class TinyDatabaseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.directory = directory.name
+        self.path = os.path.join(self.directory, "config")
+
+        patcher = patch.object(settings, "CLI_CONFIG_FILE", self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(TinyDatabase.reload)
+
+    def _read(self) -> dict:
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def test_shared_handle(self):
+        self.assertIs(TinyDatabase(table_name="a").db, TinyDatabase(table_name="b").db)
+
+    def test_write_back(self):
+        database = TinyDatabase(table_name="cache")
+        database.update(id="test", data=CacheData(id="test", data="cached"))
+        self.assertFalse(os.path.exists(self.path))
+
+        # shared between instances before the flush
+        self.assertEqual(TinyDatabase(table_name="cache").select(id="test")["data"], "cached")
+
+        TinyDatabase.flush()
+        self.assertEqual(list(self._read()["cache"].values())[0]["data"], "cached")
+        self.assertFalse([name for name in os.listdir(self.directory) if name.endswith(".tmp")])
+
+    def test_reload(self):
+        database = TinyDatabase(table_name="cache")
+        database.update(id="test", data=CacheData(id="test", data="cached"))
+        TinyDatabase.flush()
+
+        # written by another process
+        data = self._read()
+        list(data["cache"].values())[0]["data"] = "other"
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+
+        self.assertEqual(database.select(id="test")["data"], "cached")
+        TinyDatabase.reload()
+        self.assertEqual(database.select(id="test")["data"], "other")
+
+    def _write_other(self, table_name: str, id: str, data: str):
+        # written by another process
+        data_file = self._read() if os.path.exists(self.path) else {}
+        table = data_file.setdefault(table_name, {})
+        for doc_id, document in list(table.items()):
+            if document["id"] == id:
+                del table[doc_id]
+        table[str(len(table) + 100)] = {"id": id, "data": data, "timestamp": 0.0}
+        with open(self.path, "w") as f:
+            json.dump(data_file, f)
+
+    def _documents(self, table_name: str) -> dict:
+        return {document["id"]: document["data"] for document in self._read()[table_name].values()}
+
+    def test_merge(self):
+        database = TinyDatabase(table_name="cache")
+        database.update(id="a", data=CacheData(id="a", data="this"))
+        TinyDatabase.flush()
+
+        # concurrent changes of the same table are kept
+        self._write_other("cache", "b", "other")
+        database.update(id="a", data=CacheData(id="a", data="this updated"))
+        TinyDatabase.flush()
+
+        self.assertEqual(self._documents("cache"), {"a": "this updated", "b": "other"})
+
+    def test_merge_delete(self):
+        database = TinyDatabase(table_name="cache")
+        database.update(id="a", data=CacheData(id="a", data="this"))
+        TinyDatabase.flush()
+
+        self._write_other("cache", "b", "other")
+        database.delete(id="a")
+        TinyDatabase.flush()
+
+        self.assertEqual(self._documents("cache"), {"b": "other"})
+
+    def test_flush_locked(self):
+        database = TinyDatabase(table_name="cache")
+        database.update(id="a", data=CacheData(id="a", data="this"))
+
+        with FileLock(f"{self.path}.lock"):
+            TinyDatabase.flush()
+
+        self.assertEqual(self._documents("cache"), {"a": "this"})
+
+    def test_transaction(self):
+        database = TinyDatabase(table_name="cache")
+        database.update(id="a", data=CacheData(id="a", data="this"))
+        TinyDatabase.flush()
+
+        self._write_other("cache", "a", "other")
+        with TinyDatabase.transaction():
+            # read-modify-write on the current data
+            document = database.select(id="a")
+            database.update(id="a", data=CacheData(id="a", data=document["data"] + " modified"))
+
+        self.assertEqual(self._documents("cache"), {"a": "other modified"})
@@ -0,0 +1,51 @@
+import unittest
+
+from pydantic import ValidationError
+
+from unikube.authentication.types import AuthenticationData
+from unikube.storage.types import (
+    SCHEMA_KEY,
+    GeneralData,
+    ResolutionIndexData,
+    ResolutionIndexItem,
+    UserData,
+    from_document,
+    schema_fingerprint,
+    to_document,
+)
+
+
+class DocumentTest(unittest.TestCase):
+    def test_round_trip(self):
+        data = GeneralData(authentication=AuthenticationData(email="test@unikube.io", access_token="token"))
+        document = to_document(data)
+        self.assertEqual(document[SCHEMA_KEY], schema_fingerprint(GeneralData))
+
+        result = from_document(GeneralData, document)
+        self.assertEqual(result, data)
+        self.assertIsInstance(result.authentication, AuthenticationData)
+
+    def test_trusted(self):
+        # documents of the current schema are not validated
+        document = {"id": "general", "authentication": {"email": None}, SCHEMA_KEY: schema_fingerprint(GeneralData)}
+        result = from_document(GeneralData, document)
+        self.assertIsNone(result.authentication.email)
+        self.assertEqual(result.authentication.access_token, "")
+        self.assertNotIn(SCHEMA_KEY, result.__dict__)
+
+    def test_validated(self):
+        # unknown schema (e.g. written by an older version)
+        with self.assertRaises(ValidationError):
+            from_document(GeneralData, {"id": "general", "authentication": {"email": None}})
+
+        with self.assertRaises(ValidationError):
+            from_document(GeneralData, {"id": "general", "authentication": {"email": None}, SCHEMA_KEY: "outdated"})
+
+    def test_nested_list(self):
+        data = ResolutionIndexData(id="test", project=[ResolutionIndexItem(id="1", title="Project", slug="project")])
+        result = from_document(ResolutionIndexData, to_document(data))
+        self.assertIsInstance(result.project[0], ResolutionIndexItem)
+        self.assertEqual(result, data)
+
+    def test_fingerprint(self):
+        self.assertNotEqual(schema_fingerprint(GeneralData), schema_fingerprint(UserData))
@@ -0,0 +1,203 @@
+import unittest
+from time import time
+from unittest.mock import MagicMock, patch
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from tests import temporary_storage
+from unikube import settings
+from unikube.authentication.authentication import TokenAuthentication
+from unikube.authentication.types import AuthenticationData
+from unikube.storage.general import LocalStorageGeneral
+from unikube.storage.types import GeneralData
+
+
+def create_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def public_key_pem(private_key) -> str:
+    return (
+        private_key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode("utf-8")
+    )
+
+
+PRIVATE_KEY = create_key()
+PUBLIC_KEY = public_key_pem(PRIVATE_KEY)
+
+
+def create_token(expires_in: float, private_key=PRIVATE_KEY, **claims) -> str:
+    return jwt.encode({"exp": int(time() + expires_in), **claims}, private_key, algorithm="RS256")
+
+
+class TokenAuthenticationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.authentication = TokenAuthentication(local_storage_general=LocalStorageGeneral())
+
+    def test_access_token_expires_in(self):
+        expires_in = self.authentication.access_token_expires_in(create_token(expires_in=300))
+        self.assertAlmostEqual(expires_in, 300, delta=5)
+
+    def test_access_token_expired(self):
+        self.assertLess(self.authentication.access_token_expires_in(create_token(expires_in=-10)), 0)
+
+    def test_access_token_invalid(self):
+        self.assertEqual(self.authentication.access_token_expires_in("invalid"), 0.0)
+
+
+class TokenAuthenticationVerifyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.authentication = TokenAuthentication(local_storage_general=MagicMock())
+        self.claims = {"aud": settings.TOKEN_AUDIENCE, "iss": self.authentication.issuer}
+
+        patcher = patch.object(TokenAuthentication, "get_public_key", return_value=PUBLIC_KEY)
+        self.get_public_key = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _set_token(self, access_token: str):
+        self.authentication.general_data = GeneralData(authentication=AuthenticationData(access_token=access_token))
+
+    def test_verify_locally(self):
+        self._set_token(create_token(expires_in=300, **self.claims))
+        self.assertTrue(self.authentication.verify_locally())
+
+    def test_verify_locally_expiring(self):
+        self._set_token(create_token(expires_in=settings.TOKEN_REFRESH_LEEWAY - 1, **self.claims))
+        self.assertFalse(self.authentication.verify_locally())
+
+    def test_verify_locally_audience(self):
+        self._set_token(create_token(expires_in=300, aud="other", iss=self.authentication.issuer))
+        self.assertFalse(self.authentication.verify_locally())
+
+    def test_verify_locally_issuer(self):
+        self._set_token(create_token(expires_in=300, aud=settings.TOKEN_AUDIENCE, iss="https://other.host"))
+        self.assertFalse(self.authentication.verify_locally())
+
+    def test_verify_locally_signature(self):
+        self._set_token(create_token(expires_in=300, private_key=create_key(), **self.claims))
+        self.assertFalse(self.authentication.verify_locally())
+
+    def test_verify_locally_no_public_key(self):
+        self.get_public_key.return_value = None
+        self._set_token(create_token(expires_in=300, **self.claims))
+        self.assertFalse(self.authentication.verify_locally())
+
+    def test_decode_token_key_rotation(self):
+        private_key = create_key()
+        self.get_public_key.side_effect = lambda refresh=False: public_key_pem(private_key) if refresh else PUBLIC_KEY
+
+        token = self.authentication.decode_token(create_token(expires_in=300, private_key=private_key, sub="test"))
+        self.assertEqual(token["sub"], "test")
+
+    def test_verify_or_refresh_no_request(self):
+        self._set_token(create_token(expires_in=300, **self.claims))
+        with patch.object(TokenAuthentication, "verify") as verify, patch.object(
+            TokenAuthentication, "refresh"
+        ) as refresh:
+            self.assertTrue(self.authentication.verify_or_refresh())
+
+        verify.assert_not_called()
+        refresh.assert_not_called()
+
+    def test_verify_or_refresh_expired(self):
+        self._set_token(create_token(expires_in=-10, **self.claims))
+        with patch.object(TokenAuthentication, "verify") as verify, patch.object(
+            TokenAuthentication, "refresh"
+        ) as refresh:
+            refresh.return_value = {"success": True}
+            self.assertTrue(self.authentication.verify_or_refresh())
+
+        verify.assert_not_called()
+        refresh.assert_called_once()
+
+
+class PublicKeyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_storage(self)
+        self.authentication = TokenAuthentication(local_storage_general=MagicMock())
+
+    def _response(self, public_key: str):
+        response = MagicMock()
+        response.json.return_value = {"realm": settings.TOKEN_REALM, "public_key": public_key}
+        return response
+
+    def test_public_key_cached(self):
+        # keycloak returns the base64 encoded key without PEM header
+        public_key = "".join(PUBLIC_KEY.strip().splitlines()[1:-1])
+
+        with patch("requests.Session.get", return_value=self._response(public_key)) as get:
+            self.assertEqual(self.authentication.get_public_key().strip(), PUBLIC_KEY.strip())
+            self.assertEqual(self.authentication.get_public_key().strip(), PUBLIC_KEY.strip())
+
+        get.assert_called_once()
+
+    def test_public_key_offline(self):
+        with patch("requests.Session.get", side_effect=ConnectionError()):
+            self.assertIsNone(self.authentication.get_public_key())
+
+
+class TokenRefreshTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_storage(self)
+        self.local_storage_general = MagicMock()
+        self.authentication = TokenAuthentication(local_storage_general=self.local_storage_general)
+        self.authentication.general_data = GeneralData(
+            authentication=AuthenticationData(email="test@unikube.io", access_token="expired", refresh_token="1")
+        )
+
+    def _store(self, access_token: str, refresh_token: str):
+        self.local_storage_general.get.return_value = GeneralData(
+            authentication=AuthenticationData(
+                email="test@unikube.io", access_token=access_token, refresh_token=refresh_token
+            )
+        )
+
+    def test_refresh_reuses_stored_token(self):
+        # another process has refreshed the token in the meantime
+        access_token = create_token(expires_in=300)
+        self._store(access_token=access_token, refresh_token="2")
+
+        with patch.object(TokenAuthentication, "_refresh") as _refresh:
+            response = self.authentication.refresh()
+
+        _refresh.assert_not_called()
+        self.assertTrue(response["success"])
+        self.assertEqual(response["response"]["access_token"], access_token)
+        self.assertEqual(self.authentication.general_data.authentication.refresh_token, "2")
+
+    def test_refresh_with_stored_refresh_token(self):
+        self._store(access_token="expired", refresh_token="2")
+
+        with patch.object(TokenAuthentication, "_refresh", return_value={"success": True}) as _refresh:
+            self.authentication.refresh()
+
+        _refresh.assert_called_once()
+        self.assertEqual(self.authentication.general_data.authentication.refresh_token, "2")
+
+
+class SessionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_storage(self)
+
+    def test_session_reused(self):
+        authentication = TokenAuthentication(local_storage_general=MagicMock())
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"access_token": "token", "refresh_token": "refresh"}
+
+        with patch("requests.Session.post", return_value=response) as post:
+            authentication.general_data = GeneralData(authentication=AuthenticationData(refresh_token="refresh"))
+            authentication._refresh()
+
+        # token grant and requesting party token, both on the same session
+        self.assertEqual(post.call_count, 2)
+        self.assertIs(authentication.session, authentication.session)
+
+    def test_session_retry(self):
+        authentication = TokenAuthentication(local_storage_general=MagicMock())
+        retry = authentication.session.get_adapter(authentication.url_login).max_retries
+        self.assertEqual(retry.total, settings.TOKEN_RETRIES)
+        self.assertIn(503, retry.status_forcelist)
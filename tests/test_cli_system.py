@@ -0,0 +1,180 @@
+import os
+import sys
+import unittest
+from time import time
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from tests import temporary_storage
+from unikube import settings
+from unikube.commands import cli
+from unikube.helpers import RELEASE_CACHE_KEY, compare_current_and_latest_versions, get_current_version
+from unikube.local.dependency import DockerEngine, LocalDependency, probe_dependencies
+from unikube.storage.cache import LocalStorageCache
+from unikube.storage.types import CacheData
+
+
+class VersionCheckTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_storage(self)
+        self.local_storage_cache = LocalStorageCache()
+
+        patcher = patch("unikube.helpers.subprocess.Popen")
+        self.popen = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _cache(self, version: str, age: float):
+        self.local_storage_cache.set(
+            id=RELEASE_CACHE_KEY, data=CacheData(id=RELEASE_CACHE_KEY, data=version, timestamp=time() - age)
+        )
+
+    def test_cached(self):
+        self._cache("99.0.0", age=0)
+
+        with patch("requests.get") as get, patch("unikube.cli.console.info") as info:
+            self.assertEqual(compare_current_and_latest_versions(), get_current_version())
+
+        get.assert_not_called()
+        self.popen.assert_not_called()
+        self.assertIn("99.0.0", info.call_args[0][0])
+
+    def test_stale_refreshed_in_background(self):
+        self._cache("99.0.0", age=settings.RELEASE_CHECK_TTL + 1)
+
+        with patch("requests.get") as get:
+            compare_current_and_latest_versions()
+            # attempts are spaced
+            compare_current_and_latest_versions()
+
+        get.assert_not_called()
+        self.popen.assert_called_once()
+
+    def test_check_now(self):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"tag_name": "99.0.0"}
+
+        with patch("requests.get", return_value=response) as get:
+            compare_current_and_latest_versions(check_now=True)
+
+        self.assertEqual(get.call_args[1]["timeout"], settings.RELEASE_CHECK_TIMEOUT)
+        self.assertEqual(self.local_storage_cache.get(id=RELEASE_CACHE_KEY).data, "99.0.0")
+        self.popen.assert_not_called()
+
+    def test_version_command(self):
+        self._cache(get_current_version().replace("-", "."), age=0)
+
+        with patch("requests.get") as get:
+            result = CliRunner().invoke(cli, ["version"])
+
+        get.assert_not_called()
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(f"unikube, version {get_current_version()}", result.output)
+        self.assertNotIn("however", result.output)
+
+
+class SleepDependency(LocalDependency):
+    cmd = (sys.executable, "-c", "import time; time.sleep(0.5)")
+    verbose_name = "Sleep"
+
+
+class SlowDependency(LocalDependency):
+    cmd = (sys.executable, "-c", "import time; time.sleep(5)")
+    verbose_name = "Slow"
+    timeout = 0.5
+
+
+class MissingDependency(LocalDependency):
+    cmd = ("unikube-missing-dependency", "--version")
+    verbose_name = "Missing"
+
+
+class ProbeDependenciesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_storage(self)
+
+    def test_concurrent(self):
+        with patch("unikube.local.dependency.ALL_DEPENDENCIES", [SleepDependency] * 4):
+            start = time()
+            results = probe_dependencies(silent=True)
+
+        self.assertLess(time() - start, 1.5)
+        self.assertTrue(all(result["success"] for result in results))
+
+    def test_timeout(self):
+        with patch("unikube.local.dependency.ALL_DEPENDENCIES", [SlowDependency]):
+            start = time()
+            results = probe_dependencies(silent=True)
+
+        self.assertLess(time() - start, 3)
+        self.assertFalse(results[0]["success"])
+        self.assertIn("did not respond", results[0]["msg"])
+
+    def test_order(self):
+        dependencies = [SleepDependency, MissingDependency, SlowDependency]
+        with patch("unikube.local.dependency.ALL_DEPENDENCIES", dependencies), patch("click.secho") as secho:
+            results = probe_dependencies(silent=False)
+
+        self.assertEqual([result["name"] for result in results], ["Sleep", "Missing", "Slow"])
+        self.assertEqual(
+            [call[0][0] for call in secho.call_args_list],
+            [
+                "[INFO] Checking Sleep ",
+                " Ok",
+                "[INFO] Checking Missing ",
+                " Error",
+                "[INFO] Checking Slow ",
+                " Error (Timeout)",
+            ],
+        )
+
+
+class ProbeCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = temporary_storage(self)
+
+        # executable which prints its version
+        self.path = os.path.join(directory, "tool")
+        with open(self.path, "w") as f:
+            f.write("#!/bin/sh\necho 1.0.0\n")
+        os.chmod(self.path, 0o755)
+
+        class ToolDependency(LocalDependency):
+            cmd = (self.path, "--version")
+            verbose_name = "Tool"
+            required_version = "0.1.0"
+
+        self.dependencies = [ToolDependency]
+
+    def _probe(self, **kwargs) -> dict:
+        with patch("unikube.local.dependency.ALL_DEPENDENCIES", self.dependencies):
+            return probe_dependencies(silent=True, **kwargs)[0]
+
+    def test_cached(self):
+        self.assertFalse(self._probe()["cached"])
+
+        with patch("unikube.local.dependency.subprocess.run") as run:
+            result = self._probe()
+
+        run.assert_not_called()
+        self.assertTrue(result["cached"])
+        self.assertTrue(result["success"])
+        self.assertEqual(result["installed_version"], "1.0.0")
+
+    def test_executable_changed(self):
+        self._probe()
+
+        with open(self.path, "w") as f:
+            f.write("#!/bin/sh\necho 0.0.1  # outdated\n")
+
+        result = self._probe()
+        self.assertFalse(result["cached"])
+        self.assertFalse(result["success"])
+
+    def test_no_cache(self):
+        self._probe()
+        self.assertFalse(self._probe(use_cache=False)["cached"])
+
+    def test_docker_engine_not_cached(self):
+        self.assertFalse(DockerEngine.cacheable)
+        self.assertIsNone(DockerEngine().load_result())
@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch
+
+from tests import temporary_storage
+from unikube.local.providers.k3d.storage import K3dLocalStorage
+from unikube.local.providers.k3d.types import K3dData
+from unikube.local.providers.manager import K8sClusterManager
+from unikube.local.providers.types import K8sProviderData
+from unikube.local.system import Docker
+
+CLUSTERS = [f"00000000-0000-4000-8000-00000000000{index}" for index in range(5)]
+
+
+class ClusterListTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_storage(self)
+
+        self.cluster_manager = K8sClusterManager()
+        for index, id in enumerate(CLUSTERS):
+            self.cluster_manager.set(id=id, data=K8sProviderData(id=id, name=f"cluster-{index}"))
+            K3dLocalStorage().set(id=id, data=K3dData(id=id, name=f"unikube-cluster-{index}"))
+
+        # two of the clusters are running
+        containers = [
+            {"Names": ["k3d-unikube-cluster-1-server-0"], "Image": "rancher/k3s"},
+            {"Names": ["k3d-unikube-cluster-3-server-0"], "Image": "rancher/k3s"},
+        ]
+        patcher = patch.object(Docker, "list_containers", return_value=containers)
+        self.list_containers = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ready(self):
+        cluster_list = self.cluster_manager.get_cluster_list(ready=True)
+
+        self.assertEqual([cluster.id for cluster in cluster_list], [CLUSTERS[1], CLUSTERS[3]])
+        # one snapshot for all clusters
+        self.list_containers.assert_called_once_with(label="k3d.cluster")
+
+    def test_not_ready(self):
+        cluster_list = self.cluster_manager.get_cluster_list(ready=False)
+
+        self.assertEqual([cluster.id for cluster in cluster_list], [CLUSTERS[0], CLUSTERS[2], CLUSTERS[4]])
+        self.list_containers.assert_called_once_with(label="k3d.cluster")
+
+    def test_all(self):
+        cluster_list = self.cluster_manager.get_cluster_list()
+
+        self.assertEqual([cluster.id for cluster in cluster_list], CLUSTERS)
+        self.list_containers.assert_not_called()
@@ -0,0 +1,67 @@
+import subprocess
+import sys
+import unittest
+
+import click
+from click.testing import CliRunner
+
+from unikube.commands import ClickContext, LazyGroup, cli
+
+
+class LazyGroupTest(unittest.TestCase):
+    def test_no_eager_imports(self):
+        code = "import sys, unikube.commands; print(sorted(m for m in sys.modules if m.startswith('unikube.cli.')))"
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        self.assertEqual(output.strip(), "[]")
+
+    def test_get_command(self):
+        from unikube.cli import orga
+
+        ctx = click.Context(cli)
+        group = cli.get_command(ctx, "orga")
+        self.assertIs(group.get_command(ctx, "list"), orga.list)
+        self.assertIn("list", group.list_commands(ctx))
+
+    def test_invalid_command(self):
+        group = LazyGroup(name="test", lazy_subcommands={"invalid": ("unikube.settings:CLI_CONFIG_FILE", "")})
+        with self.assertRaises(ValueError):
+            group.get_command(click.Context(group), "invalid")
+
+    def test_help(self):
+        result = CliRunner().invoke(cli, ["project", "--help"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("prune", result.output)
+
+    def test_help_no_imports(self):
+        code = (
+            "import sys\n"
+            "from unikube.commands import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    print(sorted(m for m in sys.modules if m.startswith('unikube.cli.')))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        self.assertEqual(output.strip().splitlines()[-1], "[]")
+
+    def test_short_help(self):
+        # the stored short help matches the docstring of the command
+        def groups(group):
+            yield group
+            for command in group.commands.values():
+                if isinstance(command, LazyGroup):
+                    yield from groups(command)
+
+        ctx = click.Context(cli)
+        for group in groups(cli):
+            for cmd_name, (_, short_help) in group.lazy_subcommands.items():
+                command = group.get_command(ctx, cmd_name)
+                self.assertEqual(short_help, command.get_short_help_str(limit=1000), f"{group.name} {cmd_name}")
+
+
+class ClickContextTest(unittest.TestCase):
+    def test_lazy(self):
+        click_context = ClickContext()
+        self.assertIsNone(click_context._auth)
+        self.assertIs(click_context.auth, click_context.auth)
+        self.assertIs(click_context.context._auth, click_context.auth)
@@ -1,6 +1,14 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
-from unikube.context.helper import is_valid_uuid4
+from tests import temporary_storage
+from unikube.context.context import Context, ContextLogic
+from unikube.context.helper import convert_project_argument_to_uuid, is_valid_uuid4, resolve_context_arguments
+from unikube.context.types import ContextData
+from unikube.graphql_utils import GraphQL
+from unikube.storage.cache import LocalStorageCache
+from unikube.storage.index import LocalStorageResolutionIndex
+from unikube.storage.types import CacheData
 
 
 class IsValidUuid4Test(unittest.TestCase):
@@ -11,3 +19,174 @@ class IsValidUuid4Test(unittest.TestCase):
     def test_is_valid_uuid4_invalid(self):
         result = is_valid_uuid4("invalid")
         self.assertFalse(result)
+
+
+class ConvertArgumentTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.auth = MagicMock()
+        self.auth.general_data.authentication.email = "index@unikube.io"
+        self.auth.general_data.authentication.access_token = "token"
+
+        temporary_storage(self)
+        self.local_storage_index = LocalStorageResolutionIndex(user_email="index@unikube.io")
+
+    def test_convert_project_argument(self):
+        data = {"allProjects": {"results": [{"id": "1", "title": "My Project", "organization": {"id": "2"}}]}}
+
+        with patch.object(GraphQL, "query", return_value=data) as query, patch.object(GraphQL, "invalidate"):
+            self.assertEqual(convert_project_argument_to_uuid(self.auth, "my-project"), "1")
+            query.assert_called_once()
+
+            # second conversion is served from the index
+            self.assertEqual(convert_project_argument_to_uuid(self.auth, "my-project", organization_id="2"), "1")
+            query.assert_called_once()
+
+
+class ResolveContextArgumentsTest(unittest.TestCase):
+    organization_id = "11111111-1111-4111-8111-111111111111"
+    other_organization_id = "22222222-2222-4222-8222-222222222222"
+
+    data = {
+        "allOrganizations": {
+            "results": [{"id": organization_id, "title": "Acme"}, {"id": other_organization_id, "title": "Other"}]
+        },
+        "allProjects": {
+            "results": [
+                {"id": "p1", "title": "Shop", "organization": {"id": organization_id}},
+                {"id": "p2", "title": "Shop", "organization": {"id": other_organization_id}},
+            ]
+        },
+        "allDecks": {
+            "results": [
+                {"id": "d1", "title": "Dev", "project": {"id": "p1", "organization": {"id": organization_id}}},
+                {"id": "d2", "title": "Dev", "project": {"id": "p2", "organization": {"id": other_organization_id}}},
+            ]
+        },
+    }
+
+    def setUp(self) -> None:
+        self.auth = MagicMock()
+        self.auth.general_data.authentication.email = "index@unikube.io"
+        self.auth.general_data.authentication.access_token = "token"
+
+        temporary_storage(self)
+        self.local_storage_index = LocalStorageResolutionIndex(user_email="index@unikube.io")
+
+    def test_single_query(self):
+        with patch.object(GraphQL, "query", return_value=self.data) as query:
+            ids = resolve_context_arguments(self.auth, "acme", "shop", "dev")
+
+        self.assertEqual(ids, (self.organization_id, "p1", "d1"))
+        query.assert_called_once()
+        self.assertEqual(
+            query.call_args.kwargs["query_variables"],
+            {"organization": True, "project": True, "deck": True, "organization_id": None, "project_id": None},
+        )
+
+    def test_index(self):
+        with patch.object(GraphQL, "query", return_value=self.data) as query:
+            resolve_context_arguments(self.auth, "acme", "shop", "dev")
+            ids = resolve_context_arguments(self.auth, "other", "shop", "dev")
+
+        self.assertEqual(ids, (self.other_organization_id, "p2", "d2"))
+        query.assert_called_once()
+
+    def test_partial_index(self):
+        # organizations are indexed, projects and decks are not
+        self.local_storage_index.update("organization", self.data["allOrganizations"]["results"])
+        data = {key: self.data[key] for key in ["allProjects", "allDecks"]}
+
+        with patch.object(GraphQL, "query", return_value=data) as query:
+            ids = resolve_context_arguments(self.auth, "other", "shop", "dev")
+
+        self.assertEqual(ids, (self.other_organization_id, "p2", "d2"))
+        # the lists are limited to the indexed organization
+        self.assertEqual(
+            query.call_args.kwargs["query_variables"],
+            {
+                "organization": False,
+                "project": True,
+                "deck": True,
+                "organization_id": self.other_organization_id,
+                "project_id": None,
+            },
+        )
+
+    def test_index_parent_not_indexed(self):
+        # only the project and deck of 'Acme' are indexed, they must not be used for 'Other'
+        self.local_storage_index.update("project", self.data["allProjects"]["results"][:1])
+        self.local_storage_index.update("deck", self.data["allDecks"]["results"][:1])
+
+        with patch.object(GraphQL, "query", return_value=self.data) as query:
+            ids = resolve_context_arguments(self.auth, "other", "shop", "dev")
+
+        self.assertEqual(ids, (self.other_organization_id, "p2", "d2"))
+        self.assertEqual(
+            query.call_args.kwargs["query_variables"],
+            {"organization": True, "project": True, "deck": True, "organization_id": None, "project_id": None},
+        )
+
+    def test_scoped_index_update(self):
+        # the projects of 'Acme' are indexed, a query scoped to 'Other' does not replace them
+        self.local_storage_index.update("organization", self.data["allOrganizations"]["results"])
+        self.local_storage_index.update("project", self.data["allProjects"]["results"][:1])
+        data = {"allProjects": {"results": self.data["allProjects"]["results"][1:]}}
+
+        with patch.object(GraphQL, "query", return_value=data):
+            resolve_context_arguments(self.auth, "other", "shop")
+
+        self.assertEqual(self.local_storage_index.lookup("project", "shop", organization_id=self.organization_id), "p1")
+
+    def test_uuid(self):
+        with patch.object(GraphQL, "query", return_value=self.data) as query:
+            ids = resolve_context_arguments(self.auth, self.organization_id, "shop")
+
+        self.assertEqual(ids, (self.organization_id, "p1", None))
+        self.assertEqual(
+            query.call_args.kwargs["query_variables"],
+            {
+                "organization": False,
+                "project": True,
+                "deck": False,
+                "organization_id": self.organization_id,
+                "project_id": None,
+            },
+        )
+
+
+class ContextCacheTest(unittest.TestCase):
+    organization_id = "11111111-1111-4111-8111-111111111111"
+
+    def setUp(self) -> None:
+        temporary_storage(self)
+
+        self.context = Context(auth=MagicMock())
+
+    def test_cached(self):
+        with patch.object(ContextLogic, "get", return_value=ContextData()) as get:
+            self.context.get(organization=self.organization_id)
+            self.context.get(organization=self.organization_id)
+
+        get.assert_called_once()
+
+    def test_click_options(self):
+        with patch.object(ContextLogic, "get", return_value=ContextData()) as get:
+            self.context.get(organization=self.organization_id)
+            self.context.get()
+
+        self.assertEqual(get.call_count, 2)
+
+    def test_storage_write(self):
+        with patch.object(ContextLogic, "get", return_value=ContextData()) as get:
+            self.context.get()
+            LocalStorageCache().set(id="context", data=CacheData(id="context"))
+            self.context.get()
+
+        self.assertEqual(get.call_count, 2)
+
+    def test_copy(self):
+        with patch.object(ContextLogic, "get", return_value=ContextData()):
+            context = self.context.get()
+            context.organization_id = self.organization_id
+
+            self.assertIsNone(self.context.get().organization_id)
@@ -0,0 +1,160 @@
+import json
+import os
+import socketserver
+import tempfile
+import unittest
+from http.server import BaseHTTPRequestHandler
+from threading import Thread
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+from unikube.local.docker_api import DockerEngineAPI, DockerEngineAPIError, get_socket_path
+from unikube.local.system import Docker
+
+CONTAINERS = [
+    {"Id": "a" * 64, "Image": "rancher/k3s:v1.22.7-k3s1", "Names": ["/k3d-unikube-project-server-0"]},
+    {"Id": "b" * 64, "Image": "project-deck-app-telepresence:dev", "Names": ["/practical_turing"]},
+]
+
+
+class EngineHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b""):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.server.requests.append(("GET", url.path, parse_qs(url.query)))
+        if url.path == "/_ping":
+            self._send(200, b"OK")
+        elif url.path == "/containers/json":
+            self._send(200, json.dumps(CONTAINERS).encode("utf-8"))
+        elif url.path == "/images/json":
+            self._send(200, b"[]")
+        else:
+            self._send(404)
+
+    def do_POST(self):
+        self.server.requests.append(("POST", self.path, {}))
+        self._send(204)
+
+
+class EngineServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = []
+        self.connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+class DockerEngineAPITest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.socket_path = os.path.join(directory.name, "docker.sock")
+        self.server = EngineServer(self.socket_path, EngineHandler)
+        Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.api = DockerEngineAPI(socket_path=self.socket_path)
+
+    def test_ping(self):
+        self.assertTrue(self.api.ping())
+
+    def test_containers(self):
+        containers = self.api.containers(all=True, filters={"ancestor": ["busybox"]})
+
+        self.assertEqual(len(containers), 2)
+        _, path, query = self.server.requests[-1]
+        self.assertEqual(path, "/containers/json")
+        self.assertEqual(query["all"], ["1"])
+        self.assertEqual(json.loads(query["filters"][0]), {"ancestor": ["busybox"]})
+
+    def test_keep_alive(self):
+        self.api.ping()
+        self.api.containers()
+        self.api.images()
+        self.api.kill("a" * 64)
+
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_unavailable(self):
+        api = DockerEngineAPI(socket_path=self.socket_path + ".missing")
+        self.assertFalse(api.ping())
+        self.assertFalse(api.available)
+        with self.assertRaises(DockerEngineAPIError):
+            api.containers()
+
+    def test_socket_path(self):
+        with patch.dict(os.environ, {"DOCKER_HOST": "unix:///run/user/1000/docker.sock"}):
+            self.assertEqual(get_socket_path(), "/run/user/1000/docker.sock")
+
+        with patch.dict(os.environ, {"DOCKER_HOST": "tcp://127.0.0.1:2375"}):
+            self.assertIsNone(get_socket_path())
+
+        # e.g. Windows
+        with patch("unikube.local.docker_api.socket", spec=[]):
+            self.assertIsNone(get_socket_path())
+
+    def test_docker(self):
+        with patch("unikube.local.system.get_docker_engine_api", return_value=self.api):
+            docker = Docker()
+
+        with patch.object(Docker, "_execute") as _execute:
+            self.assertTrue(docker.check_running("unikube-project"))
+            self.assertTrue(docker.check_running("telepresence:dev"))
+            self.assertFalse(docker.check_running("unikube-other"))
+            self.assertTrue(docker.daemon_active())
+            self.assertFalse(docker.image_exists("busybox"))
+            self.assertEqual(docker.get_container_id("busybox"), "aaaaaaaaaaaa\nbbbbbbbbbbbb")
+
+        _execute.assert_not_called()
+
+    def test_list_containers(self):
+        with patch("unikube.local.system.get_docker_engine_api", return_value=self.api):
+            containers = Docker().list_containers(label="k3d.cluster")
+
+        self.assertEqual(containers[0], {"Names": ["k3d-unikube-project-server-0"], "Image": CONTAINERS[0]["Image"]})
+        _, _, query = self.server.requests[-1]
+        self.assertEqual(json.loads(query["filters"][0]), {"label": ["k3d.cluster"]})
+
+    def test_docker_fallback(self):
+        api = DockerEngineAPI(socket_path=None)
+        with patch("unikube.local.system.get_docker_engine_api", return_value=api):
+            docker = Docker()
+
+        process = MagicMock(returncode=0)
+        process.stdout.read.return_value = "k3d-unikube-project-server-0\trancher/k3s\n"
+        with patch.object(Docker, "_execute", return_value=process) as _execute:
+            self.assertTrue(docker.check_running("unikube-project"))
+            containers = docker.list_containers(label="k3d.cluster")
+
+        self.assertEqual(containers, [{"Names": ["k3d-unikube-project-server-0"], "Image": "rancher/k3s"}])
+        self.assertEqual(_execute.call_args[0][0][-2:], ["--filter", "label=k3d.cluster"])
+
+    def test_kill_fallback(self):
+        with patch("unikube.local.system.get_docker_engine_api", return_value=self.api):
+            docker = Docker()
+
+        # the API kills the first container only
+        with patch.object(self.api, "kill", side_effect=[None, DockerEngineAPIError("gone")]), patch.object(
+            Docker, "_execute"
+        ) as _execute:
+            docker.kill(_id="aaaaaaaaaaaa\nbbbbbbbbbbbb")
+
+        _execute.assert_called_once_with(["kill", "bbbbbbbbbbbb"])
@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import patch
+
+from graphql import DocumentNode
+
+from unikube.graphql_operations import OperationRegistry, operation_registry
+
+
+class OperationRegistryTest(unittest.TestCase):
+    def test_operations_parse(self):
+        for operation in operation_registry:
+            self.assertIsInstance(operation.document, DocumentNode)
+
+    def test_hashes_unique(self):
+        hashes = operation_registry.hashes()
+        self.assertEqual(len(set(hashes.values())), len(hashes))
+
+    def test_parsed_once(self):
+        registry = OperationRegistry()
+        operation = registry.register("test", "query { allOrganizations { results { id } } }")
+
+        with patch("unikube.graphql_operations.gql", wraps=lambda query: DocumentNode()) as gql:
+            self.assertIs(operation.document, operation.document)
+            gql.assert_called_once()
+
+    def test_register_duplicate(self):
+        registry = OperationRegistry()
+        registry.register("test", "query { allOrganizations { results { id } } }")
+
+        with self.assertRaises(ValueError):
+            registry.register("test", "query { allProjects { results { id } } }")
+
+    def test_deck_deployments(self):
+        # 'app switch' resolves the namespace, the project and the deployments of a deck with one operation
+        from unikube.graphql_operations import DECK_DEPLOYMENTS
+
+        for field in ["namespace", "project", "deployments(level:"]:
+            self.assertIn(field, DECK_DEPLOYMENTS.text.replace(" ", ""))
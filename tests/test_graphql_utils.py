@@ -0,0 +1,279 @@
+import unittest
+from time import time
+from unittest.mock import MagicMock, patch
+
+import click
+import requests
+from gql import Client
+from gql.client import SyncClientSession
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+
+from tests import temporary_storage
+from unikube import settings
+from unikube.graphql_utils import GraphQL, GraphQLTransportRegistry, PersistedQueryHTTPTransport, get_document
+from unikube.storage.cache import LocalStorageCache
+from unikube.storage.types import CacheData
+
+QUERY = """
+query {
+    allOrganizations {
+        results {
+            id
+        }
+    }
+}
+"""
+
+
+class GraphQLCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_storage(self)
+
+        self.authentication = MagicMock()
+        self.authentication.general_data.authentication.access_token = "token"
+        self.authentication.general_data.authentication.email = "test@unikube.io"
+
+        self.graph_ql = GraphQL(authentication=self.authentication)
+
+    def _store(self, data: dict, age: float):
+        cache_key = self.graph_ql._cache_key(QUERY)
+        LocalStorageCache().set(id=cache_key, data=CacheData(id=cache_key, data=data, timestamp=time() - age))
+
+    def test_cache_miss(self):
+        with patch.object(GraphQL, "_query", return_value={"miss": True}) as _query:
+            data = self.graph_ql.query(QUERY, cache=True)
+            self.assertEqual(data, {"miss": True})
+            _query.assert_called_once()
+
+            # second call is served from cache
+            data = self.graph_ql.query(QUERY, cache=True)
+            self.assertEqual(data, {"miss": True})
+            _query.assert_called_once()
+
+    def test_cache_fresh(self):
+        self._store({"fresh": True}, age=0)
+        with patch.object(GraphQL, "_query") as _query:
+            data = self.graph_ql.query(QUERY, cache=True)
+            self.assertEqual(data, {"fresh": True})
+            _query.assert_not_called()
+
+    def test_cache_stale_while_revalidate(self):
+        self._store({"stale": True}, age=settings.GRAPHQL_CACHE_TTL + 1)
+        with patch.object(GraphQL, "_revalidate") as _revalidate, patch.object(GraphQL, "_query") as _query:
+            data = self.graph_ql.query(QUERY, cache=True)
+            self.assertEqual(data, {"stale": True})
+            _revalidate.assert_called_once()
+            _query.assert_not_called()
+
+    def test_revalidate(self):
+        self.authentication.access_token_expires_in.return_value = 300
+        session = MagicMock()
+        session.execute.return_value = {"revalidated": True}
+
+        with patch.object(GraphQLTransportRegistry, "_connect", return_value=session) as _connect, patch(
+            "unikube.graphql_utils.Thread", wraps=lambda target: MagicMock(start=target)
+        ):
+            self.graph_ql._revalidate(self.graph_ql._cache_key(QUERY), QUERY)
+
+        # single attempt with a short timeout
+        self.assertEqual(_connect.call_args.kwargs["retries"], 0)
+        self.assertEqual(session.execute.call_args.kwargs["timeout"], settings.GRAPHQL_REVALIDATE_TIMEOUT)
+        session.transport.close.assert_called_once()
+        self.assertEqual(LocalStorageCache().get(id=self.graph_ql._cache_key(QUERY)).data, {"revalidated": True})
+
+    def test_cache_expired(self):
+        self._store({"expired": True}, age=settings.GRAPHQL_CACHE_MAX_AGE + 1)
+        with patch.object(GraphQL, "_query", return_value={"expired": False}):
+            data = self.graph_ql.query(QUERY, cache=True)
+            self.assertEqual(data, {"expired": False})
+
+    def test_cache_key_user_specific(self):
+        cache_key = self.graph_ql._cache_key(QUERY)
+        self.authentication.general_data.authentication.email = "other@unikube.io"
+        self.assertNotEqual(cache_key, self.graph_ql._cache_key(QUERY))
+
+
+class GraphQLTokenRefreshTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.authentication = MagicMock()
+        self.authentication.general_data.authentication.access_token = "token"
+        self.authentication.refresh.return_value = {"success": True, "response": {"access_token": "refreshed"}}
+
+        self.graph_ql = GraphQL(authentication=self.authentication)
+        self.graph_ql.session = MagicMock()
+        self.graph_ql.session.execute.return_value = {"ok": True}
+
+    def test_valid_token(self):
+        self.authentication.access_token_expires_in.return_value = 300
+        self.assertEqual(self.graph_ql.query(QUERY), {"ok": True})
+        self.authentication.refresh.assert_not_called()
+
+    def test_expiring_token_refreshed_before_request(self):
+        self.authentication.access_token_expires_in.return_value = settings.TOKEN_REFRESH_LEEWAY - 1
+        with patch.object(GraphQLTransportRegistry, "get", return_value=self.graph_ql.session):
+            self.assertEqual(self.graph_ql.query(QUERY), {"ok": True})
+
+        self.authentication.refresh.assert_called_once()
+        self.graph_ql.session.execute.assert_called_once()
+        self.assertEqual(self.graph_ql.access_token, "refreshed")
+
+    def test_unauthorized_retried(self):
+        self.authentication.access_token_expires_in.return_value = 300
+        self.graph_ql.session.execute.side_effect = [TransportServerError("401", 401), {"ok": True}]
+        with patch.object(GraphQLTransportRegistry, "get", return_value=self.graph_ql.session):
+            self.assertEqual(self.graph_ql.query(QUERY), {"ok": True})
+
+        self.authentication.refresh.assert_called_once()
+
+    def test_server_error_not_retried(self):
+        self.authentication.access_token_expires_in.return_value = 300
+        self.graph_ql.session.execute.side_effect = TransportServerError("502", 502)
+        with self.assertRaises(TransportServerError):
+            self.graph_ql.query(QUERY)
+
+        self.authentication.refresh.assert_not_called()
+        self.graph_ql.session.execute.assert_called_once()
+
+
+class GraphQLTransportRegistryTest(unittest.TestCase):
+    def test_session_shared(self):
+        transport_registry = GraphQLTransportRegistry()
+        session = transport_registry.get(settings.GRAPHQL_URL, access_token="token")
+        self.assertIs(session, transport_registry.get(settings.GRAPHQL_URL, access_token="token"))
+
+    def test_token_refresh_keeps_connection(self):
+        transport_registry = GraphQLTransportRegistry()
+        session = transport_registry.get(settings.GRAPHQL_URL, access_token="token")
+        requests_session = session.transport.session
+
+        session_refreshed = transport_registry.get(settings.GRAPHQL_URL, access_token="refreshed")
+        self.assertIs(requests_session, session_refreshed.transport.session)
+        self.assertEqual(session_refreshed.transport.headers["Authorization"], "Bearer refreshed")
+
+    def test_click_context_registry(self):
+        authentication = MagicMock()
+        transport_registry = GraphQLTransportRegistry()
+        obj = MagicMock(graphql_transport_registry=transport_registry)
+
+        with click.Context(click.Command("test"), obj=obj):
+            graph_ql = GraphQL(authentication=authentication)
+
+        self.assertIs(graph_ql.transport_registry, transport_registry)
+
+    def test_click_context_registry_closed(self):
+        from unikube.context import ClickContext
+
+        obj = ClickContext()
+        with click.Context(click.Command("test"), obj=obj):
+            with click.Context(click.Command("sub"), parent=click.get_current_context(), obj=obj):
+                transport_registry = obj.graphql_transport_registry
+                transport_registry.get(settings.GRAPHQL_URL, access_token="token")
+
+            # closed with the command (root context), not with the sub command
+            self.assertTrue(transport_registry._sessions)
+
+        self.assertFalse(transport_registry._sessions)
+
+
+class PersistedQueryHTTPTransportTest(unittest.TestCase):
+    def _response(self, status_code: int, body: dict):
+        response = MagicMock(status_code=status_code, headers={})
+        response.json.return_value = body
+        if status_code >= 400:
+            response.raise_for_status.side_effect = requests.HTTPError(str(status_code), response=response)
+        return response
+
+    def _transport(self, *responses) -> PersistedQueryHTTPTransport:
+        transport = PersistedQueryHTTPTransport(url=settings.GRAPHQL_URL)
+        transport.session = MagicMock()
+        transport.session.request.side_effect = list(responses)
+        return transport
+
+    def _payloads(self, transport: PersistedQueryHTTPTransport):
+        return [call.kwargs["json"] for call in transport.session.request.call_args_list]
+
+    def test_hash_only(self):
+        transport = self._transport(self._response(200, {"data": {"ok": True}}))
+        result = transport.execute(get_document(QUERY))
+        self.assertEqual(result.data, {"ok": True})
+
+        (payload,) = self._payloads(transport)
+        self.assertNotIn("query", payload)
+        self.assertEqual(payload["extensions"]["persistedQuery"]["version"], 1)
+        self.assertEqual(len(payload["extensions"]["persistedQuery"]["sha256Hash"]), 64)
+
+    def test_persisted_query_not_found(self):
+        transport = self._transport(
+            self._response(200, {"errors": [{"message": "PersistedQueryNotFound"}]}),
+            self._response(200, {"data": {"ok": True}}),
+        )
+        result = transport.execute(get_document(QUERY))
+        self.assertEqual(result.data, {"ok": True})
+
+        hash_only, full = self._payloads(transport)
+        self.assertNotIn("query", hash_only)
+        self.assertIn("query", full)
+        self.assertEqual(hash_only["extensions"], full["extensions"])
+        self.assertTrue(transport.persisted_queries)
+
+    def test_persisted_query_not_supported(self):
+        transport = self._transport(
+            self._response(400, {"errors": [{"extensions": {"code": "PERSISTED_QUERY_NOT_SUPPORTED"}}]}),
+            self._response(200, {"data": {"ok": True}}),
+        )
+        result = transport.execute(get_document(QUERY))
+        self.assertEqual(result.data, {"ok": True})
+        self.assertFalse(transport.persisted_queries)
+
+    def test_bad_request(self):
+        transport = self._transport(
+            self._response(400, {"errors": [{"message": "Must provide query string."}]}),
+            self._response(200, {"data": {"ok": True}}),
+        )
+        result = transport.execute(get_document(QUERY))
+        self.assertEqual(result.data, {"ok": True})
+
+        # full documents from now on
+        hash_only, full = self._payloads(transport)
+        self.assertIn("query", full)
+        self.assertFalse(transport.persisted_queries)
+
+    def test_bad_request_invalid_query(self):
+        # the full document is rejected as well (e.g. an invalid query), persisted queries stay enabled
+        transport = self._transport(
+            self._response(400, {"errors": [{"message": "Must provide query string."}]}),
+            self._response(400, {"errors": [{"message": "Cannot query field 'invalid'."}]}),
+        )
+        result = transport.execute(get_document(QUERY))
+        self.assertTrue(result.errors)
+        self.assertTrue(transport.persisted_queries)
+
+    def test_query_error(self):
+        # GraphQL errors are returned with the status code, as by RequestsHTTPTransport
+        transport = self._transport(self._response(500, {"errors": [{"message": "Internal error"}], "data": None}))
+        with self.assertRaises(TransportQueryError):
+            SyncClientSession(client=Client(transport=transport)).execute(get_document(QUERY))
+
+    def test_server_error(self):
+        response = self._response(502, {})
+        response.json.side_effect = ValueError("Not a JSON answer")
+        transport = self._transport(response)
+        with self.assertRaises(TransportServerError) as context:
+            transport.execute(get_document(QUERY))
+
+        self.assertEqual(context.exception.code, 502)
+
+    def test_hash_matches_operation(self):
+        from unikube.graphql_operations import ORGANIZATIONS
+
+        transport = self._transport(
+            self._response(200, {"errors": [{"message": "PersistedQueryNotFound"}]}),
+            self._response(200, {"data": {"ok": True}}),
+        )
+        with patch("unikube.graphql_utils.print_ast") as print_ast:
+            transport.execute(ORGANIZATIONS.document, operation=ORGANIZATIONS)
+
+        print_ast.assert_not_called()
+        hash_only, full = self._payloads(transport)
+        self.assertEqual(hash_only["extensions"]["persistedQuery"]["sha256Hash"], ORGANIZATIONS.hash)
+        self.assertEqual(full["query"], ORGANIZATIONS.text)
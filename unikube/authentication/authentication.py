@@ -1,14 +1,23 @@
 import sys
+import textwrap
+from time import time
+from typing import Optional
 from urllib.parse import urljoin
 
 import click_spinner
 import jwt
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import unikube.cli.console as console
 from unikube import settings
 from unikube.authentication.types import AuthenticationData
+from unikube.storage.cache import LocalStorageCache
 from unikube.storage.general import LocalStorageGeneral
+from unikube.storage.local_storage import storage_reload, storage_transaction
+from unikube.storage.lock import FileLock
+from unikube.storage.types import CacheData
 from unikube.storage.user import LocalStorageUser
 
 
@@ -31,6 +40,12 @@ class IAuthentication:
     def verify_or_refresh(self) -> bool:
         raise NotImplementedError
 
+    def access_token_expires_in(self, access_token: str = None) -> float:
+        raise NotImplementedError
+
+    def decode_token(self, token: str, require_signature: bool = True, **kwargs) -> dict:
+        raise NotImplementedError
+
 
 class TokenAuthentication(IAuthentication):
     def __init__(
@@ -47,12 +62,33 @@ class TokenAuthentication(IAuthentication):
         self.url_login = urljoin(self.__get_host(), settings.TOKEN_LOGIN_PATH)
         self.url_verify = urljoin(self.__get_host(), settings.TOKEN_VERIFY_PATH)
         self.url_refresh = urljoin(self.__get_host(), settings.TOKEN_REFRESH_PATH)
+        self.issuer = urljoin(self.__get_host(), settings.TOKEN_ISSUER_PATH)
 
         self.client_id = settings.KC_CLIENT_ID
 
         # RPT
         self.requesting_party_token_audience = settings.TOKEN_RPT_AUDIENCE
 
+        # session (keep-alive connection to the authentication host)
+        self._session = None
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            retry = Retry(
+                total=settings.TOKEN_RETRIES,
+                read=0,
+                backoff_factor=settings.TOKEN_RETRY_BACKOFF,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET", "POST"],
+                raise_on_status=False,
+            )
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(max_retries=retry))
+            self._session.mount("http://", HTTPAdapter(max_retries=retry))
+
+        return self._session
+
     def __get_host(self) -> str:
         try:
             local_storage_user = LocalStorageUser(user_email=self.general_data.authentication.email)
@@ -165,6 +201,36 @@ class TokenAuthentication(IAuthentication):
         return response
 
     def refresh(self) -> dict:
+        """
+        Refresh the access token. Concurrent unikube processes refresh one at a time: a process waiting for the lock
+        reuses the token which has just been stored by another process instead of rotating the refresh token again.
+        """
+        access_token = self.general_data.authentication.access_token
+        email = self.general_data.authentication.email
+
+        with FileLock(settings.TOKEN_REFRESH_LOCK_FILE, timeout=self.timeout):
+            # the stored token (and refresh token) may be newer than the one of this process
+            storage_reload()
+            self.general_data = self.local_storage_general.get()
+            authentication_data = self.general_data.authentication
+
+            if (
+                authentication_data.email == email
+                and authentication_data.access_token != access_token
+                and self.access_token_expires_in(authentication_data.access_token) > settings.TOKEN_REFRESH_LEEWAY
+            ):
+                return {
+                    "success": True,
+                    "message": "",
+                    "response": {
+                        "access_token": authentication_data.access_token,
+                        "refresh_token": authentication_data.refresh_token,
+                    },
+                }
+
+            return self._refresh()
+
+    def _refresh(self) -> dict:
         # request
         refresh_token = self.general_data.authentication.refresh_token
         response_token = self.__request(
@@ -196,20 +262,46 @@ class TokenAuthentication(IAuthentication):
 
         # update token
         if response["success"]:
-            self.general_data = self.local_storage_general.get()
-            self.general_data.authentication.access_token = response["response"]["access_token"]
-            self.general_data.authentication.refresh_token = response["response"]["refresh_token"]
-            self.general_data.authentication.requesting_party_token = requesting_party_token
-            self.local_storage_general.set(self.general_data)
+            # written right away, waiting processes reuse the token
+            with storage_transaction():
+                self.general_data = self.local_storage_general.get()
+                self.general_data.authentication.access_token = response["response"]["access_token"]
+                self.general_data.authentication.refresh_token = response["response"]["refresh_token"]
+                self.general_data.authentication.requesting_party_token = requesting_party_token
+                self.local_storage_general.set(self.general_data)
 
         return response
 
+    def verify_locally(self, leeway: float = settings.TOKEN_REFRESH_LEEWAY) -> bool:
+        # the stored access token is signed by the realm, issued for this host and valid for at least 'leeway' seconds
+        access_token = self.general_data.authentication.access_token
+        if not access_token:
+            return False
+
+        try:
+            token = self.decode_token(
+                access_token,
+                audience=settings.TOKEN_AUDIENCE,
+                issuer=self.issuer,
+                options={"require": ["exp"]},
+            )
+        except jwt.InvalidTokenError as e:
+            console.debug(e)
+            return False
+
+        return token["exp"] - time() > leeway
+
     def verify_or_refresh(self) -> bool:
-        # verify
-        response = self.verify()
-        if response["success"]:
+        # local validation
+        if self.verify_locally():
             return True
 
+        # verify (an expired token is refreshed right away)
+        if self.access_token_expires_in() > settings.TOKEN_REFRESH_LEEWAY:
+            response = self.verify()
+            if response["success"]:
+                return True
+
         # refresh
         response = self.refresh()
         if response["success"]:
@@ -232,7 +324,7 @@ class TokenAuthentication(IAuthentication):
     ) -> dict:
         # request
         try:
-            req = requests.post(
+            req = self.session.post(
                 url,
                 data,
                 headers=headers,
@@ -275,12 +367,72 @@ class TokenAuthentication(IAuthentication):
             "response": response,
         }
 
+    def access_token_expires_in(self, access_token: str = None) -> float:
+        # seconds until the access token expires, decoded locally from the 'exp' claim (no request)
+        if access_token is None:
+            access_token = self.general_data.authentication.access_token
+
+        try:
+            token = jwt.decode(access_token, algorithms=["RS256"], options={"verify_signature": False})
+            return token["exp"] - time()
+        except Exception as e:
+            console.debug(e)
+            return 0.0
+
+    def get_public_key(self, refresh: bool = False) -> Optional[str]:
+        # realm public key (PEM), cached in the local storage
+        local_storage_cache = LocalStorageCache()
+        cache_key = f"public_key:{self.url_public_key}"
+        cache_data = local_storage_cache.get(id=cache_key)
+
+        if not refresh and cache_data.data and cache_data.age < settings.TOKEN_PUBLIC_KEY_TTL:
+            return cache_data.data
+
+        try:
+            response = self.session.get(self.url_public_key, timeout=self.timeout)
+            response.raise_for_status()
+            public_key = response.json()["public_key"]
+        except Exception as e:
+            console.debug(e)
+            # offline: an outdated key is still better than none
+            return cache_data.data
+
+        public_key = "\n".join(
+            ["-----BEGIN PUBLIC KEY-----", *textwrap.wrap(public_key, 64), "-----END PUBLIC KEY-----"]
+        )
+        local_storage_cache.set(id=cache_key, data=CacheData(id=cache_key, data=public_key, timestamp=time()))
+
+        return public_key
+
+    def decode_token(self, token: str, require_signature: bool = True, **kwargs) -> dict:
+        """
+        Decode a token and verify its signature with the realm public key. If the key is not available (e.g. no
+        connection to the authentication host), the token is rejected unless ``require_signature`` is disabled.
+        """
+        public_key = self.get_public_key()
+        if not public_key:
+            if require_signature:
+                raise jwt.InvalidTokenError("Realm public key is not available.")
+
+            options = {**kwargs.pop("options", {}), "verify_signature": False}
+            return jwt.decode(token, algorithms=[settings.TOKEN_ALGORITHM], options=options, **kwargs)
+
+        try:
+            return jwt.decode(token, public_key, algorithms=[settings.TOKEN_ALGORITHM], **kwargs)
+        except jwt.InvalidSignatureError:
+            # the realm key may have been rotated
+            public_key_refreshed = self.get_public_key(refresh=True)
+            if not public_key_refreshed or public_key_refreshed == public_key:
+                raise
+
+            return jwt.decode(token, public_key_refreshed, algorithms=[settings.TOKEN_ALGORITHM], **kwargs)
+
     def token_from_response(self, response):
-        token = jwt.decode(
+        # the token is taken directly from the token endpoint, hence an unavailable key is tolerated
+        token = self.decode_token(
             response["response"]["access_token"],
-            algorithms=["RS256"],
+            require_signature=False,
             audience=settings.TOKEN_AUDIENCE,
-            options={"verify_signature": False},
         )
         return token
 
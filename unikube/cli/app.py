@@ -11,6 +11,7 @@ import click_spinner
 from unikube import settings
 from unikube.cli import console
 from unikube.cli.helper import age_from_timestamp
+from unikube.graphql_operations import DECK_DEPLOYMENTS, DECK_NAMESPACE
 from unikube.graphql_utils import GraphQL
 from unikube.local.providers.helper import get_cluster_or_exit
 from unikube.local.system import Docker, KubeAPI, KubeCtl, Telepresence
@@ -26,7 +27,7 @@ def _is_local_port_free(port):
         return True
 
 
-def get_deck_from_arguments(ctx, organization_id: str, project_id: str, deck_id: str):
+def get_deck_id_from_arguments(ctx, organization_id: str, project_id: str, deck_id: str) -> str:
     # context
     organization_id, project_id, deck_id = ctx.context.get_context_ids_from_arguments(
         organization_argument=organization_id, project_argument=project_id, deck_argument=deck_id
@@ -38,32 +39,26 @@ def get_deck_from_arguments(ctx, organization_id: str, project_id: str, deck_id:
         if not deck_id:
             exit(1)
 
+    return deck_id
+
+
+def get_deck_from_arguments(ctx, organization_id: str, project_id: str, deck_id: str):
+    deck_id = get_deck_id_from_arguments(ctx, organization_id, project_id, deck_id)
+
     # GraphQL
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
-        data = graph_ql.query(
-            """
-            query($id: UUID) {
-                deck(id: $id) {
-                    id
-                    title
-                    environment {
-                        namespace
-                    }
-                    project {
-                        id
-                    }
-                }
-            }
-            """,
-            query_variables={"id": deck_id},
-        )
+        data = graph_ql.query(DECK_NAMESPACE, query_variables={"id": deck_id})
         deck = data["deck"]
-        project_id = deck["project"]["id"]
     except Exception as e:
         console.debug(e)
         console.exit_generic_error()
 
+    cluster_data = get_cluster_data(ctx, project_id=deck["project"]["id"])
+    return cluster_data, deck
+
+
+def get_cluster_data(ctx, project_id: str):
     # cluster data
     cluster_list = ctx.cluster_manager.get_cluster_list(ready=True)
     if project_id not in [cluster.id for cluster in cluster_list]:
@@ -73,7 +68,7 @@ def get_deck_from_arguments(ctx, organization_id: str, project_id: str, deck_id:
     if not cluster_data:
         console.error("The cluster could not be found.", _exit=True)
 
-    return cluster_data, deck
+    return cluster_data
 
 
 def argument_apps(k8s, apps: List[str], multiselect: bool = False) -> List[str]:
@@ -327,7 +322,18 @@ def switch(
     Switch a running deployment with a local Docker container.
     """
 
-    cluster_data, deck = get_deck_from_arguments(ctx, organization, project, deck)
+    deck_id = get_deck_id_from_arguments(ctx, organization, project, deck)
+
+    # GraphQL: the deck (namespace) and its deployments with one operation
+    try:
+        graph_ql = GraphQL(authentication=ctx.auth)
+        data = graph_ql.query(DECK_DEPLOYMENTS, query_variables={"id": deck_id})
+        deck = data["deck"]
+    except Exception as e:
+        console.debug(e)
+        console.exit_generic_error()
+
+    cluster_data = get_cluster_data(ctx, project_id=deck["project"]["id"])
 
     # get cluster
     cluster = get_cluster_or_exit(ctx, cluster_data.id)
@@ -354,40 +360,9 @@ def switch(
             _exit=True,
         )
 
-    # 2.2 Fetch available "deployment:", deployments
-    # GraphQL
-    try:
-        graph_ql = GraphQL(authentication=ctx.auth)
-        data = graph_ql.query(
-            """
-            query($id: UUID) {
-                deck(id: $id) {
-                    deployments(level: "local") {
-                        id
-                        title
-                        description
-                        ports
-                        isSwitchable
-                    }
-                    environment {
-                        id
-                        type
-                        valuesPath
-                        namespace
-                    }
-                }
-            }
-            """,
-            query_variables={
-                "id": deck["id"],
-            },
-        )
-    except Exception as e:
-        console.debug(e)
-        console.exit_generic_error()
-
+    # 2.2 Fetch available "deployment:", deployments (already fetched alongside the deck)
     target_deployment = None
-    for _deployment in data["deck"]["deployments"]:
+    for _deployment in deck["deployments"]:
         if _deployment["title"] == deployment:
             target_deployment = _deployment
 
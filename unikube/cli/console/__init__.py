@@ -1,8 +1,37 @@
-from .container import container_list
-from .deck import deck_list
-from .exit import exit_generic_error, exit_login_required
-from .input import confirm, input, list
-from .logger import debug, echo, error, info, link, success, warning
-from .orga import organization_list
-from .output import table
-from .project import project_list
+import importlib
+
+# attribute -> submodule, the submodules (e.g. prompts, GraphQL) are imported on first use
+_exports = {
+    "container_list": "container",
+    "deck_list": "deck",
+    "exit_generic_error": "exit",
+    "exit_login_required": "exit",
+    "confirm": "prompt",
+    "input": "prompt",
+    "list": "prompt",
+    "debug": "logger",
+    "echo": "logger",
+    "error": "logger",
+    "info": "logger",
+    "link": "logger",
+    "success": "logger",
+    "warning": "logger",
+    "organization_list": "orga",
+    "table": "output",
+    "project_list": "project",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{_exports[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
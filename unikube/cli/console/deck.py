@@ -1,8 +1,10 @@
 from typing import Union
 
 import unikube.cli.console as console
-from unikube.cli.console.input import get_identifier_or_pass
+from unikube.cli.console.helpers import display_name_loader
+from unikube.cli.console.prompt import get_identifier_or_pass
 from unikube.context.helper import convert_deck_argument_to_uuid
+from unikube.graphql_operations import DECKS_WITH_PROJECT
 from unikube.graphql_utils import GraphQL
 
 
@@ -11,33 +13,22 @@ def deck_list(ctx, organization_id: str = None, project_id: str = None) -> Union
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query($organization_id: UUID, $project_id: UUID) {
-                allDecks(organizationId: $organization_id, projectId: $project_id) {
-                    results {
-                        title
-                        id
-                        project {
-                            id
-                            title
-                            organization {
-                                id
-                            }
-                        }
-                    }
-                }
-            }
-            """,
+            DECKS_WITH_PROJECT,
             query_variables={
                 "organization_id": organization_id,
                 "project_id": project_id,
             },
+            cache=True,
         )
         deck_list = data["allDecks"]["results"]
     except Exception as e:
         console.debug(e)
         console.exit_generic_error()
 
+    # display names (no further lookup required)
+    for item in deck_list:
+        display_name_loader.prime("deck", item["id"], item["title"])
+
     selection = console.list(
         message="Please select a deck",
         choices=[deck["title"] for deck in deck_list],
@@ -1,82 +1,88 @@
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+from gql.transport.exceptions import TransportQueryError
 
 from unikube.cli import console
 from unikube.graphql_utils import GraphQL
 
 
-def organization_id_2_display_name(ctx, id: str = None) -> str:
-    if not id:
-        return "-"
+class DisplayNameLoader:
+    """
+    Collects id -> title lookups of organizations, projects and decks and resolves all pending ones with a single
+    aliased GraphQL query. Titles are memoized for the rest of the process.
+    """
 
-    try:
-        graph_ql = GraphQL(authentication=ctx.auth)
-        data = graph_ql.query(
-            """
-            query($id: UUID!) {
-                organization(id: $id) {
-                    title
-                }
-            }
-            """,
-            query_variables={
-                "id": id,
-            },
-        )
-        title = data["organization"]["title"]
-    except Exception as e:
-        console.debug(e)
-        title = "-"
+    fields = ("organization", "project", "deck")
 
-    return f"{title} ({id})"
+    def __init__(self):
+        self._titles: Dict[Tuple[str, str], Optional[str]] = {}
+        self._pending: List[Tuple[str, str]] = []
 
+    def load(self, field: str, id: str = None) -> None:
+        if field not in self.fields:
+            raise ValueError(field)
 
-def project_id_2_display_name(ctx, id: str = None) -> Optional[str]:
-    if not id:
-        return "-"
+        key = (field, id)
+        if id and key not in self._titles and key not in self._pending:
+            self._pending.append(key)
+
+    def prime(self, field: str, id: str, title: str) -> None:
+        # titles which are already known, e.g. from a list query
+        self._titles[(field, id)] = title
+
+    def get(self, ctx, field: str, id: str) -> Optional[str]:
+        self.load(field, id)
+        if self._pending:
+            self.dispatch(ctx)
+
+        return self._titles.get((field, id), None)
 
-    try:
-        graph_ql = GraphQL(authentication=ctx.auth)
-        data = graph_ql.query(
-            """
-            query($id: UUID!) {
-                project(id: $id) {
-                    title
-                }
-            }
-            """,
-            query_variables={
-                "id": id,
-            },
+    def dispatch(self, ctx) -> None:
+        pending, self._pending = self._pending, []
+
+        # e.g. query($id0: UUID!, $id1: UUID!) { organization0: organization(id: $id0) { title } project1: ... }
+        variables = ", ".join(f"$id{index}: UUID!" for index in range(len(pending)))
+        selections = " ".join(
+            f"{field}{index}: {field}(id: $id{index}) {{ title }}" for index, (field, _) in enumerate(pending)
         )
-        title = data["project"]["title"]
-    except Exception as e:
-        console.debug(e)
-        title = "-"
 
-    return f"{title} ({id})"
+        try:
+            graph_ql = GraphQL(authentication=ctx.auth)
+            data = graph_ql.query(
+                f"query({variables}) {{ {selections} }}",
+                query_variables={f"id{index}": id for index, (_, id) in enumerate(pending)},
+            )
+        except TransportQueryError as e:
+            # partial result, e.g. one of the ids does not exist (anymore)
+            console.debug(e)
+            data = e.data or {}
+        except Exception as e:
+            console.debug(e)
+            return None
 
+        for index, key in enumerate(pending):
+            item = data.get(f"{key[0]}{index}", None)
+            self._titles[key] = item["title"] if item else None
 
-def deck_id_2_display_name(ctx, id: str = None) -> Optional[str]:
+
+display_name_loader = DisplayNameLoader()
+
+
+def _id_2_display_name(ctx, field: str, id: str = None) -> str:
     if not id:
         return "-"
 
-    try:
-        graph_ql = GraphQL(authentication=ctx.auth)
-        data = graph_ql.query(
-            """
-            query($id: UUID!) {
-                deck(id: $id) {
-                    title
-                }
-            }
-            """,
-            query_variables={
-                "id": id,
-            },
-        )
-        title = data["deck"]["title"]
-    except Exception as e:
-        console.debug(e)
-        title = "-"
-
+    title = display_name_loader.get(ctx, field, id) or "-"
     return f"{title} ({id})"
+
+
+def organization_id_2_display_name(ctx, id: str = None) -> str:
+    return _id_2_display_name(ctx, "organization", id)
+
+
+def project_id_2_display_name(ctx, id: str = None) -> Optional[str]:
+    return _id_2_display_name(ctx, "project", id)
+
+
+def deck_id_2_display_name(ctx, id: str = None) -> Optional[str]:
+    return _id_2_display_name(ctx, "deck", id)
@@ -1,8 +1,10 @@
 from typing import Union
 
 import unikube.cli.console as console
-from unikube.cli.console.input import get_identifier_or_pass
+from unikube.cli.console.helpers import display_name_loader
+from unikube.cli.console.prompt import get_identifier_or_pass
 from unikube.context.helper import convert_organization_argument_to_uuid
+from unikube.graphql_operations import ORGANIZATIONS
 from unikube.graphql_utils import GraphQL
 
 
@@ -11,22 +13,18 @@ def organization_list(ctx) -> Union[None, str]:
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query {
-                allOrganizations {
-                    results {
-                        id
-                        title
-                    }
-                }
-            }
-            """
+            ORGANIZATIONS,
+            cache=True,
         )
         organization_list = data["allOrganizations"]["results"]
     except Exception as e:
         console.debug(e)
         console.exit_generic_error()
 
+    # display names (no further lookup required)
+    for item in organization_list:
+        display_name_loader.prime("organization", item["id"], item["title"])
+
     selection = console.list(
         message="Please select an organization",
         choices=[organization["title"] for organization in organization_list],
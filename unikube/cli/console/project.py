@@ -1,8 +1,10 @@
 from typing import List, Union
 
 import unikube.cli.console as console
-from unikube.cli.console.input import get_identifier_or_pass
+from unikube.cli.console.helpers import display_name_loader
+from unikube.cli.console.prompt import get_identifier_or_pass
 from unikube.context.helper import convert_project_argument_to_uuid
+from unikube.graphql_operations import PROJECTS_WITH_ORGANIZATION
 from unikube.graphql_utils import GraphQL
 
 
@@ -13,29 +15,21 @@ def project_list(
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query($organization_id: UUID) {
-                allProjects(organizationId: $organization_id) {
-                    results {
-                        title
-                        id
-                        organization {
-                            id
-                            title
-                        }
-                    }
-                }
-            }
-            """,
+            PROJECTS_WITH_ORGANIZATION,
             query_variables={
                 "organization_id": organization_id,
             },
+            cache=True,
         )
         project_list = data["allProjects"]["results"]
     except Exception as e:
         console.debug(e)
         console.exit_generic_error()
 
+    # display names (no further lookup required)
+    for item in project_list:
+        display_name_loader.prime("project", item["id"], item["title"])
+
     selection = console.list(
         message="Please select a project",
         choices=[project["title"] for project in project_list],
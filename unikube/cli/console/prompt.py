@@ -1,11 +1,13 @@
 import re
 from typing import Any, Callable, List, Union
 
-from InquirerPy import inquirer
+from InquirerPy import get_style, inquirer
 from InquirerPy.utils import InquirerPyValidate
 
 import unikube.cli.console as console
-from unikube.settings import INQUIRER_STYLE
+from unikube import settings
+
+INQUIRER_STYLE = get_style(settings.INQUIRER_STYLE, style_override=False)
 
 
 def get_identifier_or_pass(selection: str) -> str:
@@ -3,15 +3,22 @@ import click
 import unikube.cli.console as console
 from unikube.cli.console.helpers import (
     deck_id_2_display_name,
+    display_name_loader,
     organization_id_2_display_name,
     project_id_2_display_name,
 )
 from unikube.context.helper import convert_context_arguments
+from unikube.graphql_operations import DECK_PROJECT, PROJECT_ORGANIZATION
 from unikube.graphql_utils import GraphQL
 from unikube.storage.user import get_local_storage_user
 
 
 def show_context(ctx, context):
+    # resolve all titles with a single query
+    display_name_loader.load("organization", context.organization_id)
+    display_name_loader.load("project", context.project_id)
+    display_name_loader.load("deck", context.deck_id)
+
     organization = organization_id_2_display_name(ctx=ctx, id=context.organization_id)
     project = project_id_2_display_name(ctx=ctx, id=context.project_id)
     deck = deck_id_2_display_name(ctx=ctx, id=context.deck_id)
@@ -59,15 +66,7 @@ def set(ctx, organization=None, project=None, deck=None, **kwargs):
             try:
                 graph_ql = GraphQL(authentication=ctx.auth)
                 data = graph_ql.query(
-                    """
-                    query($id: UUID) {
-                        project(id: $id) {
-                            organization {
-                                id
-                            }
-                        }
-                    }
-                    """,
+                    PROJECT_ORGANIZATION,
                     query_variables={
                         "id": project_id,
                     },
@@ -88,18 +87,7 @@ def set(ctx, organization=None, project=None, deck=None, **kwargs):
             try:
                 graph_ql = GraphQL(authentication=ctx.auth)
                 data = graph_ql.query(
-                    """
-                    query($id: UUID) {
-                        deck(id: $id) {
-                            project {
-                                id
-                                organization {
-                                    id
-                                }
-                            }
-                        }
-                    }
-                    """,
+                    DECK_PROJECT,
                     query_variables={
                         "id": deck_id,
                     },
@@ -1,6 +1,7 @@
 import click
 
 import unikube.cli.console as console
+from unikube.graphql_operations import DECK, DECK_INFO, DECK_LIST
 from unikube.graphql_utils import GraphQL
 from unikube.helpers import check_environment_type_local_or_exit, download_manifest
 from unikube.local.system import KubeAPI, KubeCtl, Telepresence
@@ -11,27 +12,7 @@ def get_deck(ctx, deck_id: str):
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query($id: UUID) {
-                deck(id: $id) {
-                    id
-                    title
-                    environment {
-                        id
-                        type
-                        valuesPath
-                        namespace
-                    }
-                    project {
-                        id
-                        title
-                        organization {
-                            title
-                        }
-                    }
-                }
-            }
-            """,
+            DECK,
             query_variables={"id": deck_id},
         )
         deck = data["deck"]
@@ -100,22 +81,7 @@ def list(ctx, organization=None, project=None, **kwargs):
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query($organization_id: UUID, $project_id: UUID) {
-                allDecks(organizationId: $organization_id, projectId: $project_id) {
-                    results {
-                        id
-                        title
-                        project {
-                            title
-                            organization {
-                                title
-                            }
-                        }
-                    }
-                }
-            }
-            """,
+            DECK_LIST,
             query_variables={
                 "organization_id": organization_id,
                 "project_id": project_id,
@@ -173,17 +139,7 @@ def info(ctx, organization=None, project=None, deck=None, **kwargs):
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query($id: UUID) {
-                deck(id: $id) {
-                    id
-                    title
-                    description
-                    namespace
-                    type
-                }
-            }
-            """,
+            DECK_INFO,
             query_variables={"id": deck_id},
         )
         deck_selected = data["deck"]
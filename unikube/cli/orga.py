@@ -1,6 +1,7 @@
 import click
 
 import unikube.cli.console as console
+from unikube.graphql_operations import ORGANIZATION_INFO
 from unikube.graphql_utils import GraphQL
 from unikube.keycloak.permissions import KeycloakPermissions
 
@@ -69,15 +70,7 @@ def info(ctx, organization, **kwargs):
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query($id: UUID!) {
-                organization(id: $id) {
-                    id
-                    title
-                    description
-                }
-            }
-            """,
+            ORGANIZATION_INFO,
             query_variables={"id": organization_id},
         )
         organization_selected = data["organization"]
@@ -8,6 +8,7 @@ import unikube.cli.console as console
 from unikube import settings
 from unikube.cli.console.helpers import project_id_2_display_name
 from unikube.cli.helper import check_ports
+from unikube.graphql_operations import PROJECT_CLUSTER_SETTINGS, PROJECT_IDS, PROJECT_INFO, PROJECT_LIST
 from unikube.graphql_utils import GraphQL
 from unikube.helpers import check_running_cluster
 from unikube.local.providers.types import K8sProviderType
@@ -31,17 +32,7 @@ def list(ctx, organization, **kwargs):
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query($organization_id: UUID) {
-                allProjects(organizationId: $organization_id) {
-                    results {
-                        title
-                        id
-                        description
-                    }
-                }
-            }
-            """,
+            PROJECT_LIST,
             query_variables={"organization_id": organization_id},
         )
         project_list = data["allProjects"]["results"]
@@ -89,20 +80,7 @@ def info(ctx, project=None, organization=None, **kwargs):
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query($id: UUID!) {
-                project(id: $id) {
-                    id
-                    title
-                    description
-                    specRepository
-                    specRepositoryBranch
-                    organization {
-                        title
-                    }
-                }
-            }
-            """,
+            PROJECT_INFO,
             query_variables={"id": project_id},
         )
         project_selected = data["project"]
@@ -177,24 +155,7 @@ def up(ctx, project=None, organization=None, ingress=None, provider=None, worker
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query($id: UUID) {
-                project(id: $id) {
-                    title
-                    id
-                    organization {
-                        id
-                    }
-                    clusterSettings {
-                        id
-                        port
-                    }
-                    organization {
-                        title
-                    }
-                }
-            }
-            """,
+            PROJECT_CLUSTER_SETTINGS,
             query_variables={
                 "id": project_id,
             },
@@ -412,17 +373,7 @@ def prune(ctx, **kwargs):
     # GraphQL
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
-        data = graph_ql.query(
-            """
-            query {
-                allProjects {
-                    results {
-                        id
-                    }
-                }
-            }
-            """
-        )
+        data = graph_ql.query(PROJECT_IDS)
         projects = data["allProjects"]["results"]
     except Exception as e:
         console.debug(e)
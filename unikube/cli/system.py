@@ -10,7 +10,8 @@ from unikube.local.dependency import install_dependency, probe_dependencies
 
 @click.command()
 @click.option("--reinstall", help="Reinstall the given dependencies comma-separated.")
-def install(reinstall):
+@click.option("--no-cache", is_flag=True, default=False, help="Probe all dependencies again.")
+def install(reinstall, no_cache):
     """
     Install all required dependencies on your local machine.
     In order to reinstall dependencies use the ``--reinstall`` argument. You need to specify the name of the dependency
@@ -49,7 +50,7 @@ def install(reinstall):
     if reinstall:
         dependencies = [{"name": i} for i in reinstall.split(",")]
     else:
-        report_data = probe_dependencies(silent=True)
+        report_data = probe_dependencies(silent=True, use_cache=not no_cache)
         dependencies = list(filter(lambda x: not x["success"], report_data))
         if len(dependencies) == 1:
             console.info(f"The following dependency is going to be installed: {dependencies[0]['name']}")
@@ -72,15 +73,17 @@ def install(reinstall):
     default=False,
     help="Print a verbose table with state and " "actual version of a dependency.",
 )
-def verify(verbose):
+@click.option("--check-now", is_flag=True, default=False, help="Query the latest release instead of the cached one.")
+@click.option("--no-cache", is_flag=True, default=False, help="Probe all dependencies again.")
+def verify(verbose, check_now, no_cache):
     """
     Verifies the installation of dependencies on your local machine. If you need a verbose tabular output, please
     add the ``--verbose`` flag to the command.
     """
 
-    compare_current_and_latest_versions()
+    compare_current_and_latest_versions(check_now=check_now)
 
-    report_data = probe_dependencies(silent=verbose)
+    report_data = probe_dependencies(silent=verbose, use_cache=not no_cache)
     unsuccessful = list(filter(lambda x: not x["success"], report_data))
 
     # show detailed table
@@ -95,6 +98,7 @@ def verify(verbose):
                 "required_version": "Required Version",
                 "installed_version": "Installed Version",
                 "msg": "Message",
+                "cached": "Cached",
             },
         )
 
@@ -2,6 +2,7 @@ import click
 
 import unikube.cli.console as console
 from unikube.cli.context import show_context
+from unikube.graphql_operations import PROJECT_LIST
 from unikube.graphql_utils import GraphQL
 from unikube.local.providers.helper import get_cluster_or_exit
 from unikube.local.system import Telepresence
@@ -23,17 +24,7 @@ def ps(ctx, **kwargs):
     try:
         graph_ql = GraphQL(authentication=ctx.auth)
         data = graph_ql.query(
-            """
-            query {
-                allProjects {
-                    results {
-                        title
-                        id
-                        description
-                    }
-                }
-            }
-            """,
+            PROJECT_LIST,
         )
         project_list = data["allProjects"]["results"]
     except Exception as e:
@@ -1,28 +1,96 @@
+import importlib
 import sys
+from typing import Dict, List, Tuple
 
 import click
+from click.utils import make_default_short_help
 from click_didyoumean import DYMGroup
 
-import unikube.cli.console as console
-from unikube.cli import app as app_cmd
-from unikube.cli import auth as auth_cmd
-from unikube.cli import context as context_cmd
-from unikube.cli import deck as deck_cmd
-from unikube.cli import init as init_cmd
-from unikube.cli import orga as orga_cmd
-from unikube.cli import project as project_cmd
-from unikube.cli import system as system_cmd
-from unikube.cli import unikube as unikube_cmd
-from unikube.completion.completion import render_completion_script
 from unikube.context import ClickContext
-from unikube.helpers import compare_current_and_latest_versions
 
 version = sys.version_info
 if version.major == 2:
+    import unikube.cli.console as console
+
     console.error("Python 2 is not supported for Unikube. Please upgrade python.", _exit=True)
 
 
-@click.group(cls=DYMGroup, max_suggestions=2, cutoff=0.5)
+class LazyGroup(DYMGroup):
+    """
+    Command group which imports the module of a subcommand only when the subcommand is dispatched.
+    ``lazy_subcommands`` maps command names to ``(module:attribute, short help)``, the short help is listed in the
+    help text of the group (instead of importing the command).
+    """
+
+    def __init__(self, *args, lazy_subcommands: Dict[str, Tuple[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter) -> None:
+        # same as click.MultiCommand.format_commands, lazy subcommands are listed with their stored short help
+        commands = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self.lazy_subcommands:
+                commands.append((cmd_name, self.lazy_subcommands[cmd_name][1]))
+                continue
+
+            command = super().get_command(ctx, cmd_name)
+            if command is None or command.hidden:
+                continue
+            commands.append((cmd_name, command))
+
+        if not commands:
+            return
+
+        limit = formatter.width - 6 - max(len(cmd_name) for cmd_name, _ in commands)
+        rows = []
+        for cmd_name, command in commands:
+            if isinstance(command, str):
+                rows.append((cmd_name, make_default_short_help(command, limit)))
+            else:
+                rows.append((cmd_name, command.get_short_help_str(limit)))
+
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+    def _load_command(self, cmd_name) -> click.Command:
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy loading of {import_path} failed, it is not a command.")
+
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    max_suggestions=2,
+    cutoff=0.5,
+    lazy_subcommands={
+        "ps": ("unikube.cli.unikube:ps", "Displays the current process state."),
+        "init": ("unikube.cli.init:init", ""),
+        # shortcut
+        # -> include auth check in functions if required
+        "login": ("unikube.cli.auth:login", "Authenticate with a Unikube host."),
+        "logout": ("unikube.cli.auth:logout", "Log out of a Unikube host."),
+        "up": (
+            "unikube.cli.project:up",
+            "This command starts or resumes a Kubernetes cluster for the specified project.",
+        ),
+        "install": ("unikube.cli.deck:install", "Install a deck."),
+        "shell": ("unikube.cli.app:shell", "Drop into an interactive shell."),
+    },
+)
 @click.pass_context
 def cli(ctx, **kwargs):
     """
@@ -31,16 +99,21 @@ def cli(ctx, **kwargs):
 
     There are a couple of shortcut commands directly available from here.
     """
+    # members are created on first use
     ctx.obj = ClickContext()
 
 
 # click -----
 @click.command()
-def version():
+@click.option("--check-now", is_flag=True, default=False, help="Query the latest release instead of the cached one.")
+def version(check_now):
     """
     Check unikube version.
     """
-    version = compare_current_and_latest_versions()
+    import unikube.cli.console.logger as console
+    from unikube.helpers import compare_current_and_latest_versions
+
+    version = compare_current_and_latest_versions(check_now=check_now)
     if version is None:
         console.error("Could not determine version.")
 
@@ -48,10 +121,17 @@ def version():
 
 
 cli.add_command(version)
-cli.add_command(unikube_cmd.ps)
 
 
-@cli.group(cls=DYMGroup, max_suggestions=2, cutoff=0.5)
+@cli.group(
+    cls=LazyGroup,
+    max_suggestions=2,
+    cutoff=0.5,
+    lazy_subcommands={
+        "install": ("unikube.cli.system:install", "Install all required dependencies on your local machine."),
+        "verify": ("unikube.cli.system:verify", "Verifies the installation of dependencies on your local machine."),
+    },
+)
 @click.pass_obj
 def system(ctx):
     """
@@ -68,18 +148,25 @@ def completion(shell):
     Generate tab completion script for a given shell.
     Supported shells: bash.
     """
+    from unikube.completion.completion import render_completion_script
 
     render_completion_script(cli, shell)
 
 
 # system
-system.add_command(system_cmd.install)
-system.add_command(system_cmd.verify)
 system.add_command(completion)
 
 
 # organization
-@cli.group(cls=DYMGroup, max_suggestions=2, cutoff=0.5)
+@cli.group(
+    cls=LazyGroup,
+    max_suggestions=2,
+    cutoff=0.5,
+    lazy_subcommands={
+        "list": ("unikube.cli.orga:list", "List all your organizations."),
+        "info": ("unikube.cli.orga:info", "Display further information of the selected organization."),
+    },
+)
 @click.pass_obj
 def orga(ctx):
     """
@@ -102,12 +189,26 @@ def orga(ctx):
     """
 
 
-orga.add_command(orga_cmd.list)
-orga.add_command(orga_cmd.info)
-
-
 # project
-@cli.group(cls=DYMGroup, max_suggestions=2, cutoff=0.5)
+@cli.group(
+    cls=LazyGroup,
+    max_suggestions=2,
+    cutoff=0.5,
+    lazy_subcommands={
+        "list": ("unikube.cli.project:list", "Display a table of all available project names alongside with the ids."),
+        "info": (
+            "unikube.cli.project:info",
+            "Displays the id, title and optional description of the selected project.",
+        ),
+        "up": (
+            "unikube.cli.project:up",
+            "This command starts or resumes a Kubernetes cluster for the specified project.",
+        ),
+        "down": ("unikube.cli.project:down", "Stop/pause cluster."),
+        "delete": ("unikube.cli.project:delete", "Delete the current project and all related data."),
+        "prune": ("unikube.cli.project:prune", "Remove unused clusters."),
+    },
+)
 @click.pass_obj
 def project(ctx):
     """
@@ -115,16 +216,19 @@ def project(ctx):
     """
 
 
-project.add_command(project_cmd.list)
-project.add_command(project_cmd.info)
-project.add_command(project_cmd.up)
-project.add_command(project_cmd.down)
-project.add_command(project_cmd.delete)
-project.add_command(project_cmd.prune)
-
-
 # deck
-@cli.group(cls=DYMGroup, max_suggestions=2, cutoff=0.5)
+@cli.group(
+    cls=LazyGroup,
+    max_suggestions=2,
+    cutoff=0.5,
+    lazy_subcommands={
+        "list": ("unikube.cli.deck:list", "List all decks."),
+        "info": ("unikube.cli.deck:info", "Display further information of the selected deck."),
+        "install": ("unikube.cli.deck:install", "Install a deck."),
+        "uninstall": ("unikube.cli.deck:uninstall", "Uninstall a deck."),
+        "ingress": ("unikube.cli.deck:ingress", "Display ingress configuration for *installed* decks."),
+    },
+)
 @click.pass_obj
 def deck(ctx):
     """
@@ -132,15 +236,22 @@ def deck(ctx):
     """
 
 
-deck.add_command(deck_cmd.list)
-deck.add_command(deck_cmd.info)
-deck.add_command(deck_cmd.install)
-deck.add_command(deck_cmd.uninstall)
-deck.add_command(deck_cmd.ingress)
-
-
 # application
-@cli.group(cls=DYMGroup, max_suggestions=2, cutoff=0.5)
+@cli.group(
+    cls=LazyGroup,
+    max_suggestions=2,
+    cutoff=0.5,
+    lazy_subcommands={
+        "info": ("unikube.cli.app:info", "Display the status for the given app name."),
+        "list": ("unikube.cli.app:list", "List all apps."),
+        "shell": ("unikube.cli.app:shell", "Drop into an interactive shell."),
+        "switch": ("unikube.cli.app:switch", "Switch a running deployment with a local Docker container."),
+        "logs": ("unikube.cli.app:logs", "Display the logs for an app."),
+        "env": ("unikube.cli.app:env", "Display the environment variables for the given app."),
+        "exec": ("unikube.cli.app:exec", ""),
+        "update": ("unikube.cli.app:update", "Trigger a forced update of the given app."),
+    },
+)
 @click.pass_obj
 def app(ctx):
     """
@@ -148,18 +259,17 @@ def app(ctx):
     """
 
 
-app.add_command(app_cmd.info)
-app.add_command(app_cmd.list)
-app.add_command(app_cmd.shell)
-app.add_command(app_cmd.switch)
-app.add_command(app_cmd.logs)
-app.add_command(app_cmd.env)
-app.add_command(app_cmd.exec)
-app.add_command(app_cmd.update)
-
-
 # authentication
-@cli.group(cls=DYMGroup, max_suggestions=2, cutoff=0.5)
+@cli.group(
+    cls=LazyGroup,
+    max_suggestions=2,
+    cutoff=0.5,
+    lazy_subcommands={
+        "login": ("unikube.cli.auth:login", "Authenticate with a Unikube host."),
+        "logout": ("unikube.cli.auth:logout", "Log out of a Unikube host."),
+        "status": ("unikube.cli.auth:status", "View authentication status."),
+    },
+)
 def auth():
     """
     The authentication command group unites all subcommands for managing Unikube's authentication process. Besides the
@@ -169,13 +279,17 @@ def auth():
     """
 
 
-auth.add_command(auth_cmd.login)
-auth.add_command(auth_cmd.logout)
-auth.add_command(auth_cmd.status)
-
-
 # context
-@cli.group(cls=DYMGroup, max_suggestions=2, cutoff=0.5)
+@cli.group(
+    cls=LazyGroup,
+    max_suggestions=2,
+    cutoff=0.5,
+    lazy_subcommands={
+        "set": ("unikube.cli.context:set", "Set the local context."),
+        "remove": ("unikube.cli.context:remove", "Remove the local context."),
+        "show": ("unikube.cli.context:show", "Show the context."),
+    },
+)
 @click.pass_obj
 def context(ctx):
     """
@@ -183,19 +297,3 @@ def context(ctx):
     You can :ref:`reference/context:set` and :ref:`reference/context:remove` the organization, project
     and deck context. Use :ref:`reference/context:show` to show the current context.
     """
-
-
-context.add_command(context_cmd.set)
-context.add_command(context_cmd.remove)
-context.add_command(context_cmd.show)
-
-# init
-cli.add_command(init_cmd.init)
-
-# shortcut
-# -> include auth check in functions if required
-cli.add_command(auth_cmd.login)
-cli.add_command(auth_cmd.logout)
-cli.add_command(project_cmd.up)
-cli.add_command(deck_cmd.install)
-cli.add_command(app_cmd.shell)
@@ -1,11 +1,80 @@
+import click
+
+
 class ClickContext(object):
+    """
+    Shared objects of a command. They are created on first use, hence commands which do not need them (e.g.
+    ``unikube version``) do not pay for imports and storage reads.
+    """
+
     def __init__(self):
-        from unikube.authentication.authentication import get_authentication
-        from unikube.context.context import Context
-        from unikube.local.providers.manager import K8sClusterManager
-        from unikube.storage.general import LocalStorageGeneral
-
-        self.auth = get_authentication()
-        self.storage_general = LocalStorageGeneral()
-        self.context: Context = Context(auth=self.auth)
-        self.cluster_manager = K8sClusterManager()
+        self._auth = None
+        self._storage_general = None
+        self._context = None
+        self._cluster_manager = None
+        self._graphql_transport_registry = None
+
+    @property
+    def auth(self):
+        if self._auth is None:
+            from unikube.authentication.authentication import get_authentication
+
+            self._auth = get_authentication()
+        return self._auth
+
+    @auth.setter
+    def auth(self, value):
+        self._auth = value
+
+    @property
+    def storage_general(self):
+        if self._storage_general is None:
+            from unikube.storage.general import LocalStorageGeneral
+
+            self._storage_general = LocalStorageGeneral()
+        return self._storage_general
+
+    @storage_general.setter
+    def storage_general(self, value):
+        self._storage_general = value
+
+    @property
+    def context(self):
+        if self._context is None:
+            from unikube.context.context import Context
+
+            self._context = Context(auth=self.auth)
+        return self._context
+
+    @context.setter
+    def context(self, value):
+        self._context = value
+
+    @property
+    def cluster_manager(self):
+        if self._cluster_manager is None:
+            from unikube.local.providers.manager import K8sClusterManager
+
+            self._cluster_manager = K8sClusterManager()
+        return self._cluster_manager
+
+    @cluster_manager.setter
+    def cluster_manager(self, value):
+        self._cluster_manager = value
+
+    @property
+    def graphql_transport_registry(self):
+        if self._graphql_transport_registry is None:
+            from unikube.graphql_utils import GraphQLTransportRegistry
+
+            self._graphql_transport_registry = GraphQLTransportRegistry()
+
+            # the connections are closed at the end of the command
+            click_context = click.get_current_context(silent=True)
+            if click_context is not None:
+                click_context.find_root().call_on_close(self._graphql_transport_registry.close)
+        return self._graphql_transport_registry
+
+    @graphql_transport_registry.setter
+    def graphql_transport_registry(self, value):
+        self._graphql_transport_registry = value
@@ -1,11 +1,12 @@
 import os
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from unikube import settings
 from unikube.cli import console
 from unikube.context.helper import convert_context_arguments, is_valid_uuid4
 from unikube.context.types import ContextData
+from unikube.storage.local_storage import storage_revision
 from unikube.storage.user import LocalStorageUser, get_local_storage_user
 from unikube.unikubefile.selector import unikube_file_selector
 from unikube.unikubefile.unikube_file import UnikubeFile
@@ -107,22 +108,47 @@ class ContextLogic:
 
 
 class Context:
+    path_unikube_file = "unikube.yaml"
+
     def __init__(self, auth):
         self._auth = auth
 
-    def get(self, **kwargs) -> ContextData:
-        local_storage_user = get_local_storage_user()
-
-        context_logic = ContextLogic(
-            [
-                ClickOptionContext(
-                    click_options={key: kwargs[key] for key in ("organization", "project", "deck") if key in kwargs}
-                ),
-                UnikubeFileContext(path_unikube_file="unikube.yaml"),
-                LocalContext(local_storage_user=local_storage_user),
-            ]
+        # resolved contexts of this invocation
+        self._cache: Dict[tuple, ContextData] = {}
+
+    def _cache_key(self, click_options: dict) -> tuple:
+        # unikube.yaml (path + modification time) and storage revision, a change of either invalidates the context
+        path_unikube_file = os.path.abspath(self.path_unikube_file)
+        try:
+            mtime_unikube_file: Optional[int] = os.stat(path_unikube_file).st_mtime_ns
+        except OSError:
+            mtime_unikube_file = None
+
+        return (
+            tuple(sorted(click_options.items())),
+            path_unikube_file,
+            mtime_unikube_file,
+            storage_revision(),
         )
-        context = context_logic.get()
+
+    def get(self, **kwargs) -> ContextData:
+        click_options = {key: kwargs[key] for key in ("organization", "project", "deck") if key in kwargs}
+
+        cache_key = self._cache_key(click_options)
+        context = self._cache.get(cache_key, None)
+        if context is None:
+            context_logic = ContextLogic(
+                [
+                    ClickOptionContext(click_options=click_options),
+                    UnikubeFileContext(path_unikube_file=self.path_unikube_file),
+                    LocalContext(local_storage_user=get_local_storage_user()),
+                ]
+            )
+            context = context_logic.get()
+            self._cache[cache_key] = context
+
+        # copy, the cached context must not be modified by the caller
+        context = context.copy()
 
         # show context
         if settings.CLI_ALWAYS_SHOW_CONTEXT:
@@ -1,10 +1,18 @@
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 from uuid import UUID
 
 from slugify import slugify
 
 from unikube.cli import console
+from unikube.graphql_operations import (
+    CONTEXT_OPTIONS,
+    DECKS_WITH_PROJECT,
+    ORGANIZATIONS,
+    PROJECTS_WITH_ORGANIZATION,
+    Operation,
+)
 from unikube.graphql_utils import GraphQL
+from unikube.storage.index import LocalStorageResolutionIndex
 
 
 class ArgumentError(Exception):
@@ -46,56 +54,61 @@ def __select_result(argument_value: str, results: list, exception_message: str =
     return results[index]["id"]
 
 
+def __select_indexed_result(
+    auth, field: str, query: Operation, query_variables: dict, key: str, argument_value: str
+) -> str:
+    # index (no request)
+    local_storage_index = LocalStorageResolutionIndex(user_email=auth.general_data.authentication.email)
+    id = local_storage_index.lookup(field, argument_value, **query_variables)
+    if id:
+        return id
+
+    # index miss or ambiguous name/slug: select from the (cached) list and update the index
+    graph_ql = GraphQL(authentication=auth)
+    data = graph_ql.query(query, query_variables=query_variables or None, cache=True)
+    local_storage_index.update(field, data[key]["results"], **query_variables)
+    try:
+        return __select_result(argument_value, data[key]["results"], exception_message=field)
+    except ArgumentError:
+        # the cached list may be outdated (e.g. a recently created project), try again with a fresh one
+        graph_ql.invalidate(query, query_variables=query_variables or None)
+
+    data = graph_ql.query(query, query_variables=query_variables or None, cache=True)
+    local_storage_index.update(field, data[key]["results"], **query_variables)
+    return __select_result(argument_value, data[key]["results"], exception_message=field)
+
+
 def convert_organization_argument_to_uuid(auth, argument_value: str) -> str:
     # uuid provided (no conversion required)
     if is_valid_uuid4(argument_value):
         return argument_value
 
-    # get available context options or use provided data (e.g. from previous query)
-    graph_ql = GraphQL(authentication=auth)
-    data = graph_ql.query(
-        """
-        query {
-            allOrganizations {
-                results {
-                    title
-                    id
-                }
-            }
-        }
-        """
+    return __select_indexed_result(
+        auth,
+        "organization",
+        ORGANIZATIONS,
+        query_variables={},
+        key="allOrganizations",
+        argument_value=argument_value,
     )
 
-    results = data["allOrganizations"]["results"]
-    return __select_result(argument_value, results, exception_message="organization")
-
 
 def convert_project_argument_to_uuid(auth, argument_value: str, organization_id: str = None) -> str:
     # uuid provided (no conversion required)
     if is_valid_uuid4(argument_value):
         return argument_value
 
-    # get available context options or use provided data (e.g. from previous query)
-    graph_ql = GraphQL(authentication=auth)
-    data = graph_ql.query(
-        """
-        query($organization_id: UUID) {
-            allProjects(organizationId: $organization_id) {
-                results {
-                    title
-                    id
-                }
-            }
-        }
-        """,
+    return __select_indexed_result(
+        auth,
+        "project",
+        PROJECTS_WITH_ORGANIZATION,
         query_variables={
             "organization_id": organization_id,
         },
+        key="allProjects",
+        argument_value=argument_value,
     )
 
-    results = data["allProjects"]["results"]
-    return __select_result(argument_value, results, exception_message="project")
-
 
 def convert_deck_argument_to_uuid(
     auth, argument_value: str, organization_id: str = None, project_id: str = None
@@ -104,52 +117,114 @@ def convert_deck_argument_to_uuid(
     if is_valid_uuid4(argument_value):
         return argument_value
 
-    # get available context options or use provided data (e.g. from previous query)
-    graph_ql = GraphQL(authentication=auth)
-    data = graph_ql.query(
-        """
-        query($organization_id: UUID, $project_id: UUID) {
-            allDecks(organizationId: $organization_id, projectId: $project_id) {
-                results {
-                    title
-                    id
-                }
-            }
-        }
-        """,
+    return __select_indexed_result(
+        auth,
+        "deck",
+        DECKS_WITH_PROJECT,
         query_variables={
             "organization_id": organization_id,
             "project_id": project_id,
         },
+        key="allDecks",
+        argument_value=argument_value,
     )
 
-    results = data["allDecks"]["results"]
-    return __select_result(argument_value, results, exception_message="deck")
+
+def __filter_results(results: list, organization_id: str = None, project_id: str = None) -> list:
+    # results of the given organization/project (e.g. all decks of a project)
+    filtered = []
+    for item in results:
+        project = item.get("project", None) or {}
+        organization = item.get("organization", None) or project.get("organization", None) or {}
+        if organization_id and organization.get("id", None) != organization_id:
+            continue
+        if project_id and project.get("id", None) != project_id:
+            continue
+        filtered.append(item)
+
+    return filtered
+
+
+def resolve_context_arguments(
+    auth, organization_argument: str = None, project_argument: str = None, deck_argument: str = None
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Convert organization, project and deck arguments (uuid, name or slug) to ids. Arguments which are not in the
+    index are resolved with a single query for all required lists, instead of one query per argument.
+    """
+    local_storage_index = LocalStorageResolutionIndex(user_email=auth.general_data.authentication.email)
+    arguments = {"organization": organization_argument, "project": project_argument, "deck": deck_argument}
+
+    def resolve(
+        data: Dict[str, Optional[dict]] = None, indexed: Dict[str, Optional[str]] = None
+    ) -> Dict[str, Optional[str]]:
+        # ids of the index are kept, the queried lists only contain the pending fields
+        ids = dict(indexed or {"organization": None, "project": None, "deck": None})
+        for field, key in [("organization", "allOrganizations"), ("project", "allProjects"), ("deck", "allDecks")]:
+            argument_value = arguments[field]
+            if not argument_value or ids[field]:
+                continue
+
+            scope = {"organization_id": ids["organization"]}
+            if field == "deck":
+                scope["project_id"] = ids["project"]
+
+            if is_valid_uuid4(argument_value):
+                ids[field] = argument_value
+            elif data is None:
+                # a hit is only accepted within its given (and resolved) parents, otherwise the field is queried
+                parents = ["organization"] if field == "project" else ["organization", "project"]
+                if field == "organization" or all(ids[parent] or not arguments[parent] for parent in parents):
+                    ids[field] = local_storage_index.lookup(field, argument_value, **scope)
+            else:
+                results = __filter_results(data[key]["results"], **scope)
+                ids[field] = __select_result(argument_value, results, exception_message=field)
+
+        return ids
+
+    # index (no request)
+    indexed = resolve()
+    pending = {field: bool(arguments[field] and not indexed[field]) for field in arguments}
+    if not any(pending.values()):
+        return indexed["organization"], indexed["project"], indexed["deck"]
+
+    # all required lists with one (cached) query, unresolved names are selected locally; there is no subtree query,
+    # the project and deck lists are limited to the organization/project ids which are already known
+    scope = {"organization_id": indexed["organization"], "project_id": indexed["project"]}
+    query_variables = {**pending, **scope}
+    graph_ql = GraphQL(authentication=auth)
+    data = graph_ql.query(CONTEXT_OPTIONS, query_variables=query_variables, cache=True)
+    try:
+        ids = resolve(data, indexed)
+    except ArgumentError:
+        # the cached lists may be outdated (e.g. a recently created project), try again with fresh ones
+        graph_ql.invalidate(CONTEXT_OPTIONS, query_variables=query_variables)
+        data = graph_ql.query(CONTEXT_OPTIONS, query_variables=query_variables, cache=True)
+        ids = resolve(data, indexed)
+    finally:
+        # only the queried scope of the index is replaced
+        scopes = {
+            "organization": {},
+            "project": {"organization_id": scope["organization_id"]},
+            "deck": scope,
+        }
+        for field, key in [("organization", "allOrganizations"), ("project", "allProjects"), ("deck", "allDecks")]:
+            if data.get(key, None):
+                local_storage_index.update(field, data[key]["results"], **scopes[field])
+
+    return ids["organization"], ids["project"], ids["deck"]
 
 
 def convert_context_arguments(
     auth, organization_argument: str = None, project_argument: str = None, deck_argument: str = None
 ) -> Tuple[str, str, str]:
     try:
-        # organization
-        if organization_argument:
-            organization_id = convert_organization_argument_to_uuid(auth, organization_argument)
-        else:
-            organization_id = None
-
-        # project
-        if project_argument:
-            project_id = convert_project_argument_to_uuid(auth, project_argument, organization_id=organization_id)
-        else:
-            project_id = None
-
-        # deck
-        if deck_argument:
-            deck_id = convert_deck_argument_to_uuid(
-                auth, deck_argument, organization_id=organization_id, project_id=project_id
-            )
-        else:
-            deck_id = None
+        organization_id, project_id, deck_id = resolve_context_arguments(
+            auth,
+            organization_argument=organization_argument,
+            project_argument=project_argument,
+            deck_argument=deck_argument,
+        )
     except Exception as e:
         console.error(e, _exit=True)
 
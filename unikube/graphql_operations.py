@@ -0,0 +1,378 @@
+import hashlib
+from typing import Dict, Iterator
+
+from gql import gql
+from graphql import DocumentNode, print_ast
+
+
+class Operation:
+    def __init__(self, name: str, query: str):
+        self.name = name
+        self.query = query
+
+        self._document = None
+        self._text = None
+        self._hash = None
+
+    def __repr__(self):
+        return f"Operation({self.name})"
+
+    @property
+    def document(self) -> DocumentNode:
+        # parsed on first use, then cached for the rest of the process
+        if self._document is None:
+            self._document = gql(self.query)
+
+        return self._document
+
+    @property
+    def text(self) -> str:
+        # printed (normalized) document, e.g. the query of a persisted query
+        if self._text is None:
+            self._text = print_ast(self.document)
+
+        return self._text
+
+    @property
+    def hash(self) -> str:
+        # sha256 of the printed document (e.g. the id of a persisted query)
+        if self._hash is None:
+            self._hash = hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+        return self._hash
+
+
+class OperationRegistry:
+    def __init__(self):
+        self._operations: Dict[str, Operation] = {}
+
+    def __iter__(self) -> Iterator[Operation]:
+        return iter(self._operations.values())
+
+    def register(self, name: str, query: str) -> Operation:
+        if name in self._operations:
+            raise ValueError(f"Operation '{name}' is already registered.")
+
+        operation = Operation(name=name, query=query)
+        self._operations[name] = operation
+        return operation
+
+    def get(self, name: str) -> Operation:
+        return self._operations[name]
+
+    def hashes(self) -> Dict[str, str]:
+        return {operation.name: operation.hash for operation in self}
+
+
+operation_registry = OperationRegistry()
+
+
+# organization
+ORGANIZATIONS = operation_registry.register(
+    "organizations",
+    """
+    query {
+        allOrganizations {
+            results {
+                id
+                title
+            }
+        }
+    }
+    """,
+)
+
+ORGANIZATION_INFO = operation_registry.register(
+    "organizationInfo",
+    """
+    query($id: UUID!) {
+        organization(id: $id) {
+            id
+            title
+            description
+        }
+    }
+    """,
+)
+
+# project
+PROJECTS_WITH_ORGANIZATION = operation_registry.register(
+    "projectsWithOrganization",
+    """
+    query($organization_id: UUID) {
+        allProjects(organizationId: $organization_id) {
+            results {
+                title
+                id
+                organization {
+                    id
+                    title
+                }
+            }
+        }
+    }
+    """,
+)
+
+PROJECT_LIST = operation_registry.register(
+    "projectList",
+    """
+    query($organization_id: UUID) {
+        allProjects(organizationId: $organization_id) {
+            results {
+                title
+                id
+                description
+            }
+        }
+    }
+    """,
+)
+
+PROJECT_IDS = operation_registry.register(
+    "projectIds",
+    """
+    query {
+        allProjects {
+            results {
+                id
+            }
+        }
+    }
+    """,
+)
+
+PROJECT_INFO = operation_registry.register(
+    "projectInfo",
+    """
+    query($id: UUID!) {
+        project(id: $id) {
+            id
+            title
+            description
+            specRepository
+            specRepositoryBranch
+            organization {
+                title
+            }
+        }
+    }
+    """,
+)
+
+PROJECT_CLUSTER_SETTINGS = operation_registry.register(
+    "projectClusterSettings",
+    """
+    query($id: UUID) {
+        project(id: $id) {
+            title
+            id
+            organization {
+                id
+            }
+            clusterSettings {
+                id
+                port
+            }
+            organization {
+                title
+            }
+        }
+    }
+    """,
+)
+
+PROJECT_ORGANIZATION = operation_registry.register(
+    "projectOrganization",
+    """
+    query($id: UUID) {
+        project(id: $id) {
+            organization {
+                id
+            }
+        }
+    }
+    """,
+)
+
+# deck
+DECKS_WITH_PROJECT = operation_registry.register(
+    "decksWithProject",
+    """
+    query($organization_id: UUID, $project_id: UUID) {
+        allDecks(organizationId: $organization_id, projectId: $project_id) {
+            results {
+                title
+                id
+                project {
+                    id
+                    title
+                    organization {
+                        id
+                    }
+                }
+            }
+        }
+    }
+    """,
+)
+
+DECK_LIST = operation_registry.register(
+    "deckList",
+    """
+    query($organization_id: UUID, $project_id: UUID) {
+        allDecks(organizationId: $organization_id, projectId: $project_id) {
+            results {
+                id
+                title
+                project {
+                    title
+                    organization {
+                        title
+                    }
+                }
+            }
+        }
+    }
+    """,
+)
+
+DECK = operation_registry.register(
+    "deck",
+    """
+    query($id: UUID) {
+        deck(id: $id) {
+            id
+            title
+            environment {
+                id
+                type
+                valuesPath
+                namespace
+            }
+            project {
+                id
+                title
+                organization {
+                    title
+                }
+            }
+        }
+    }
+    """,
+)
+
+DECK_INFO = operation_registry.register(
+    "deckInfo",
+    """
+    query($id: UUID) {
+        deck(id: $id) {
+            id
+            title
+            description
+            namespace
+            type
+        }
+    }
+    """,
+)
+
+DECK_NAMESPACE = operation_registry.register(
+    "deckNamespace",
+    """
+    query($id: UUID) {
+        deck(id: $id) {
+            id
+            title
+            environment {
+                namespace
+            }
+            project {
+                id
+            }
+        }
+    }
+    """,
+)
+
+DECK_DEPLOYMENTS = operation_registry.register(
+    "deckDeployments",
+    """
+    query($id: UUID) {
+        deck(id: $id) {
+            id
+            title
+            project {
+                id
+            }
+            deployments(level: "local") {
+                id
+                title
+                description
+                ports
+                isSwitchable
+            }
+            environment {
+                id
+                type
+                valuesPath
+                namespace
+            }
+        }
+    }
+    """,
+)
+
+DECK_PROJECT = operation_registry.register(
+    "deckProject",
+    """
+    query($id: UUID) {
+        deck(id: $id) {
+            project {
+                id
+                organization {
+                    id
+                }
+            }
+        }
+    }
+    """,
+)
+
+# context (the API has no organization -> project -> deck subtree, the lists are scoped by the known parent ids)
+CONTEXT_OPTIONS = operation_registry.register(
+    "contextOptions",
+    """
+    query(
+        $organization: Boolean!, $project: Boolean!, $deck: Boolean!, $organization_id: UUID, $project_id: UUID
+    ) {
+        allOrganizations @include(if: $organization) {
+            results {
+                id
+                title
+            }
+        }
+        allProjects(organizationId: $organization_id) @include(if: $project) {
+            results {
+                id
+                title
+                organization {
+                    id
+                }
+            }
+        }
+        allDecks(organizationId: $organization_id, projectId: $project_id) @include(if: $deck) {
+            results {
+                id
+                title
+                project {
+                    id
+                    organization {
+                        id
+                    }
+                }
+            }
+        }
+    }
+    """,
+)
@@ -1,15 +1,27 @@
+import hashlib
+import json
 import sys
 from enum import Enum
+from functools import lru_cache
+from threading import Lock, Thread
+from time import time
 from typing import Union
 
+import click
 import click_spinner
-from gql import Client, gql
-from gql.transport.exceptions import TransportServerError
+import requests
+from gql import Client
+from gql.client import SyncClientSession
+from gql.transport.exceptions import TransportProtocolError, TransportServerError
 from gql.transport.requests import RequestsHTTPTransport
+from graphql import DocumentNode, ExecutionResult, print_ast
 from retrying import retry
 
 import unikube.cli.console as console
 from unikube import settings
+from unikube.graphql_operations import Operation
+from unikube.storage.cache import LocalStorageCache
+from unikube.storage.types import CacheData
 
 
 # EnvironmentType
@@ -27,68 +39,344 @@ def retry_exception(exception):
     return isinstance(exception, RetryException)
 
 
-class GraphQL:
-    def __init__(
+@lru_cache(maxsize=128)
+def _ad_hoc_operation(query: str) -> Operation:
+    return Operation(name="", query=query)
+
+
+def get_operation(query: Union[str, Operation]) -> Operation:
+    # registered operations are parsed (and hashed) once per process, ad-hoc query strings are memoized
+    if isinstance(query, Operation):
+        return query
+
+    return _ad_hoc_operation(query)
+
+
+def get_document(query: Union[str, Operation]) -> DocumentNode:
+    return get_operation(query).document
+
+
+class PersistedQueryHTTPTransport(RequestsHTTPTransport):
+    """
+    Sends automatic persisted queries (APQ): the first request only contains the sha256 hash of the query. The full
+    document is sent once, if the server replies with ``PersistedQueryNotFound``. If the server does not support
+    persisted queries at all, the transport falls back to regular requests.
+    """
+
+    def __init__(self, *args, persisted_queries: bool = settings.GRAPHQL_PERSISTED_QUERIES, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.persisted_queries = persisted_queries
+
+    def execute(
         self,
-        authentication,
-        url=settings.GRAPHQL_URL,
-        timeout=settings.GRAPHQL_TIMEOUT,
-    ):
-        self.url = url
-        self.timeout = timeout
+        document: DocumentNode,
+        variable_values: dict = None,
+        operation_name: str = None,
+        timeout: int = None,
+        extra_args: dict = None,
+        upload_files: bool = False,
+        operation: Operation = None,
+    ) -> ExecutionResult:
+        if not self.persisted_queries or upload_files or extra_args:
+            return super().execute(
+                document,
+                variable_values=variable_values,
+                operation_name=operation_name,
+                timeout=timeout,
+                extra_args=extra_args,
+                upload_files=upload_files,
+            )
 
-        # automatic token refresh
-        self.authentication = authentication
-        self.access_token = str(authentication.general_data.authentication.access_token)
+        # the operation carries the printed query and its hash, other documents are printed per request
+        if operation is None:
+            query = print_ast(document)
+            query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        else:
+            query, query_hash = operation.text, operation.hash
 
-        # client
-        self.client = self._client()
+        payload = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}}
+        if variable_values:
+            payload["variables"] = variable_values
+        if operation_name:
+            payload["operationName"] = operation_name
+
+        # hash only
+        response = self._post(payload, timeout=timeout)
+        error = self._persisted_query_error(response)
+        if not error:
+            return self._execution_result(response)
+
+        # explicitly not supported by the server
+        if error == "PersistedQueryNotSupported":
+            self.persisted_queries = False
+
+        # full document (registers the hash with the server)
+        response = self._post({**payload, "query": query}, timeout=timeout)
+
+        # hash-only requests are rejected (e.g. by a gateway without APQ support) while the full document is accepted,
+        # hence full documents are sent from now on instead of two requests per query
+        if error == "BadRequest" and response.status_code < 400:
+            self.persisted_queries = False
+
+        return self._execution_result(response)
+
+    def _post(self, payload: dict, timeout: int = None):
+        return self.session.request(
+            self.method,
+            self.url,
+            json=payload,
+            headers=self.headers,
+            auth=self.auth,
+            cookies=self.cookies,
+            timeout=timeout or self.default_timeout,
+            verify=self.verify,
+            **self.kwargs,
+        )
+
+    @staticmethod
+    def _persisted_query_error(response) -> Union[str, None]:
+        if response.status_code in [401, 403]:
+            return None
+
+        try:
+            errors = response.json().get("errors", None) or []
+        except Exception:
+            errors = []
+
+        for error in errors:
+            message = error.get("message", "")
+            code = (error.get("extensions", None) or {}).get("code", "")
+            if message == "PersistedQueryNotFound" or code == "PERSISTED_QUERY_NOT_FOUND":
+                return "PersistedQueryNotFound"
+            if message == "PersistedQueryNotSupported" or code == "PERSISTED_QUERY_NOT_SUPPORTED":
+                return "PersistedQueryNotSupported"
+
+        # e.g. servers without APQ support reject a request without query (see execute)
+        if response.status_code == 400:
+            return "BadRequest"
+
+        return None
+
+    def _execution_result(self, response) -> ExecutionResult:
+        # same as RequestsHTTPTransport: a GraphQL result is returned regardless of the status code (its errors are
+        # raised as TransportQueryError by the session), other responses raise TransportServerError (status >= 400)
+        self.response_headers = response.headers
+
+        try:
+            result = response.json()
+        except Exception:
+            result = {}
+
+        if "errors" not in result and "data" not in result:
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                raise TransportServerError(str(e), e.response.status_code) from e
+
+            raise TransportProtocolError(f"Server did not return a GraphQL result: {response.text}")
+
+        return ExecutionResult(
+            errors=result.get("errors"),
+            data=result.get("data"),
+            extensions=result.get("extensions"),
+        )
+
+
+class GraphQLTransportRegistry:
+    """
+    Keeps one connected GraphQL client session per URL. All queries of a command share this session and hence the
+    keep-alive connection of the underlying ``requests.Session``.
+    """
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = Lock()
+
+    def get(self, url: str, access_token: str) -> SyncClientSession:
+        with self._lock:
+            session = self._sessions.get(url, None)
+            if not session:
+                session = self._connect(url)
+                self._sessions[url] = session
+
+            # a refreshed token only swaps the header, the connection is kept
+            session.transport.headers["Authorization"] = "Bearer " + str(access_token)
 
-    def _client(self):
+        return session
+
+    @staticmethod
+    def _connect(url: str, retries: int = 3) -> SyncClientSession:
         # header
         headers = {
             "Content-type": "application/json",
-            "Authorization": "Bearer " + str(self.access_token),
         }
 
         # transport
-        transport = RequestsHTTPTransport(
-            url=self.url,
+        transport = PersistedQueryHTTPTransport(
+            url=url,
             use_json=True,
             headers=headers,
             verify=False,
-            retries=3,
-            timeout=self.timeout,
+            retries=retries,
         )
+        transport.connect()
 
         # client
         client = Client(transport=transport)
 
-        return client
+        return SyncClientSession(client=client)
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.transport.close()
+            self._sessions = {}
+
+
+def get_transport_registry() -> GraphQLTransportRegistry:
+    # the registry lives on the ClickContext of the current command
+    click_context = click.get_current_context(silent=True)
+    transport_registry = getattr(getattr(click_context, "obj", None), "graphql_transport_registry", None)
+    if transport_registry is None:
+        # no command context (e.g. scripts or tests), the transport is not shared
+        transport_registry = GraphQLTransportRegistry()
+
+    return transport_registry
+
+
+class GraphQL:
+    # cache keys which are currently revalidated in the background (process-wide)
+    _revalidating = set()
+    _revalidating_lock = Lock()
+
+    def __init__(
+        self,
+        authentication,
+        url=settings.GRAPHQL_URL,
+        timeout=settings.GRAPHQL_TIMEOUT,
+        transport_registry: GraphQLTransportRegistry = None,
+    ):
+        self.url = url
+        self.timeout = timeout
+
+        # automatic token refresh
+        self.authentication = authentication
+        self.access_token = str(authentication.general_data.authentication.access_token)
+
+        # session (pooled transport)
+        self.transport_registry = transport_registry or get_transport_registry()
+        self.session = self.transport_registry.get(self.url, access_token=self.access_token)
 
-    @retry(retry_on_exception=retry_exception, stop_max_attempt_number=2)
     def query(
         self,
-        query: str,
+        query: Union[str, Operation],
         query_variables: dict = None,
+        cache: bool = False,
     ) -> Union[dict, None]:
+        """
+        Execute a GraphQL query. With ``cache`` enabled, the response is served from the local response cache
+        as long as it is younger than ``GRAPHQL_CACHE_MAX_AGE``. Stale responses (older than ``GRAPHQL_CACHE_TTL``)
+        are returned immediately and refreshed in the background.
+        """
+        if not cache:
+            return self._query(query, query_variables)
+
+        local_storage_cache = LocalStorageCache()
+        cache_key = self._cache_key(query, query_variables)
+        cache_data = local_storage_cache.get(id=cache_key)
+
+        if cache_data.age < settings.GRAPHQL_CACHE_MAX_AGE:
+            if cache_data.age > settings.GRAPHQL_CACHE_TTL:
+                self._revalidate(cache_key, query, query_variables)
+            return cache_data.data
+
+        data = self._query(query, query_variables)
+        local_storage_cache.set(id=cache_key, data=CacheData(id=cache_key, data=data, timestamp=time()))
+        return data
+
+    def invalidate(self, query: Union[str, Operation], query_variables: dict = None) -> None:
+        LocalStorageCache().delete(id=self._cache_key(query, query_variables))
+
+    @retry(retry_on_exception=retry_exception, stop_max_attempt_number=2)
+    def _query(
+        self,
+        query: Union[str, Operation],
+        query_variables: dict = None,
+        spinner: bool = True,
+    ) -> Union[dict, None]:
+        # refresh the token before the request instead of after a rejected one
+        if self.authentication.access_token_expires_in(self.access_token) < settings.TOKEN_REFRESH_LEEWAY:
+            self._refresh_token()
+
         try:
-            query = gql(query)
-            with click_spinner.spinner(beep=False, disable=False, force=False, stream=sys.stdout):
-                data = self.client.execute(
-                    document=query,
+            operation = get_operation(query)
+            with click_spinner.spinner(beep=False, disable=not spinner, force=False, stream=sys.stdout):
+                data = self.session.execute(
+                    operation.document,
                     variable_values=query_variables,
+                    timeout=self.timeout,
+                    operation=operation,
                 )
 
-        except TransportServerError:
-            # refresh token
-            response = self.authentication.refresh()
-            if not response["success"]:
-                console.exit_login_required()
-
-            self.access_token = response["response"]["access_token"]
-            self.client = self._client()
+        except TransportServerError as e:
+            # token revoked or rejected by the server (e.g. clock skew)
+            if e.code != 401:
+                raise
 
+            self._refresh_token()
             raise RetryException("retry")
 
         return data
+
+    def _refresh_token(self) -> None:
+        response = self.authentication.refresh()
+        if not response["success"]:
+            console.exit_login_required()
+
+        self.access_token = response["response"]["access_token"]
+        self.session = self.transport_registry.get(self.url, access_token=self.access_token)
+
+    def _cache_key(self, query: Union[str, Operation], query_variables: dict = None) -> str:
+        # responses are user specific, e.g. allProjects only returns the projects the user has access to
+        email = self.authentication.general_data.authentication.email
+        if isinstance(query, Operation):
+            query = query.query
+        key = json.dumps({"query": query, "variables": query_variables, "email": email}, sort_keys=True)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _revalidate(self, cache_key: str, query: Union[str, Operation], query_variables: dict = None) -> None:
+        with GraphQL._revalidating_lock:
+            if cache_key in GraphQL._revalidating:
+                return
+            GraphQL._revalidating.add(cache_key)
+
+        def _refresh():
+            session = None
+            try:
+                # an expiring token is refreshed by the next (foreground) query, the response stays stale until then
+                if self.authentication.access_token_expires_in(self.access_token) < settings.TOKEN_REFRESH_LEEWAY:
+                    return
+
+                # own session without retries, the shared one retries failed requests
+                session = GraphQLTransportRegistry._connect(self.url, retries=0)
+                session.transport.headers["Authorization"] = "Bearer " + str(self.access_token)
+
+                operation = get_operation(query)
+                data = session.execute(
+                    operation.document,
+                    variable_values=query_variables,
+                    timeout=settings.GRAPHQL_REVALIDATE_TIMEOUT,
+                    operation=operation,
+                )
+                LocalStorageCache().set(id=cache_key, data=CacheData(id=cache_key, data=data, timestamp=time()))
+            except (Exception, SystemExit) as e:
+                console.debug(e)
+            finally:
+                if session is not None:
+                    session.transport.close()
+                with GraphQL._revalidating_lock:
+                    GraphQL._revalidating.discard(cache_key)
+
+        # non-daemon: the interpreter waits for the refresh to be stored before it exits, which is bounded by a single
+        # attempt with GRAPHQL_REVALIDATE_TIMEOUT
+        Thread(target=_refresh).start()
@@ -1,23 +1,34 @@
 import re
+import subprocess
 import sys
 from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urljoin
 
 import click_spinner
-import pkg_resources
-import requests
-from requests import HTTPError, Session
 
 import unikube.cli.console as console
 from unikube import settings
-from unikube.authentication.authentication import TokenAuthentication
-from unikube.context import ClickContext
-from unikube.graphql_utils import EnvironmentType
 from unikube.local.providers.types import K8sProviderType
-from unikube.local.system import Telepresence
+from unikube.storage.cache import LocalStorageCache
+from unikube.storage.types import CacheData
 
+# requests, kubernetes and GraphQL are imported on use (e.g. 'unikube version' does not need them)
+if TYPE_CHECKING:
+    from requests import Session
+
+    from unikube.authentication.authentication import TokenAuthentication
+    from unikube.context import ClickContext
+
+# latest release version (GitHub)
+RELEASE_CACHE_KEY = "latest_release"
+RELEASE_ATTEMPT_CACHE_KEY = "latest_release:attempt"
+
+
+def get_requests_session(access_token) -> "Session":
+    import requests
 
-def get_requests_session(access_token) -> Session:
     session = requests.Session()
     session.headers.update({"Content-type": "application/json", "Authorization": "Bearer " + str(access_token)})
     return session
@@ -35,7 +46,9 @@ def download_specs(access_token: str, environment_id: str):
     return manifest
 
 
-def download_manifest(deck: dict, authentication: TokenAuthentication, access_token: str, environment_index: int = 0):
+def download_manifest(deck: dict, authentication: "TokenAuthentication", access_token: str, environment_index: int = 0):
+    from requests import HTTPError
+
     try:
         environment_id = deck["environment"][environment_index]["id"]
         console.info("Requesting manifests. This process may take a few seconds.")
@@ -76,6 +89,8 @@ def download_manifest(deck: dict, authentication: TokenAuthentication, access_to
 
 # environment
 def environment_type_from_string(environment_type: str):
+    from unikube.graphql_utils import EnvironmentType
+
     try:
         environment_type = EnvironmentType(environment_type)
     except Exception as e:
@@ -86,6 +101,8 @@ def environment_type_from_string(environment_type: str):
 
 
 def check_environment_type_local_or_exit(deck: dict, environment_index: int = 0):
+    from unikube.graphql_utils import EnvironmentType
+
     if (
         environment_type_from_string(environment_type=deck["environment"][environment_index]["type"])
         != EnvironmentType.LOCAL
@@ -93,7 +110,9 @@ def check_environment_type_local_or_exit(deck: dict, environment_index: int = 0)
         console.error("This deck cannot be installed locally.", _exit=True)
 
 
-def check_running_cluster(ctx: ClickContext, cluster_provider_type: K8sProviderType.k3d, project_instance: dict):
+def check_running_cluster(ctx: "ClickContext", cluster_provider_type: K8sProviderType.k3d, project_instance: dict):
+    from unikube.local.system import Telepresence
+
     for cluster_data in ctx.cluster_manager.get_all():
         cluster = ctx.cluster_manager.select(cluster_data=cluster_data, cluster_provider_type=cluster_provider_type)
         if cluster.exists() and cluster.ready():
@@ -109,35 +128,107 @@ def check_running_cluster(ctx: ClickContext, cluster_provider_type: K8sProviderT
                 )
 
 
-def compare_current_and_latest_versions():
+def get_current_version() -> Optional[str]:
+    current_version = None
+    try:
+        path = Path(__file__).parent / "../VERSION"
+        with path.open("r") as f:
+            current_version = f.read().strip()
+    except (FileNotFoundError, PermissionError):
+        console.debug("Could not read current version.")
+
+    if not current_version:
+        import pkg_resources
+
+        dist = pkg_resources.working_set.by_key.get("unikube")
+        if dist:
+            current_version = dist.version
+
+    return current_version
+
+
+def get_latest_release_version() -> Optional[str]:
+    import requests
+
+    # GitHub API (blocking), the result is cached
+    release = requests.get(settings.RELEASE_CHECK_URL, timeout=settings.RELEASE_CHECK_TIMEOUT)
+    if release.status_code == 403:
+        console.info("Versions cannot be compared, as API rate limit was exceeded")
+        return None
+    release.raise_for_status()
+    latest_release_version = release.json()["tag_name"].replace("-", ".")
+
+    LocalStorageCache().set(
+        id=RELEASE_CACHE_KEY, data=CacheData(id=RELEASE_CACHE_KEY, data=latest_release_version, timestamp=time())
+    )
+    return latest_release_version
+
+
+def refresh_latest_release_version() -> None:
+    # entry point of the background process
     try:
-        current_version = None
-        try:
-            path = Path(__file__).parent / "../VERSION"
-            with path.open("r") as f:
-                current_version = f.read()
-        except (FileNotFoundError, PermissionError):
-            console.debug("Could not read current version.")
-
-        if not current_version:
-            dist = pkg_resources.working_set.by_key.get("unikube")
-            if dist:
-                current_version = dist.version
-
-        release = requests.get("https://api.github.com/repos/unikubehq/cli/releases/latest")
-        if release.status_code == 403:
-            console.info("Versions cannot be compared, as API rate limit was exceeded")
-            return None
-        latest_release_version = release.json()["tag_name"].replace("-", ".")
-        if current_version != latest_release_version:
+        get_latest_release_version()
+    except Exception as e:
+        console.debug(e)
+
+
+def refresh_latest_release_version_in_background() -> None:
+    """
+    Starts a detached process which refreshes the cached release version, the command itself does not wait for the
+    GitHub API (e.g. slow proxies). Attempts are spaced by ``RELEASE_CHECK_RETRY`` seconds.
+    """
+    local_storage_cache = LocalStorageCache()
+    attempt = local_storage_cache.get(id=RELEASE_ATTEMPT_CACHE_KEY)
+    if attempt.age < settings.RELEASE_CHECK_RETRY:
+        return
+
+    local_storage_cache.set(
+        id=RELEASE_ATTEMPT_CACHE_KEY, data=CacheData(id=RELEASE_ATTEMPT_CACHE_KEY, data=None, timestamp=time())
+    )
+
+    try:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "from unikube.helpers import refresh_latest_release_version; refresh_latest_release_version()",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
+    except Exception as e:
+        console.debug(e)
+
+
+def compare_current_and_latest_versions(check_now: bool = False) -> Optional[str]:
+    """
+    Compares the installed version with the latest release. The latest release is read from the local cache and
+    refreshed in the background once it is older than ``RELEASE_CHECK_TTL``; ``check_now`` queries GitHub directly.
+    """
+    try:
+        current_version = get_current_version()
+
+        if check_now:
+            latest_release_version = get_latest_release_version()
+            if latest_release_version is None:
+                return None
+        else:
+            cache_data = LocalStorageCache().get(id=RELEASE_CACHE_KEY)
+            latest_release_version = cache_data.data
+            if cache_data.age > settings.RELEASE_CHECK_TTL:
+                refresh_latest_release_version_in_background()
+
+        # tags use "-" instead of "." (e.g. 1.0.0-dev2)
+        if latest_release_version and (current_version or "").replace("-", ".") != latest_release_version:
             console.info(
                 f"You are using unikube version {current_version}; however, version {latest_release_version} is "
                 f"available."
             )
 
         return current_version
-    except pkg_resources.DistributionNotFound as e:
-        console.warning(f"Version of the package could not be found: {e}")
     except Exception:
         import traceback
 
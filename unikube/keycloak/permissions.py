@@ -3,7 +3,6 @@ import uuid
 from functools import lru_cache
 from typing import KeysView, List, Optional, Union
 
-import jwt
 from pydantic import BaseModel
 from retrying import retry
 
@@ -48,12 +47,12 @@ class KeycloakPermissions:
 
     def _decode_requesting_party_token(self, requesting_party_token: str) -> dict:
         # decode
+        # the token has just been verified by verify_or_refresh, hence an unavailable key is tolerated
         try:
-            token = jwt.decode(
+            token = self.authentication.decode_token(
                 requesting_party_token,
-                algorithms=["RS256"],
+                require_signature=False,
                 audience=settings.TOKEN_AUDIENCE,
-                options={"verify_signature": False},
             )
         except Exception as e:
             console.debug(e)
@@ -2,8 +2,10 @@
 import os
 import platform
 import re
+import shutil
 import subprocess
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep, time
 from typing import Dict, List, Optional, Tuple
 
 import click
@@ -12,6 +14,9 @@ import semantic_version
 import unikube.cli.console as console
 from unikube import settings
 from unikube.cli.console import error
+from unikube.local.docker_api import get_docker_engine_api
+from unikube.storage.cache import LocalStorageCache
+from unikube.storage.types import CacheData
 
 
 class LocalDependency(object):
@@ -23,41 +28,104 @@ class LocalDependency(object):
     verbose_name = None
     required = None
     required_version = None
+    timeout = settings.DEPENDENCY_PROBE_TIMEOUT
+    # the result only depends on the executable (see fingerprint)
+    cacheable = True
 
-    def probe(self, silent) -> Tuple[bool, str]:
+    def __init__(self):
+        self.cached = False
+
+    def probe(self, silent, use_cache: bool = True) -> Tuple[bool, str]:
         console.info(self.check_message(), silent=silent, nl=False)
+        result = self.load_result() if use_cache else None
+        if result is None:
+            result = self.check()
+            self.store_result(result)
+        return self.report(result, silent=silent)
+
+    def fingerprint(self) -> Optional[list]:
+        # resolved executable, changes with every installation or update
+        path = shutil.which(self.cmd[0])
+        if not path:
+            return None
+
+        path = os.path.realpath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        return [list(self.cmd), self.required_version, path, stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+    def _cache_key(self) -> str:
+        return f"dependency:{self.verbose_name}"
 
+    def load_result(self) -> Optional[Tuple[bool, str, str]]:
+        if not self.cacheable:
+            return None
+
+        fingerprint = self.fingerprint()
+        cache_data = LocalStorageCache().get(id=self._cache_key())
+        if not fingerprint or not cache_data.data or cache_data.data["fingerprint"] != fingerprint:
+            return None
+
+        self.cached = True
+        self.installed_version = cache_data.data["installed_version"]
+        return tuple(cache_data.data["result"])
+
+    def store_result(self, result: Tuple[bool, str, str]) -> None:
+        # failures are probed again, e.g. after the user has fixed them
+        success, _, _ = result
+        fingerprint = self.fingerprint()
+        if not self.cacheable or not success or not fingerprint:
+            return
+
+        cache_key = self._cache_key()
+        data = {
+            "fingerprint": fingerprint,
+            "result": list(result),
+            "installed_version": str(getattr(self, "installed_version", "")),
+        }
+        LocalStorageCache().set(id=cache_key, data=CacheData(id=cache_key, data=data, timestamp=time()))
+
+    def check(self) -> Tuple[bool, str, str]:
+        """Runs the probe command without any output, returns success, message and status."""
         if not self.required_version:
             try:
-                kwargs = {
-                    "stdout": open(os.devnull, "w"),
-                    "close_fds": True,
-                    "stderr": subprocess.STDOUT,
-                }
-                subprocess.check_call(self.cmd, **kwargs)
-                self._click_echo(" Ok", silent=silent, fg="green")
-                return True, ""
+                subprocess.run(
+                    self.cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.STDOUT,
+                    close_fds=True,
+                    timeout=self.timeout,
+                    check=True,
+                )
+                return True, "", "Ok"
+            except subprocess.TimeoutExpired:
+                return False, self.timeout_message(), "Error (Timeout)"
             except (subprocess.CalledProcessError, FileNotFoundError):
-                self._click_echo(" Error", silent=silent, fg="red")
-                return False, self.notfound_message()
+                return False, self.notfound_message(), "Error"
         else:
             try:
-                pout = subprocess.run(self.cmd, capture_output=True, encoding="UTF-8")
+                pout = subprocess.run(self.cmd, capture_output=True, encoding="UTF-8", timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                return False, self.timeout_message(), "Error (Timeout)"
             except (subprocess.CalledProcessError, FileNotFoundError):
-                self._click_echo(" Error", silent=silent, fg="red")
-                return False, self.notfound_message()
+                return False, self.notfound_message(), "Error"
             else:
                 cmd_version = self.prepare_version_string(pout.stdout)
                 version, sufficient = self.check_version(cmd_version)
                 if version and sufficient:
-                    self._click_echo(f" Ok (Version {version})", silent=silent, fg="green")
-                    return True, ""
+                    return True, "", f"Ok (Version {version})"
                 elif version:
-                    self._click_echo(f" Error (Version {version})", silent=silent, fg="red")
-                    return False, self.oldversion_message()
+                    return False, self.oldversion_message(), f"Error (Version {version})"
                 else:
-                    self._click_echo(" Error", silent=silent, fg="red")
-                    return False, self.notfound_message()
+                    return False, self.notfound_message(), "Error"
+
+    def report(self, result: Tuple[bool, str, str], silent) -> Tuple[bool, str]:
+        success, msg, status = result
+        self._click_echo(f" {status}", silent=silent, fg="green" if success else "red")
+        return success, msg
 
     def _click_echo(self, msg, silent=False, fg=""):
         if not silent:
@@ -79,6 +147,9 @@ class LocalDependency(object):
     def notfound_message(self) -> str:
         return f"Please make sure that '{self.verbose_name}' is correctly installed on your computer."
 
+    def timeout_message(self) -> str:
+        return f"'{self.verbose_name}' did not respond within {self.timeout} seconds."
+
     def oldversion_message(self) -> str:
         return f"The version of '{self.verbose_name}' on your computer is too old."
 
@@ -164,6 +235,17 @@ class K3d(LocalDependency):
 class DockerEngine(LocalDependency):
     cmd = ("docker", "run", "--rm", settings.DOCKER_TEST_IMAGE, "true")
     verbose_name = "Docker Engine"
+    # the test image may have to be pulled first
+    timeout = settings.DOCKER_TEST_TIMEOUT
+    # depends on the running daemon, not only on the executable
+    cacheable = False
+
+    def check(self) -> Tuple[bool, str, str]:
+        # the Engine API answers without running the test image
+        if get_docker_engine_api().ping():
+            return True, "", "Ok"
+
+        return super().check()
 
 
 class Docker(LocalDependency):
@@ -231,30 +313,48 @@ if platform.system() == "Darwin":
     ALL_DEPENDENCIES = [Homebrew] + ALL_DEPENDENCIES
 
 
-def probe_dependencies(silent=False) -> List[Dict[str, str]]:
+def probe_dependencies(silent=False, use_cache: bool = True) -> List[Dict[str, str]]:
     """Generates a report of the required software and versions"""
+    checks = [klass() for klass in ALL_DEPENDENCIES]
+
+    # results of unchanged executables are reused
+    cached_results = [check.load_result() if use_cache else None for check in checks]
+
+    # all other probes run concurrently, the output is in the order of the dependencies
     results = []
-    for klass in ALL_DEPENDENCIES:
-        check = klass()
-        success, msg = check.probe(silent=silent)
-        if check.required_version:
-            required_version = check.required_version
-            if success:
-                installed_version = check.installed_version
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [
+            executor.submit(check.check) if cached_result is None else None
+            for check, cached_result in zip(checks, cached_results)
+        ]
+        for check, cached_result, future in zip(checks, cached_results, futures):
+            console.info(check.check_message(), silent=silent, nl=False)
+            if cached_result is None:
+                result = future.result()
+                check.store_result(result)
             else:
+                result = cached_result
+
+            success, msg = check.report(result, silent=silent)
+            if check.required_version:
+                required_version = check.required_version
+                if success:
+                    installed_version = check.installed_version
+                else:
+                    installed_version = ""
+            else:
+                required_version = ""
                 installed_version = ""
-        else:
-            required_version = ""
-            installed_version = ""
-        results.append(
-            {
-                "name": check.verbose_name,
-                "success": success,
-                "msg": msg,
-                "required_version": required_version,
-                "installed_version": installed_version,
-            }
-        )
+            results.append(
+                {
+                    "name": check.verbose_name,
+                    "success": success,
+                    "msg": msg,
+                    "required_version": required_version,
+                    "installed_version": installed_version,
+                    "cached": check.cached,
+                }
+            )
     return results
 
 
@@ -0,0 +1,140 @@
+import json
+import os
+import socket
+from http.client import HTTPConnection, HTTPException
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+import unikube.cli.console as console
+from unikube import settings
+
+
+class DockerEngineAPIError(Exception):
+    pass
+
+
+class UnixHTTPConnection(HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def get_socket_path() -> Optional[str]:
+    # no unix sockets (e.g. Windows, named pipe), the docker CLI is used
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    # DOCKER_HOST may point to another daemon (e.g. tcp://), which is left to the docker CLI
+    docker_host = os.environ.get("DOCKER_HOST", None)
+    if not docker_host:
+        return settings.DOCKER_SOCKET
+
+    if docker_host.startswith("unix://"):
+        return docker_host[len("unix://") :]
+
+    return None
+
+
+class DockerEngineAPI:
+    """
+    Minimal client of the Docker Engine API on the local unix socket. The connection is kept alive and shared by all
+    requests; once the daemon cannot be reached, all further requests fail immediately (the docker CLI is the
+    fallback).
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = settings.DOCKER_API_TIMEOUT):
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+        self._connection: Optional[UnixHTTPConnection] = None
+        self._unavailable = not socket_path
+        self._lock = Lock()
+
+    def _connect(self) -> UnixHTTPConnection:
+        if self._connection is None:
+            self._connection = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+        return self._connection
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def request(self, method: str, path: str, params: dict = None) -> Tuple[int, bytes]:
+        if params:
+            path = f"{path}?{urlencode(params)}"
+
+        with self._lock:
+            if self._unavailable:
+                raise DockerEngineAPIError(f"Docker Engine API is not available: {self.socket_path}")
+
+            # the daemon may have closed the kept-alive connection, hence one retry with a new connection
+            for attempt in range(2):
+                try:
+                    connection = self._connect()
+                    connection.request(method, path, headers={"Host": "docker"})
+                    response = connection.getresponse()
+                    return response.status, response.read()
+                except (OSError, HTTPException) as e:
+                    self._close()
+                    if attempt or isinstance(e, (FileNotFoundError, ConnectionRefusedError, PermissionError)):
+                        console.debug(e)
+                        self._unavailable = True
+                        raise DockerEngineAPIError(f"Docker Engine API is not available: {e}")
+
+    def _json(self, method: str, path: str, params: dict = None):
+        status, body = self.request(method, path, params=params)
+        if status >= 400:
+            raise DockerEngineAPIError(f"{method} {path}: {status} {body[:200]!r}")
+        return json.loads(body)
+
+    @property
+    def available(self) -> bool:
+        return not self._unavailable
+
+    def ping(self) -> bool:
+        try:
+            status, body = self.request("GET", "/_ping")
+        except DockerEngineAPIError:
+            return False
+        return status == 200 and body.strip() == b"OK"
+
+    def containers(self, all: bool = False, filters: Dict[str, List[str]] = None) -> List[dict]:
+        params = {"all": "1" if all else "0"}
+        if filters:
+            params["filters"] = json.dumps(filters)
+        return self._json("GET", "/containers/json", params=params)
+
+    def images(self, filters: Dict[str, List[str]] = None) -> List[dict]:
+        params = {"filters": json.dumps(filters)} if filters else None
+        return self._json("GET", "/images/json", params=params)
+
+    def kill(self, id: str) -> None:
+        status, body = self.request("POST", f"/containers/{quote(id)}/kill")
+        if status >= 400:
+            raise DockerEngineAPIError(f"Could not kill container {id}: {status} {body[:200]!r}")
+
+
+# one client (connection) per process
+_docker_engine_api: Optional[DockerEngineAPI] = None
+_docker_engine_api_lock = Lock()
+
+
+def get_docker_engine_api() -> DockerEngineAPI:
+    global _docker_engine_api
+
+    with _docker_engine_api_lock:
+        if _docker_engine_api is None:
+            _docker_engine_api = DockerEngineAPI(socket_path=get_socket_path())
+        return _docker_engine_api
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List
 
 from semantic_version import Version
 
@@ -64,7 +64,7 @@ class IK8sProvider(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def ready(self) -> bool:
+    def ready(self, containers: List[dict] = None) -> bool:
         raise NotImplementedError
 
     @abstractmethod
@@ -102,11 +102,12 @@ class AbstractK8sProvider(IK8sProvider):
     def k8s_provider_type(self):
         return self.provider_type
 
-    def ready(self) -> bool:
+    def ready(self, containers: List[dict] = None) -> bool:
         # get name
         provider_data = self.storage.get()
         name = provider_data.name
         if not name:
             return False
 
-        return Docker().check_running(name)
+        # containers: snapshot of the running containers (see Docker.list_containers)
+        return Docker().check_running(name, containers=containers)
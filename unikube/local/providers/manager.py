@@ -5,7 +5,9 @@ from unikube import settings
 from unikube.local.providers.abstract_provider import AbstractK8sProvider
 from unikube.local.providers.factory import kubernetes_cluster_factory
 from unikube.local.providers.types import K8sProviderData, K8sProviderType
+from unikube.local.system import Docker
 from unikube.storage.local_storage import LocalStorage
+from unikube.storage.types import from_document
 
 
 class K8sClusterManager(LocalStorage):
@@ -14,9 +16,9 @@ class K8sClusterManager(LocalStorage):
 
     def get_all(self) -> List[K8sProviderData]:
         cluster_list = []
-        for item in self.database.table.all():
+        for item in self.database.all():
             try:
-                cluster_data = K8sProviderData(**item)
+                cluster_data = from_document(K8sProviderData, item)
                 cluster_list.append(cluster_data)
             except Exception:
                 pass
@@ -24,12 +26,15 @@ class K8sClusterManager(LocalStorage):
         return cluster_list
 
     def get_cluster_list(self, ready: bool = None):
+        # the readiness of all clusters is answered from one list of the running cluster containers
+        containers = Docker().list_containers(label=settings.K3D_CLUSTER_LABEL) if ready is not None else None
+
         ls = []
         for cluster_data in self.get_all():
             for provider_type in K8sProviderType:
                 if self.exists(cluster_data, provider_type):
                     # handle ready option
-                    if ready:
+                    if ready is not None:
                         kubernetes_cluster = self.select(
                             cluster_data=cluster_data,
                             cluster_provider_type=provider_type,
@@ -37,7 +42,7 @@ class K8sClusterManager(LocalStorage):
                         if not kubernetes_cluster:
                             continue
 
-                        if kubernetes_cluster.ready() != ready:
+                        if kubernetes_cluster.ready(containers=containers) != ready:
                             continue
 
                     # append cluster to list
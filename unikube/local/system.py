@@ -13,6 +13,7 @@ from urllib3.exceptions import MaxRetryError
 
 import unikube.cli.console as console
 from unikube import settings
+from unikube.local.docker_api import DockerEngineAPIError, get_docker_engine_api
 from unikube.local.exceptions import UnikubeClusterUnavailableError
 
 
@@ -154,6 +155,12 @@ class KubeCtl(CMDWrapper):
 class Docker(CMDWrapper):
     base_command = "docker"
 
+    def __init__(self, debug_output=False):
+        super().__init__(debug_output=debug_output)
+
+        # Engine API on the local socket, the docker CLI is the fallback
+        self.api = get_docker_engine_api()
+
     def build(self, tag, context, dockerfile=None, target=None) -> Tuple[bool, str]:
         arguments = ["build", "-t", tag, context]
         if target:
@@ -172,12 +179,43 @@ class Docker(CMDWrapper):
                 "Could not build the Docker image, please make sure the image can be built",
             )
 
-    def check_running(self, name):
-        """Checks whether an image or a specific container is running."""
-        arguments = ["ps"]
+    def list_containers(self, label: str = None) -> List[dict]:
+        """Running containers (names and image), optionally only the ones with the given label."""
+        try:
+            filters = {"label": [label]} if label else None
+            return [
+                {
+                    "Names": [container_name.lstrip("/") for container_name in container["Names"]],
+                    "Image": container["Image"],
+                }
+                for container in self.api.containers(filters=filters)
+            ]
+        except DockerEngineAPIError as e:
+            console.debug(e)
+
+        arguments = ["ps", "--format", "{{.Names}}\t{{.Image}}"]
+        if label:
+            arguments += ["--filter", f"label={label}"]
         process = self._execute(arguments)
         output = process.stdout.read()
-        return name in output
+
+        containers = []
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            names, _, image = line.partition("\t")
+            containers.append({"Names": names.split(","), "Image": image})
+        return containers
+
+    def check_running(self, name, containers: List[dict] = None):
+        """Checks whether an image or a specific container is running (optionally in a list of containers)."""
+        if containers is None:
+            containers = self.list_containers()
+
+        return any(
+            name in container["Image"] or any(name in container_name for container_name in container["Names"])
+            for container in containers
+        )
 
     def daemon_active(self):
         """Checks whether docker daemon is running.
@@ -185,6 +223,9 @@ class Docker(CMDWrapper):
         Based on docker documentation (https://docs.docker.com/config/daemon/#check-whether-docker-is-running).
         `docker info` exists with non-zero exit code when docker is not running.
         """
+        if self.api.ping():
+            return True
+
         arguments = ["info"]
         process = self._execute(arguments)
         return process.returncode == 0
@@ -205,16 +246,36 @@ class Docker(CMDWrapper):
             pass
         elif name:
             _id = self.get_container_id(name)
-        arguments = ["kill", _id]
-        self._execute(arguments)
+
+        # one container per line (see get_container_id), each one is killed once: via the API or the docker CLI
+        for container_id in _id.split():
+            try:
+                self.api.kill(container_id)
+                continue
+            except DockerEngineAPIError as e:
+                console.debug(e)
+
+            arguments = ["kill", container_id]
+            self._execute(arguments)
 
     def get_container_id(self, name):
+        try:
+            containers = self.api.containers(all=True, filters={"ancestor": [name]})
+            return "\n".join(container["Id"][:12] for container in containers)
+        except DockerEngineAPIError as e:
+            console.debug(e)
+
         arguments = ["ps", "-aq", "--filter", f"ancestor={name}"]
         process = self._execute(arguments)
         output = process.stdout.read()
         return output.strip()
 
     def image_exists(self, name):
+        try:
+            return bool(self.api.images(filters={"reference": [name]}))
+        except DockerEngineAPIError as e:
+            console.debug(e)
+
         arguments = ["images", "-q", name]
         process = self._execute(arguments)
         output = process.stdout.read()
@@ -1,7 +1,6 @@
 import os
 
 import urllib3
-from InquirerPy import get_style
 
 from unikube.cli.helper import exist_or_create
 from unikube.local.providers.types import K8sProviderType
@@ -13,11 +12,21 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 CLI_CONFIG_FILE = os.path.expanduser("~/.unikube/config_dev")
 exist_or_create(CLI_CONFIG_FILE)
 
+CLI_STORAGE_BACKEND = "tinydb"  # tinydb, sqlite
+CLI_STORAGE_FILE = os.path.expanduser("~/.unikube/config_dev.sqlite3")  # sqlite backend, migrated from CLI_CONFIG_FILE
+
 CLI_KUBECONFIG_DIRECTORY = os.path.expanduser("~/.unikube/")
 CLI_TABLEFMT = "psql"
 
 CLI_LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING, ERROR/SUCCESS
 CLI_ALWAYS_SHOW_CONTEXT = False
+CLI_CONTEXT_INDEX_TTL = 60 * 60 * 24  # organization/project/deck name -> id index
+
+# release check
+RELEASE_CHECK_URL = "https://api.github.com/repos/unikubehq/cli/releases/latest"
+RELEASE_CHECK_TIMEOUT = 5
+RELEASE_CHECK_TTL = 60 * 60 * 24  # cached latest release, refreshed in the background afterwards
+RELEASE_CHECK_RETRY = 60 * 10  # minimum interval between background refreshes (e.g. GitHub is not reachable)
 
 # authentication
 AUTH_DEFAULT_HOST = "https://login.unikube.io"  # "http://keycloak.127.0.0.1.nip.io:8085"
@@ -30,23 +39,37 @@ UNIKUBE_DEFAULT_PROVIDER_TYPE = K8sProviderType.k3d
 TOKEN_REALM = "unikube"
 TOKEN_ALGORITHM = "RS256"
 TOKEN_PUBLIC_KEY = f"/auth/realms/{TOKEN_REALM}"
+TOKEN_ISSUER_PATH = f"/auth/realms/{TOKEN_REALM}"
 TOKEN_LOGIN_PATH = f"/auth/realms/{TOKEN_REALM}/protocol/openid-connect/token"
 TOKEN_VERIFY_PATH = f"/auth/realms/{TOKEN_REALM}/protocol/openid-connect/userinfo"
 TOKEN_REFRESH_PATH = f"/auth/realms/{TOKEN_REALM}/protocol/openid-connect/token"
 TOKEN_TIMEOUT = 30
+TOKEN_RETRIES = 3  # connection errors and 502/503/504 responses
+TOKEN_RETRY_BACKOFF = 0.3
 TOKEN_AUDIENCE = "gateway"
 TOKEN_RPT_AUDIENCE = "gateway"
+TOKEN_REFRESH_LEEWAY = 30  # refresh access tokens which expire within the next seconds
+TOKEN_PUBLIC_KEY_TTL = 60 * 60 * 24
+TOKEN_REFRESH_LOCK_FILE = os.path.expanduser("~/.unikube/.token_refresh.lock")
 KC_CLIENT_ID = "cli"
 
 # GraphQL
 GRAPHQL_URL = "https://api.unikube.io/graphql/"  # "http://gateway.unikube.127.0.0.1.nip.io:8085/graphql/"
 GRAPHQL_TIMEOUT = 30
+GRAPHQL_PERSISTED_QUERIES = True  # send the sha256 hash of a query first (automatic persisted queries)
+GRAPHQL_CACHE_TTL = 60 * 5  # cached responses are considered fresh for 5 minutes
+GRAPHQL_CACHE_MAX_AGE = 60 * 60 * 24 * 7  # stale responses are served (and revalidated) for up to one week
+GRAPHQL_REVALIDATE_TIMEOUT = 3  # background revalidation of a stale response (single attempt)
 
 # manifest
 MANIFEST_DEFAULT_HOST = "https://api.unikube.io/manifests/"
 
 # local system: dependencies + versions + settings
+DEPENDENCY_PROBE_TIMEOUT = 10  # seconds per probe (e.g. 'k3d --version')
+DOCKER_SOCKET = "/var/run/docker.sock"  # Engine API (DOCKER_HOST=unix://...), otherwise the docker CLI is used
+DOCKER_API_TIMEOUT = 10
 DOCKER_TEST_IMAGE = "busybox"
+DOCKER_TEST_TIMEOUT = 120  # 'docker run' of the test image, including the pull
 DOCKER_CLI_MIN_VERSION = "15.0.1"
 DOCKER_WEBSITE = "https://docs.docker.com/install/"
 
@@ -55,6 +78,7 @@ K3S_CLI_MIN_VERSION = "1.17.1"
 K3D_CLI_MIN_VERSION = "3.0.0"
 K3D_WEBSITE = "https://github.com/rancher/k3d"
 K3D_CLUSTER_PREFIX = "unikube-"
+K3D_CLUSTER_LABEL = "k3d.cluster"  # label of all containers of a k3d cluster
 K3D_DEFAULT_INGRESS_PORT = 80
 K3D_DEFAULT_WORKERS = 1
 
@@ -71,11 +95,8 @@ KUBECTL_MIN_CLI_VERSION = "1.18.0"
 SERVICE_TOKEN_FILENAME = "/var/run/secrets/kubernetes.io/serviceaccount/token"
 SERVICE_CERT_FILENAME = "/var/run/secrets/kubernetes.io/serviceaccount/ca.crt"
 
-INQUIRER_STYLE = get_style(
-    {
-        "answermark": "#45d093 bold",
-        "questionmark": "#fff",
-        "question": "bold",
-    },
-    style_override=False,
-)
+INQUIRER_STYLE = {
+    "answermark": "#45d093 bold",
+    "questionmark": "#fff",
+    "question": "bold",
+}
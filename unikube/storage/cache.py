@@ -0,0 +1,7 @@
+from unikube.storage.local_storage import LocalStorage
+from unikube.storage.types import CacheData
+
+
+class LocalStorageCache(LocalStorage):
+    table_name = "cache"
+    pydantic_class = CacheData
@@ -9,8 +9,7 @@ class LocalStorageGeneral(LocalStorage):
     document_id = GeneralData().id
 
     def get(self) -> GeneralData:
-        data = super().get(id=self.document_id)
-        return self.pydantic_class(**data.dict())
+        return super().get(id=self.document_id)
 
     def set(self, data: GeneralData) -> None:
         super().set(id=self.document_id, data=data)
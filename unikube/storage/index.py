@@ -0,0 +1,90 @@
+from time import time
+from typing import List, Optional
+
+from slugify import slugify
+
+from unikube import settings
+from unikube.storage.local_storage import LocalStorage
+from unikube.storage.types import ResolutionIndexData, ResolutionIndexItem
+
+
+class LocalStorageResolutionIndex(LocalStorage):
+    """
+    Per user index of organization, project and deck titles/slugs to ids. Used to convert context arguments without
+    downloading the complete lists.
+    """
+
+    table_name = "index"
+    pydantic_class = ResolutionIndexData
+
+    def __init__(self, user_email: str) -> None:
+        super().__init__()
+
+        self.user_email = user_email
+
+    def get(self) -> ResolutionIndexData:
+        return super().get(id=self.user_email)
+
+    def set(self, data: ResolutionIndexData) -> None:
+        super().set(id=self.user_email, data=data)
+
+    def delete(self) -> None:
+        super().delete(id=self.user_email)
+
+    def lookup(
+        self, field: str, argument_value: str, organization_id: str = None, project_id: str = None
+    ) -> Optional[str]:
+        # None: not indexed (or outdated) or ambiguous
+        items = [
+            item for item in getattr(self.get(), field) if time() - item.timestamp < settings.CLI_CONTEXT_INDEX_TTL
+        ]
+
+        if slugify(argument_value) != argument_value:
+            match = [item for item in items if item.title == argument_value]
+        else:
+            match = [item for item in items if item.slug == argument_value]
+
+        match = [
+            item
+            for item in match
+            if (not organization_id or item.organization_id == organization_id)
+            and (not project_id or item.project_id == project_id)
+        ]
+        if len(match) != 1:
+            return None
+
+        return match[0].id
+
+    def update(self, field: str, results: List[dict], organization_id: str = None, project_id: str = None) -> None:
+        """
+        Replace the indexed items of the given scope (e.g. all projects of an organization) with the results of a
+        list query.
+        """
+        data = self.get()
+        timestamp = time()
+
+        items = [
+            item
+            for item in getattr(data, field)
+            if timestamp - item.timestamp < settings.CLI_CONTEXT_INDEX_TTL
+            and (
+                (organization_id and item.organization_id != organization_id)
+                or (project_id and item.project_id != project_id)
+            )
+        ]
+        for result in results:
+            project = result.get("project", None) or {}
+            organization = result.get("organization", None) or project.get("organization", None) or {}
+            items.append(
+                ResolutionIndexItem(
+                    id=result["id"],
+                    title=result["title"],
+                    slug=slugify(result["title"]),
+                    organization_id=organization.get("id", None),
+                    project_id=project.get("id", None),
+                    timestamp=timestamp,
+                )
+            )
+
+        setattr(data, field, items)
+        self.set(data)
@@ -1,7 +1,40 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator, Tuple, Type, Union
 
+from unikube import settings
+from unikube.storage.sqlite import SQLiteDatabase
 from unikube.storage.tinydb import TinyDatabase
-from unikube.storage.types import TinyDatabaseData
+from unikube.storage.types import TinyDatabaseData, from_document
+
+
+def get_database_class() -> Union[Type[TinyDatabase], Type[SQLiteDatabase]]:
+    if settings.CLI_STORAGE_BACKEND == "sqlite":
+        return SQLiteDatabase
+
+    return TinyDatabase
+
+
+def storage_revision() -> Tuple[int, int]:
+    # changes whenever the storage is written, by this or by another process
+    return get_database_class().storage_revision()
+
+
+def storage_flush() -> None:
+    # write pending changes, e.g. to make them visible to other processes
+    get_database_class().flush()
+
+
+def storage_reload() -> None:
+    # discard cached data, e.g. to see changes of other processes
+    get_database_class().reload()
+
+
+@contextmanager
+def storage_transaction() -> Iterator[None]:
+    # read-modify-write on the current storage, other processes are locked out
+    with get_database_class().transaction():
+        yield
 
 
 class ILocalStorage(ABC):
@@ -24,12 +57,12 @@ class LocalStorage(ILocalStorage):
 
     def __init__(self) -> None:
         # database / storage
-        self.database = TinyDatabase(table_name=self.table_name)
+        self.database = get_database_class()(table_name=self.table_name)
 
     def get(self, id: str, **kwargs) -> TinyDatabaseData:
         try:
             document = self.database.select(id=id)
-            return self.pydantic_class(**dict(document))
+            return from_document(self.pydantic_class, document)
         except Exception:
             return self.pydantic_class(id=id, **kwargs)
 
@@ -0,0 +1,88 @@
+import logging
+from threading import Lock, RLock
+from time import sleep, time
+from typing import IO, Dict
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover (e.g. Windows)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a file, shared between processes. Waits up to ``timeout`` seconds for the lock and
+    continues without it afterwards (or on platforms without ``fcntl``). The lock is reentrant within a thread, e.g. a
+    flush inside of a transaction.
+    """
+
+    # locks held by this process (per path)
+    _registry_lock = Lock()
+    _thread_locks: Dict[str, RLock] = {}
+    _files: Dict[str, IO] = {}
+    _depth: Dict[str, int] = {}
+
+    def __init__(self, path: str, timeout: float = 30, interval: float = 0.05):
+        self.path = path
+        self.timeout = timeout
+        self.interval = interval
+
+        self._acquired = False
+
+    def _thread_lock(self) -> RLock:
+        with FileLock._registry_lock:
+            return FileLock._thread_locks.setdefault(self.path, RLock())
+
+    def acquire(self) -> bool:
+        if not self._thread_lock().acquire(timeout=self.timeout):
+            logger.debug(f"Could not acquire lock: {self.path}")
+            return False
+
+        self._acquired = True
+        depth = FileLock._depth.get(self.path, 0)
+        FileLock._depth[self.path] = depth + 1
+        if depth:
+            return self.path in FileLock._files
+
+        if fcntl is None:
+            return False
+
+        file = open(self.path, "a")
+        start = time()
+        while True:
+            try:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                FileLock._files[self.path] = file
+                return True
+            except OSError:
+                if time() - start > self.timeout:
+                    logger.debug(f"Could not acquire lock: {self.path}")
+                    file.close()
+                    return False
+                sleep(self.interval)
+
+    def release(self) -> None:
+        if not self._acquired:
+            return
+
+        self._acquired = False
+        FileLock._depth[self.path] -= 1
+        try:
+            if not FileLock._depth[self.path]:
+                file = FileLock._files.pop(self.path, None)
+                if file:
+                    try:
+                        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+                    finally:
+                        file.close()
+        finally:
+            self._thread_lock().release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
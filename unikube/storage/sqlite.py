@@ -0,0 +1,175 @@
+import json
+import logging
+import os
+import sqlite3
+from contextlib import contextmanager
+from threading import RLock
+from typing import Dict, Iterator, List, Tuple, Union
+
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+
+from unikube import settings
+from unikube.storage.types import to_document
+
+# the storage is imported by the console (GraphQL), hence it logs without it
+logger = logging.getLogger(__name__)
+
+
+class SQLiteDatabase:
+    """
+    SQLite (WAL mode) variant of :class:`TinyDatabase`. Documents are stored as JSON per (table, id), hence a write
+    only touches the affected row instead of rewriting the complete storage file.
+    """
+
+    # writes of this process (the file modification time may be too coarse)
+    revision = 0
+
+    # one connection per storage file and process
+    _connections: Dict[str, sqlite3.Connection] = {}
+    _lock = RLock()
+
+    def __init__(
+        self,
+        table_name="database",
+        path: str = None,
+    ):
+        self.table_name = table_name
+        self.path = path or settings.CLI_STORAGE_FILE
+
+        self.connection = SQLiteDatabase._connect(self.path)
+
+    @classmethod
+    def _connect(cls, path: str) -> sqlite3.Connection:
+        with cls._lock:
+            connection = cls._connections.get(path, None)
+            if connection:
+                return connection
+
+            connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "table_name TEXT NOT NULL, id TEXT NOT NULL, data TEXT NOT NULL, PRIMARY KEY (table_name, id))"
+            )
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            cls._migrate(connection)
+
+            cls._connections[path] = connection
+            return connection
+
+    @staticmethod
+    def _migrate(connection: sqlite3.Connection, path_tinydb: str = None) -> None:
+        # one-time import of the TinyDB storage file
+        path_tinydb = path_tinydb or settings.CLI_CONFIG_FILE
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if connection.execute("SELECT value FROM meta WHERE key = 'migrated'").fetchone():
+                connection.execute("COMMIT")
+                return
+
+            try:
+                with open(path_tinydb, "r") as f:
+                    tables = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.debug(e)
+                tables = {}
+
+            for table_name, documents in tables.items():
+                for document in documents.values():
+                    if "id" not in document:
+                        continue
+
+                    connection.execute(
+                        "INSERT OR IGNORE INTO documents (table_name, id, data) VALUES (?, ?, ?)",
+                        (table_name, document["id"], json.dumps(document)),
+                    )
+
+            connection.execute("INSERT INTO meta (key, value) VALUES ('migrated', ?)", (path_tinydb,))
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
+        with SQLiteDatabase._lock:
+            return self.connection.execute(sql, parameters)
+
+    def select(self, id: str) -> Union[dict, None]:
+        row = self._execute(
+            "SELECT data FROM documents WHERE table_name = ? AND id = ?", (self.table_name, id)
+        ).fetchone()
+        if not row:
+            return None
+
+        return json.loads(row[0])
+
+    def all(self) -> List[dict]:
+        rows = self._execute("SELECT data FROM documents WHERE table_name = ?", (self.table_name,)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def insert(self, data: BaseModel) -> int:
+        cursor = self._execute(
+            "INSERT INTO documents (table_name, id, data) VALUES (?, ?, ?)",
+            (self.table_name, data.id, json.dumps(to_document(data), default=pydantic_encoder)),
+        )
+        SQLiteDatabase.revision += 1
+        return cursor.lastrowid
+
+    def update(self, id: str, data: BaseModel) -> List[int]:
+        cursor = self._execute(
+            "INSERT INTO documents (table_name, id, data) VALUES (?, ?, ?) "
+            "ON CONFLICT (table_name, id) DO UPDATE SET data = excluded.data",
+            (self.table_name, id, json.dumps(to_document(data), default=pydantic_encoder)),
+        )
+        SQLiteDatabase.revision += 1
+        return [cursor.lastrowid]
+
+    def delete(self, id: str) -> bool:
+        cursor = self._execute("DELETE FROM documents WHERE table_name = ? AND id = ?", (self.table_name, id))
+        SQLiteDatabase.revision += 1
+        if not cursor.rowcount:
+            return False
+        return True
+
+    def drop(self):
+        self._execute("DELETE FROM documents WHERE table_name = ?", (self.table_name,))
+        SQLiteDatabase.revision += 1
+
+    @classmethod
+    @contextmanager
+    def transaction(cls) -> Iterator[None]:
+        # read-modify-write, other processes are locked out
+        connection = cls._connect(settings.CLI_STORAGE_FILE)
+        with cls._lock:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    @classmethod
+    def flush(cls) -> None:
+        # every write is committed right away
+        pass
+
+    @classmethod
+    def reload(cls) -> None:
+        # every read queries the database
+        pass
+
+    @classmethod
+    def storage_revision(cls) -> Tuple[int, int]:
+        # the WAL file is modified by every write of any process
+        mtime = 0
+        for path in [settings.CLI_STORAGE_FILE, f"{settings.CLI_STORAGE_FILE}-wal"]:
+            try:
+                mtime = max(mtime, os.stat(path).st_mtime_ns)
+            except OSError:
+                pass
+
+        return cls.revision, mtime
@@ -1,39 +1,229 @@
-from typing import List
+import atexit
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from threading import RLock
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from pydantic import BaseModel
 from tinydb import Query, TinyDB
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import Storage
+from tinydb.table import Table
 
 from unikube import settings
-from unikube.storage.types import TinyDatabaseData
+from unikube.storage.lock import FileLock
+from unikube.storage.types import TinyDatabaseData, to_document
+
+
+class AtomicJSONStorage(Storage):
+    """
+    JSON storage which never leaves a partially written file: the data is written to a temporary file, synced to
+    disk and renamed to the storage file.
+    """
+
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        self.kwargs = kwargs
+
+    def read(self):
+        try:
+            with open(self.path, "r") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+
+        # empty file, TinyDB initializes the database
+        if not content.strip():
+            return None
+
+        return json.loads(content)
+
+    def write(self, data):
+        fd, path_tmp = tempfile.mkstemp(
+            dir=os.path.dirname(self.path), prefix=f".{os.path.basename(self.path)}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, **self.kwargs)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(path_tmp, self.path)
+        except BaseException:
+            if os.path.exists(path_tmp):
+                os.unlink(path_tmp)
+            raise
+
+    def close(self):
+        pass
+
+
+def lock_file_path(path: str) -> str:
+    return f"{path}.lock"
+
+
+class MergingCachingMiddleware(CachingMiddleware):
+    """
+    Write-back cache which only writes the documents changed by this process. On flush the storage file is read
+    again under a file lock and the changes are merged per (table, id), hence concurrent processes do not overwrite
+    each other's updates.
+    """
+
+    def __init__(self, storage_cls):
+        super().__init__(storage_cls)
+
+        self.changes: Dict[Tuple[str, str], Optional[dict]] = {}
+        self.dropped: Set[str] = set()
+
+    def record(self, table_name: str, id: str, document: Optional[dict]) -> None:
+        # document None: deleted
+        self.changes[(table_name, id)] = document
+
+    def record_drop(self, table_name: str) -> None:
+        self.dropped.add(table_name)
+        self.changes = {key: value for key, value in self.changes.items() if key[0] != table_name}
+
+    def flush(self):
+        if not self._cache_modified_count:
+            return
+
+        with FileLock(lock_file_path(self.storage.path)):
+            data = self.storage.read() or {}
+
+            for table_name in self.dropped:
+                data.pop(table_name, None)
+
+            for (table_name, id), document in self.changes.items():
+                table = data.setdefault(table_name, {})
+                doc_ids = [doc_id for doc_id, item in table.items() if item.get("id", None) == id]
+                for doc_id in doc_ids:
+                    del table[doc_id]
+
+                if document is not None:
+                    doc_id = doc_ids[0] if doc_ids else str(max([int(doc_id) for doc_id in table] or [0]) + 1)
+                    table[doc_id] = document
+
+            self.storage.write(data)
+
+        self.changes = {}
+        self.dropped = set()
+        self._cache_modified_count = 0
 
 
 class TinyDatabase:
+    """
+    All tables share one TinyDB handle per process. It is read once and writes are kept in memory (write-back); they
+    are merged into the storage file at exit or with :meth:`flush`.
+    """
+
+    # writes of this process (the file modification time may be too coarse)
+    revision = 0
+
+    _databases: Dict[str, TinyDB] = {}
+    _lock = RLock()
+
     def __init__(
         self,
         table_name="database",
     ):
         self.table_name = table_name
 
-        self.db = TinyDB(settings.CLI_CONFIG_FILE)
-        self.table = self.db.table(self.table_name)
+    @classmethod
+    def get_db(cls) -> TinyDB:
+        with cls._lock:
+            db = cls._databases.get(settings.CLI_CONFIG_FILE, None)
+            if db is None:
+                db = TinyDB(settings.CLI_CONFIG_FILE, storage=MergingCachingMiddleware(AtomicJSONStorage))
+                cls._databases[settings.CLI_CONFIG_FILE] = db
+
+            return db
+
+    @classmethod
+    def flush(cls) -> None:
+        with cls._lock:
+            for db in cls._databases.values():
+                db.storage.flush()
+
+    @classmethod
+    def reload(cls) -> None:
+        # write pending changes and read the storage file again (e.g. changes of other processes)
+        with cls._lock:
+            for db in cls._databases.values():
+                db.close()
+            cls._databases = {}
+
+    @classmethod
+    @contextmanager
+    def transaction(cls) -> Iterator[None]:
+        """
+        Read-modify-write: reads the current storage file and writes the changes, while other processes are locked
+        out.
+        """
+        with FileLock(lock_file_path(settings.CLI_CONFIG_FILE)):
+            with cls._lock:
+                cls.reload()
+                yield
+                cls.flush()
+
+    @property
+    def db(self) -> TinyDB:
+        return TinyDatabase.get_db()
+
+    @property
+    def table(self) -> Table:
+        return self.db.table(self.table_name)
 
     def select(self, id: str) -> TinyDatabaseData:
-        document = self.table.get(Query().id == id)
+        with TinyDatabase._lock:
+            document = self.table.get(Query().id == id)
         return document
 
+    def all(self) -> List[dict]:
+        with TinyDatabase._lock:
+            return self.table.all()
+
     def insert(self, data: BaseModel) -> int:
-        doc_id = self.table.insert(data.dict())
+        with TinyDatabase._lock:
+            document = to_document(data)
+            doc_id = self.table.insert(document)
+            self.db.storage.record(self.table_name, document["id"], document)
+            TinyDatabase.revision += 1
         return doc_id
 
     def update(self, id: str, data: BaseModel) -> List[int]:
-        doc_id_list = self.table.upsert(data.dict(), Query().id == id)
+        with TinyDatabase._lock:
+            document = to_document(data)
+            doc_id_list = self.table.upsert(document, Query().id == id)
+            self.db.storage.record(self.table_name, id, document)
+            TinyDatabase.revision += 1
         return doc_id_list
 
     def delete(self, id: str) -> bool:
-        doc_id = self.table.remove(Query().id == id)
+        with TinyDatabase._lock:
+            doc_id = self.table.remove(Query().id == id)
+            self.db.storage.record(self.table_name, id, None)
+            TinyDatabase.revision += 1
         if not doc_id:
             return False
         return True
 
     def drop(self):
-        self.db.purge_table(self.table_name)
+        with TinyDatabase._lock:
+            self.db.drop_table(self.table_name)
+            self.db.storage.record_drop(self.table_name)
+            TinyDatabase.revision += 1
+
+    @classmethod
+    def storage_revision(cls) -> Tuple[int, int]:
+        # changes whenever the storage is written, by this or by another process
+        try:
+            mtime = os.stat(settings.CLI_CONFIG_FILE).st_mtime_ns
+        except OSError:
+            mtime = 0
+
+        return cls.revision, mtime
+
+
+# pending writes
+atexit.register(TinyDatabase.flush)
@@ -1,4 +1,11 @@
+import hashlib
+import json
+from functools import lru_cache
+from time import time
+from typing import Any, List, Optional, Type, TypeVar
+
 from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
 
 from unikube.authentication.types import AuthenticationData
 from unikube.context.types import ContextData
@@ -9,6 +16,51 @@ class TinyDatabaseData(BaseModel):
     id: str
 
 
+# documents are stored with the fingerprint of the schema they were written with
+SCHEMA_KEY = "_schema"
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(model_class: Type[BaseModel]) -> str:
+    schema = json.dumps(model_class.schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+
+
+def _construct(model_class: Type[Model], values: dict) -> Model:
+    # model from trusted data (no validation), nested models are constructed as well
+    fields = {}
+    for name, field in model_class.__fields__.items():
+        if name not in values:
+            continue
+
+        value = values[name]
+        if isinstance(field.type_, type) and issubclass(field.type_, BaseModel):
+            if field.shape == SHAPE_SINGLETON and isinstance(value, dict):
+                value = _construct(field.type_, value)
+            elif field.shape == SHAPE_LIST and isinstance(value, list):
+                value = [_construct(field.type_, item) if isinstance(item, dict) else item for item in value]
+        fields[name] = value
+
+    return model_class.construct(**fields)
+
+
+def to_document(data: BaseModel) -> dict:
+    return {**data.dict(), SCHEMA_KEY: schema_fingerprint(type(data))}
+
+
+def from_document(model_class: Type[Model], document: dict) -> Model:
+    """
+    Documents written with the current schema are trusted and constructed without validation. Documents of another
+    schema version (e.g. written by an older version of the CLI) are validated.
+    """
+    if document.get(SCHEMA_KEY, None) == schema_fingerprint(model_class):
+        return _construct(model_class, document)
+
+    return model_class(**document)
+
+
 class GeneralData(TinyDatabaseData):
     id: str = "general"
     authentication: AuthenticationData = AuthenticationData()
@@ -17,3 +69,31 @@ class GeneralData(TinyDatabaseData):
 class UserData(TinyDatabaseData):
     context: ContextData = ContextData()
     config: ConfigurationData = ConfigurationData()
+
+
+class CacheData(TinyDatabaseData):
+    data: Any = None
+    timestamp: float = 0.0
+
+    @property
+    def age(self) -> float:
+        # entries which have never been written are infinitely old
+        if not self.timestamp:
+            return float("inf")
+
+        return time() - self.timestamp
+
+
+class ResolutionIndexItem(BaseModel):
+    id: str
+    title: str
+    slug: str
+    organization_id: Optional[str] = None
+    project_id: Optional[str] = None
+    timestamp: float = 0.0
+
+
+class ResolutionIndexData(TinyDatabaseData):
+    organization: List[ResolutionIndexItem] = []
+    project: List[ResolutionIndexItem] = []
+    deck: List[ResolutionIndexItem] = []
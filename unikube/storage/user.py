@@ -14,8 +14,7 @@ class LocalStorageUser(LocalStorage):
 
     def get(self) -> UserData:
         try:
-            data = super().get(id=self.user_email)
-            return self.pydantic_class(**data.dict())
+            return super().get(id=self.user_email)
         except Exception:
             return UserData()
 